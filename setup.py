@@ -78,6 +78,10 @@ def install_thorvg(arch: str) -> Dict[Any, Any]:
     options.append("thorvg/*:with_savers=all")
     options.append("thorvg/*:with_loaders=all")
     options.append("thorvg/*:with_bindings=capi")
+    # ThorVG selects its SIMD raster paths at compile time (AVX on x86), so the
+    # resulting library would not run on CPUs without them. Opt-in only.
+    if os.getenv("TVGPY_SIMD", "") == "1":
+        options.append("thorvg/*:with_simd=True")
 
     print("conan cli settings:")
     print("settings: " + str(settings))
@@ -6,25 +6,28 @@ __version__ = "1.1.3"
 from .accessor import Accessor  # type: ignore  # noqa: F401
 from .animation import Animation  # type: ignore  # noqa: F401
 from .animation.lottie import LottieAnimation  # type: ignore  # noqa: F401
-from .base import BlendMethod  # type: ignore  # noqa: F401
-from .base import Colorspace  # type: ignore  # noqa: F401
-from .base import ColorStop  # type: ignore  # noqa: F401
-from .base import EngineOption  # type: ignore  # noqa: F401
-from .base import FillRule  # type: ignore  # noqa: F401
-from .base import FilterMethod  # type: ignore  # noqa: F401
-from .base import GlyphMetrics  # type: ignore  # noqa: F401
-from .base import MaskMethod  # type: ignore  # noqa: F401
-from .base import Matrix  # type: ignore  # noqa: F401
-from .base import PathCommand  # type: ignore  # noqa: F401
-from .base import PictureAssetResolverType  # type: ignore  # noqa: F401
-from .base import PointStruct  # type: ignore  # noqa: F401
-from .base import Result  # type: ignore  # noqa: F401
-from .base import StrokeCap  # type: ignore  # noqa: F401
-from .base import StrokeFill  # type: ignore  # noqa: F401
-from .base import StrokeJoin  # type: ignore  # noqa: F401
-from .base import TextMetrics  # type: ignore  # noqa: F401
-from .base import TextWrap  # type: ignore  # noqa: F401
-from .base import TvgType  # type: ignore  # noqa: F401
+from .base import (
+    BlendMethod,  # type: ignore  # noqa: F401
+    Colorspace,  # type: ignore  # noqa: F401
+    ColorStop,  # type: ignore  # noqa: F401
+    EngineOption,  # type: ignore  # noqa: F401
+    FillRule,  # type: ignore  # noqa: F401
+    FilterMethod,  # type: ignore  # noqa: F401
+    GlyphMetrics,  # type: ignore  # noqa: F401
+    MaskMethod,  # type: ignore  # noqa: F401
+    Matrix,  # type: ignore  # noqa: F401
+    PathCommand,  # type: ignore  # noqa: F401
+    PictureAssetResolverType,  # type: ignore  # noqa: F401
+    PointStruct,  # type: ignore  # noqa: F401
+    Result,  # type: ignore  # noqa: F401
+    SceneEffect,  # type: ignore  # noqa: F401
+    StrokeCap,  # type: ignore  # noqa: F401
+    StrokeFill,  # type: ignore  # noqa: F401
+    StrokeJoin,  # type: ignore  # noqa: F401
+    TextMetrics,  # type: ignore  # noqa: F401
+    TextWrap,  # type: ignore  # noqa: F401
+    TvgType,  # type: ignore  # noqa: F401
+)
 from .canvas import Canvas  # type: ignore  # noqa: F401
 from .canvas.sw import SwCanvas  # type: ignore  # noqa: F401
 from .engine import Engine  # type: ignore  # noqa: F401
@@ -34,6 +37,12 @@ from .gradient.radial import RadialGradient  # type: ignore  # noqa: F401
 from .paint import Paint  # type: ignore  # noqa: F401
 from .paint.picture import Picture  # type: ignore  # noqa: F401
 from .paint.scene import Scene  # type: ignore  # noqa: F401
-from .paint.shape import Shape  # type: ignore  # noqa: F401
+from .paint.shape import (
+    PathBuilder,  # type: ignore  # noqa: F401
+    Shape,  # type: ignore  # noqa: F401
+)
 from .paint.text import Text  # type: ignore  # noqa: F401
-from .saver import Saver  # type: ignore  # noqa: F401
+from .saver import (
+    Saver,  # type: ignore  # noqa: F401
+    SaverPool,  # type: ignore  # noqa: F401
+)
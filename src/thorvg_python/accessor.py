@@ -3,9 +3,24 @@ import ctypes
 from typing import Callable, Optional
 
 from .base import AccessorPointer, PaintPointer, Result
-from .engine import Engine
+from .engine import Engine, register_signatures
 from .paint import Paint
 
+_FUNC_TYPE = ctypes.CFUNCTYPE(ctypes.c_bool, PaintPointer, ctypes.c_void_p)
+
+register_signatures(
+    {
+        "tvg_accessor_new": (AccessorPointer, ()),
+        "tvg_accessor_del": (Result, (AccessorPointer,)),
+        "tvg_accessor_set": (
+            Result,
+            (AccessorPointer, PaintPointer, _FUNC_TYPE, ctypes.c_void_p),
+        ),
+        "tvg_accessor_generate_id": (ctypes.c_uint32, (ctypes.c_char_p,)),
+        "tvg_accessor_get_name": (ctypes.c_char_p, (AccessorPointer, ctypes.c_uint32)),
+    }
+)
+
 
 class Accessor:
     """
@@ -34,7 +49,6 @@ class Accessor:
 
         ..versionadded: 1.0
         """
-        self.thorvg_lib.tvg_accessor_new.restype = AccessorPointer
         return self.thorvg_lib.tvg_accessor_new()
 
     def _del(self) -> Result:
@@ -45,8 +59,6 @@ class Accessor:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_accessor_del.argtypes = [AccessorPointer]
-        self.thorvg_lib.tvg_accessor_del.restype = Result
         return self.thorvg_lib.tvg_accessor_del(self._accessor)
 
     def set(
@@ -70,23 +82,13 @@ class Accessor:
 
         .. versionadded:: 1.0
         """
-        func_type = ctypes.CFUNCTYPE(ctypes.c_bool, PaintPointer, ctypes.c_void_p)
-
-        data_arr_type = ctypes.c_ubyte * len(data)
-        data_arr = data_arr_type.from_buffer_copy(data)
-
-        self.thorvg_lib.tvg_accessor_set.argtypes = [
-            AccessorPointer,
-            PaintPointer,
-            func_type,
-            data_arr_type,
-        ]
-        self.thorvg_lib.tvg_accessor_set.restype = Result
+        # The callbacks run before tvg_accessor_set() returns, so neither the
+        # function pointer nor data needs to outlive this call
         return self.thorvg_lib.tvg_accessor_set(
             self._accessor,
             paint._paint,  # type: ignore
-            func_type(func),
-            data_arr,
+            _FUNC_TYPE(func),
+            data,
         )
 
     def accessor_generate_id(
@@ -105,14 +107,7 @@ class Accessor:
 
         .. versionadded: 1.0
         """
-        name_bytes = name.encode() + b"\x00"
-        name_char_type = ctypes.c_char * len(name_bytes)
-        name_char = name_char_type.from_buffer_copy(name_bytes)
-        self.thorvg_lib.tvg_accessor_generate_id.argtypes = [
-            ctypes.POINTER(name_char_type)
-        ]
-        self.thorvg_lib.tvg_accessor_generate_id.restype = ctypes.c_uint32
-        return self.thorvg_lib.tvg_accessor_generate_id(ctypes.pointer(name_char))
+        return self.thorvg_lib.tvg_accessor_generate_id(name.encode())
 
     def accessor_get_name(
         self,
@@ -138,13 +133,7 @@ class Accessor:
         .. note ::
             Experimental API
         """
-        self.thorvg_lib.tvg_accessor_get_name.argtypes = [
-            AccessorPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_accessor_get_name.restype = ctypes.c_char_p
-
         return self.thorvg_lib.tvg_accessor_get_name(
             self._accessor,
-            ctypes.c_uint32(_id),
+            _id,
         ).decode("utf-8")
@@ -3,9 +3,42 @@ import ctypes
 from typing import Optional, Tuple
 
 from ..base import AnimationPointer, PaintPointer, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from ..paint.picture import Picture
 
+register_signatures(
+    {
+        "tvg_animation_new": (AnimationPointer, ()),
+        "tvg_animation_set_frame": (Result, (AnimationPointer, ctypes.c_float)),
+        "tvg_animation_get_picture": (PaintPointer, (AnimationPointer,)),
+        "tvg_animation_get_frame": (
+            Result,
+            (AnimationPointer, ctypes.POINTER(ctypes.c_float)),
+        ),
+        "tvg_animation_get_total_frame": (
+            Result,
+            (AnimationPointer, ctypes.POINTER(ctypes.c_float)),
+        ),
+        "tvg_animation_get_duration": (
+            Result,
+            (AnimationPointer, ctypes.POINTER(ctypes.c_float)),
+        ),
+        "tvg_animation_set_segment": (
+            Result,
+            (AnimationPointer, ctypes.c_float, ctypes.c_float),
+        ),
+        "tvg_animation_get_segment": (
+            Result,
+            (
+                AnimationPointer,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+            ),
+        ),
+        "tvg_animation_del": (Result, (AnimationPointer,)),
+    }
+)
+
 
 class Animation:
     """
@@ -35,7 +68,6 @@ class Animation:
 
         .. versionadded:: 0.13
         """
-        self.thorvg_lib.tvg_animation_new.restype = AnimationPointer
         return self.thorvg_lib.tvg_animation_new()
 
     def set_frame(
@@ -61,11 +93,6 @@ class Animation:
 
         .. versionadded:: 0.13
         """
-        self.thorvg_lib.tvg_animation_set_frame.argtypes = [
-            AnimationPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_animation_set_frame.restype = Result
         return self.thorvg_lib.tvg_animation_set_frame(
             self._animation,
             ctypes.c_float(no),
@@ -86,10 +113,6 @@ class Animation:
 
         .. versionadded:: 0.13
         """
-        self.thorvg_lib.tvg_animation_get_picture.argtypes = [
-            AnimationPointer,
-        ]
-        self.thorvg_lib.tvg_animation_get_picture.restype = PaintPointer
         return Picture(
             self.engine,
             self.thorvg_lib.tvg_animation_get_picture(
@@ -111,14 +134,9 @@ class Animation:
         .. versionadded:: 0.13
         """
         no = ctypes.c_float()
-        self.thorvg_lib.tvg_animation_get_frame.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_animation_get_frame.restype = Result
         result = self.thorvg_lib.tvg_animation_get_frame(
             self._animation,
-            ctypes.pointer(no),
+            ctypes.byref(no),
         )
         return result, no.value
 
@@ -138,14 +156,9 @@ class Animation:
         .. versionadded:: 0.13
         """
         cnt = ctypes.c_float()
-        self.thorvg_lib.tvg_animation_get_total_frame.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_animation_get_total_frame.restype = Result
         result = self.thorvg_lib.tvg_animation_get_total_frame(
             self._animation,
-            ctypes.pointer(cnt),
+            ctypes.byref(cnt),
         )
         return result, cnt.value
 
@@ -163,14 +176,9 @@ class Animation:
         .. versionadded:: 0.13
         """
         duration = ctypes.c_float()
-        self.thorvg_lib.tvg_animation_get_duration.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_animation_get_duration.restype = Result
         result = self.thorvg_lib.tvg_animation_get_duration(
             self._animation,
-            ctypes.pointer(duration),
+            ctypes.byref(duration),
         )
         return result, duration.value
 
@@ -203,12 +211,6 @@ class Animation:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_animation_set_segment.argtypes = [
-            AnimationPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_animation_set_segment.restype = Result
         result = self.thorvg_lib.tvg_animation_set_segment(
             self._animation,
             ctypes.c_float(begin),
@@ -232,16 +234,10 @@ class Animation:
         """
         begin = ctypes.c_float()
         end = ctypes.c_float()
-        self.thorvg_lib.tvg_animation_get_segment.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_animation_get_segment.restype = Result
         result = self.thorvg_lib.tvg_animation_get_segment(
             self._animation,
-            ctypes.pointer(begin),
-            ctypes.pointer(end),
+            ctypes.byref(begin),
+            ctypes.byref(end),
         )
         return result, begin.value, end.value
 
@@ -253,10 +249,6 @@ class Animation:
 
         .. versionadded:: 0.13
         """
-        self.thorvg_lib.tvg_animation_del.argtypes = [
-            AnimationPointer,
-        ]
-        self.thorvg_lib.tvg_animation_del.restype = Result
         return self.thorvg_lib.tvg_animation_del(
             self._animation,
         )
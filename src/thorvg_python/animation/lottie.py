@@ -3,9 +3,64 @@ import ctypes
 from typing import Optional, Tuple
 
 from ..base import AnimationPointer, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from . import Animation
 
+register_signatures(
+    {
+        "tvg_lottie_animation_new": (AnimationPointer, ()),
+        "tvg_lottie_animation_gen_slot": (
+            ctypes.c_uint32,
+            (AnimationPointer, ctypes.c_char_p),
+        ),
+        "tvg_lottie_animation_apply_slot": (
+            Result,
+            (AnimationPointer, ctypes.c_uint32),
+        ),
+        "tvg_lottie_animation_del_slot": (Result, (AnimationPointer, ctypes.c_uint32)),
+        "tvg_lottie_animation_set_marker": (
+            Result,
+            (AnimationPointer, ctypes.c_char_p),
+        ),
+        "tvg_lottie_animation_get_markers_cnt": (
+            Result,
+            (AnimationPointer, ctypes.POINTER(ctypes.c_uint32)),
+        ),
+        "tvg_lottie_animation_get_marker": (
+            Result,
+            (AnimationPointer, ctypes.c_uint32, ctypes.POINTER(ctypes.c_char_p)),
+        ),
+        "tvg_lottie_animation_get_marker_info": (
+            Result,
+            (
+                AnimationPointer,
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.c_char_p),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+            ),
+        ),
+        "tvg_lottie_animation_tween": (
+            Result,
+            (AnimationPointer, ctypes.c_float, ctypes.c_float, ctypes.c_float),
+        ),
+        "tvg_lottie_animation_assign": (
+            Result,
+            (
+                AnimationPointer,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+                ctypes.c_char_p,
+                ctypes.c_float,
+            ),
+        ),
+        "tvg_lottie_animation_set_quality": (
+            Result,
+            (AnimationPointer, ctypes.c_uint8),
+        ),
+    }
+)
+
 
 class LottieAnimation(Animation):
     """
@@ -32,7 +87,6 @@ class LottieAnimation(Animation):
 
         .. versionadded:: 0.15
         """
-        self.thorvg_lib.tvg_lottie_animation_new.restype = AnimationPointer
         return self.thorvg_lib.tvg_lottie_animation_new()
 
     def gen_slot(
@@ -48,17 +102,9 @@ class LottieAnimation(Animation):
 
         .. versionadded:: 1.0
         """
-        slot_bytes = slot.encode() + b"\x00"
-        slot_arr_type = ctypes.c_char * len(slot_bytes)
-
-        self.thorvg_lib.tvg_lottie_animation_gen_slot.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(slot_arr_type),
-        ]
-        self.thorvg_lib.tvg_lottie_animation_gen_slot.restype = ctypes.c_uint32
         return self.thorvg_lib.tvg_lottie_animation_gen_slot(
             self._animation,
-            ctypes.pointer(slot_arr_type.from_buffer_copy(slot_bytes)),
+            slot.encode(),
         )
 
     def apply_slot(
@@ -77,11 +123,6 @@ class LottieAnimation(Animation):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_lottie_animation_apply_slot.argtypes = [
-            AnimationPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_lottie_animation_apply_slot.restype = Result
         return self.thorvg_lib.tvg_lottie_animation_apply_slot(
             self._animation,
             ctypes.c_uint32(_id),
@@ -105,11 +146,6 @@ class LottieAnimation(Animation):
         .. seealso:: LottieAnimation.gen_slot()
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_lottie_animation_del_slot.argtypes = [
-            AnimationPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_lottie_animation_del_slot.restype = Result
         return self.thorvg_lib.tvg_lottie_animation_del_slot(
             self._animation,
             ctypes.c_uint32(_id),
@@ -132,17 +168,9 @@ class LottieAnimation(Animation):
         .. note::
             Experimental API
         """
-        marker_bytes = marker.encode() + b"\x00"
-        marker_arr_type = ctypes.c_char * len(marker_bytes)
-        marker_arr = marker_arr_type.from_buffer_copy(marker_bytes)
-        self.thorvg_lib.tvg_lottie_animation_set_marker.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(marker_arr_type),
-        ]
-        self.thorvg_lib.tvg_lottie_animation_set_marker.restype = Result
         return self.thorvg_lib.tvg_lottie_animation_set_marker(
             self._animation,
-            ctypes.pointer(marker_arr),
+            marker.encode(),
         )
 
     def get_markers_cnt(
@@ -159,14 +187,9 @@ class LottieAnimation(Animation):
             Experimental API
         """
         cnt = ctypes.c_uint32()
-        self.thorvg_lib.tvg_lottie_animation_get_markers_cnt.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_lottie_animation_get_markers_cnt.restype = Result
         result = self.thorvg_lib.tvg_lottie_animation_get_markers_cnt(
             self._animation,
-            ctypes.pointer(cnt),
+            ctypes.byref(cnt),
         )
         return result, cnt.value
 
@@ -187,16 +210,10 @@ class LottieAnimation(Animation):
             Experimental API
         """
         name = ctypes.c_char_p()
-        self.thorvg_lib.tvg_lottie_animation_get_marker.argtypes = [
-            AnimationPointer,
-            ctypes.c_uint32,
-            ctypes.POINTER(ctypes.c_char_p),
-        ]
-        self.thorvg_lib.tvg_lottie_animation_get_marker.restype = Result
         result = self.thorvg_lib.tvg_lottie_animation_get_marker(
             self._animation,
             ctypes.c_uint32(idx),
-            ctypes.pointer(name),
+            ctypes.byref(name),
         )
         if name.value is not None:
             _name = name.value.decode("utf-8")
@@ -227,20 +244,12 @@ class LottieAnimation(Animation):
         name = ctypes.c_char_p()
         begin = ctypes.c_float()
         end = ctypes.c_float()
-        self.thorvg_lib.tvg_lottie_animation_get_marker_info.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-            ctypes.POINTER(ctypes.c_char_p),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_lottie_animation_get_marker_info.restype = Result
         result = self.thorvg_lib.tvg_lottie_animation_get_marker_info(
             self._animation,
             ctypes.c_uint32(idx),
-            ctypes.pointer(name),
-            ctypes.pointer(begin),
-            ctypes.pointer(end),
+            ctypes.byref(name),
+            ctypes.byref(begin),
+            ctypes.byref(end),
         )
         if name.value is not None:
             _name = name.value.decode("utf-8")
@@ -263,13 +272,6 @@ class LottieAnimation(Animation):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_lottie_animation_tween.argtypes = [
-            AnimationPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_lottie_animation_tween.restype = Result
         return self.thorvg_lib.tvg_lottie_animation_tween(
             self._animation,
             ctypes.c_float(_from),
@@ -294,27 +296,11 @@ class LottieAnimation(Animation):
         .. note::
             Experimental API
         """
-        layer_bytes = layer.encode() + b"\x00"
-        layer_arr_type = ctypes.c_char * len(layer_bytes)
-        layer_arr = layer_arr_type.from_buffer_copy(layer_bytes)
-
-        var_bytes = layer.encode() + b"\x00"
-        var_arr_type = ctypes.c_char * len(var_bytes)
-        var_arr = var_arr_type.from_buffer_copy(var_bytes)
-
-        self.thorvg_lib.tvg_lottie_animation_assign.argtypes = [
-            AnimationPointer,
-            ctypes.POINTER(layer_arr_type),
-            ctypes.c_uint32,
-            ctypes.POINTER(var_arr_type),
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_lottie_animation_assign.restype = Result
         return self.thorvg_lib.tvg_lottie_animation_assign(
             self._animation,
-            ctypes.pointer(layer_arr),
+            layer.encode(),
             ctypes.c_uint32(ix),
-            ctypes.pointer(var_arr),
+            var.encode(),
             ctypes.c_float(val),
         )
 
@@ -337,11 +323,6 @@ class LottieAnimation(Animation):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_lottie_animation_set_quality.argtypes = [
-            AnimationPointer,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_lottie_animation_set_quality.restype = Result
         return self.thorvg_lib.tvg_lottie_animation_set_quality(
             self._animation,
             ctypes.c_uint8(value),
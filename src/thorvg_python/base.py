@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import ctypes
 from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 
 class CanvasPointer(ctypes.c_void_p):
@@ -410,6 +414,28 @@ class FilterMethod(IntEnum):
     NEAREST = 1
 
 
+class SceneEffect(IntEnum):
+    """Enumeration of the post-processing effects that can be applied to a scene.
+
+    Used with ``Scene.add_effects()`` to describe several effects at once.
+    """
+
+    #: Gaussian blur, see ``Scene.add_effect_gaussian_blur()``.
+    GAUSSIAN_BLUR = 1
+
+    #: Drop shadow, see ``Scene.add_effect_drop_shadow()``.
+    DROP_SHADOW = 2
+
+    #: Fill color override, see ``Scene.add_effect_fill()``.
+    FILL = 3
+
+    #: Tint, see ``Scene.add_effect_tint()``.
+    TINT = 4
+
+    #: Tritone, see ``Scene.add_effect_effect_tritone()``.
+    TRITONE = 5
+
+
 class ColorStop(ctypes.Structure):
     """A data structure storing the information about the color and its relative position inside the gradient bounds."""
 
@@ -485,6 +511,19 @@ class Matrix(ctypes.Structure):
         ("e33", ctypes.c_float),
     ]
 
+    def as_array(self) -> "NDArray[Any]":
+        """Gets the matrix as a ``(3, 3)`` numpy array of ``numpy.float32``.
+
+        The array is a view of the matrix, so no data is copied and writing to the array
+        modifies the matrix. Use ``.copy()`` to get an independent array.
+
+        :return: The matrix elements, with ``e11`` at ``[0, 0]`` and ``e33`` at ``[2, 2]``.
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+
+        return np.frombuffer(memoryview(self), dtype=np.float32).reshape(3, 3)
+
 
 class TextMetrics(ctypes.Structure):
     """Describes the font metrics of a text object.
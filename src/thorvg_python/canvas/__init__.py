@@ -3,9 +3,31 @@ import ctypes
 from typing import Optional
 
 from ..base import CanvasPointer, PaintPointer, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from ..paint import Paint
 
+register_signatures(
+    {
+        "tvg_canvas_destroy": (Result, (CanvasPointer,)),
+        "tvg_canvas_add": (Result, (CanvasPointer, PaintPointer)),
+        "tvg_canvas_insert": (Result, (CanvasPointer, PaintPointer, PaintPointer)),
+        "tvg_canvas_remove": (Result, (CanvasPointer, PaintPointer)),
+        "tvg_canvas_update": (Result, (CanvasPointer,)),
+        "tvg_canvas_draw": (Result, (CanvasPointer, ctypes.c_bool)),
+        "tvg_canvas_sync": (Result, (CanvasPointer,)),
+        "tvg_canvas_set_viewport": (
+            Result,
+            (
+                CanvasPointer,
+                ctypes.c_int32,
+                ctypes.c_int32,
+                ctypes.c_int32,
+                ctypes.c_int32,
+            ),
+        ),
+    }
+)
+
 
 class Canvas:
     """
@@ -33,8 +55,6 @@ class Canvas:
 
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_canvas_destroy.argtypes = [CanvasPointer]
-        self.thorvg_lib.tvg_canvas_destroy.restype = Result
         return self.thorvg_lib.tvg_canvas_destroy(self._canvas)
 
     def add(
@@ -64,11 +84,6 @@ class Canvas:
 
         .. seealso:: Canvas.remove()
         """
-        self.thorvg_lib.tvg_canvas_add.argtypes = [
-            CanvasPointer,
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_canvas_add.restype = Result
         return self.thorvg_lib.tvg_canvas_add(
             self._canvas,
             paint._paint,  # type: ignore
@@ -107,23 +122,10 @@ class Canvas:
 
         .. seealso:: Canvas.remove()
         """
-        if at is None:
-            at_type = ctypes.c_void_p
-            at_c = ctypes.c_void_p()
-        else:
-            at_type = PaintPointer
-            at_c = at._paint  # type: ignore
-
-        self.thorvg_lib.tvg_canvas_insert.argtypes = [
-            CanvasPointer,
-            PaintPointer,
-            at_type,
-        ]
-        self.thorvg_lib.tvg_canvas_insert.restype = Result
         return self.thorvg_lib.tvg_canvas_insert(
             self._canvas,
             target._paint,  # type: ignore
-            at_c,
+            None if at is None else at._paint,  # type: ignore
         )
 
     def remove(
@@ -148,20 +150,9 @@ class Canvas:
 
         .. versionadded:: 1.0
         """
-        if paint is None:
-            paint_type = ctypes.c_void_p
-            paint_ptr = ctypes.c_void_p()
-        else:
-            paint_type = PaintPointer
-            paint_ptr = paint._paint  # type: ignore
-        self.thorvg_lib.tvg_canvas_remove.argtypes = [
-            CanvasPointer,
-            paint_type,
-        ]
-        self.thorvg_lib.tvg_canvas_remove.restype = Result
         return self.thorvg_lib.tvg_canvas_remove(
             self._canvas,
-            paint_ptr,
+            None if paint is None else paint._paint,  # type: ignore
         )
 
     def update(self) -> Result:
@@ -185,10 +176,6 @@ class Canvas:
 
         .. seealso:: Canvas.sync()
         """
-        self.thorvg_lib.tvg_canvas_update.argtypes = [
-            CanvasPointer,
-        ]
-        self.thorvg_lib.tvg_canvas_update.restype = Result
         return self.thorvg_lib.tvg_canvas_update(
             self._canvas,
         )
@@ -217,11 +204,6 @@ class Canvas:
         .. seealso:: Canvas.sync()
         .. seealso:: Canvas.update()
         """
-        self.thorvg_lib.tvg_canvas_draw.argtypes = [
-            CanvasPointer,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_canvas_draw.restype = Result
         return self.thorvg_lib.tvg_canvas_draw(self._canvas, ctypes.c_bool(clear))
 
     def sync(self) -> Result:
@@ -235,10 +217,6 @@ class Canvas:
 
         .. seealso:: Canvas.draw()
         """
-        self.thorvg_lib.tvg_canvas_sync.argtypes = [
-            CanvasPointer,
-        ]
-        self.thorvg_lib.tvg_canvas_sync.restype = Result
         return self.thorvg_lib.tvg_canvas_sync(
             self._canvas,
         )
@@ -281,14 +259,6 @@ class Canvas:
 
         .. versionadded:: 0.15
         """
-        self.thorvg_lib.tvg_canvas_set_viewport.argtypes = [
-            CanvasPointer,
-            ctypes.c_int32,
-            ctypes.c_int32,
-            ctypes.c_int32,
-            ctypes.c_int32,
-        ]
-        self.thorvg_lib.tvg_canvas_set_viewport.restype = Result
         return self.thorvg_lib.tvg_canvas_set_viewport(
             self._canvas,
             ctypes.c_int32(x),
@@ -3,9 +3,28 @@ import ctypes
 from typing import Any, Optional, Tuple
 
 from ..base import CanvasPointer, Colorspace, EngineOption, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from . import Canvas
 
+register_signatures(
+    {
+        "tvg_glcanvas_create": (CanvasPointer, (ctypes.c_uint8,)),
+        "tvg_glcanvas_set_target": (
+            Result,
+            (
+                CanvasPointer,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+                ctypes.c_uint8,
+            ),
+        ),
+    }
+)
+
 
 class GlCanvas(Canvas):
     """
@@ -50,8 +69,6 @@ class GlCanvas(Canvas):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_glcanvas_create.argtypes = [ctypes.c_uint8]
-        self.thorvg_lib.tvg_glcanvas_create.restype = CanvasPointer
         return self.thorvg_lib.tvg_glcanvas_create(op)
 
     def set_target(
@@ -91,17 +108,6 @@ class GlCanvas(Canvas):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_glcanvas_set_target.argtypes = [
-            CanvasPointer,
-            ctypes.c_void_p,
-            ctypes.c_void_p,
-            ctypes.c_void_p,
-            ctypes.c_uint32,
-            ctypes.c_uint32,
-            ctypes.c_uint32,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_glcanvas_set_target.restype = Result
         result = self.thorvg_lib.tvg_glcanvas_set_target(
             self._canvas,
             display,
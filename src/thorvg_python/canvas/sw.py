@@ -1,14 +1,32 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from ..base import CanvasPointer, Colorspace, EngineOption, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from . import Canvas
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
     from PIL import Image
 
+register_signatures(
+    {
+        "tvg_swcanvas_create": (CanvasPointer, (ctypes.c_uint8,)),
+        "tvg_swcanvas_set_target": (
+            Result,
+            (
+                CanvasPointer,
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+                ctypes.c_uint8,
+            ),
+        ),
+    }
+)
+
 
 class SwCanvas(Canvas):
     """
@@ -51,8 +69,6 @@ class SwCanvas(Canvas):
 
         .. seealso:: EngineOption
         """
-        self.thorvg_lib.tvg_swcanvas_create.argtypes = [ctypes.c_uint8]
-        self.thorvg_lib.tvg_swcanvas_create.restype = CanvasPointer
         return self.thorvg_lib.tvg_swcanvas_create(op)
 
     def set_target(
@@ -89,20 +105,10 @@ class SwCanvas(Canvas):
         """
         if stride is None:
             stride = w
-        buffer_arr_type = ctypes.c_uint32 * (stride * h)
-        buffer_arr = buffer_arr_type()
-        self.thorvg_lib.tvg_swcanvas_set_target.argtypes = [
-            CanvasPointer,
-            ctypes.POINTER(buffer_arr_type),
-            ctypes.c_uint32,
-            ctypes.c_uint32,
-            ctypes.c_uint32,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_swcanvas_set_target.restype = Result
+        buffer_arr = (ctypes.c_uint32 * (stride * h))()
         result = self.thorvg_lib.tvg_swcanvas_set_target(
             self._canvas,
-            ctypes.pointer(buffer_arr),
+            buffer_arr,
             ctypes.c_uint32(stride),
             ctypes.c_uint32(w),
             ctypes.c_uint32(h),
@@ -135,3 +141,34 @@ class SwCanvas(Canvas):
         return Image.frombuffer(  # type: ignore
             "RGBA", (self.w, self.h), bytes(self.buffer_arr), "raw"
         ).convert(pil_mode)
+
+    def get_numpy(self) -> "NDArray[Any]":
+        """Gets the buffer of canvas as a numpy array
+
+        Unlike SwCanvas.get_pillow(), no copy is made: the array is a view of the
+        buffer set by SwCanvas.set_target(), with shape ``(h, w, 4)`` and dtype ``numpy.uint8``.
+        Rows are ``stride`` pixels apart, so the view is not contiguous if ``stride`` is larger than ``w``.
+
+        The order of the 4 channels follows the colorspace, e.g. ``Colorspace.ABGR8888``
+        gives RGBA on little-endian machines, as assumed by SwCanvas.get_pillow().
+
+        :return: Buffer of canvas
+        :rtype: numpy.ndarray
+
+        .. warning::
+            Do not access the array during Canvas_draw() - Canvas_sync().
+            It keeps the buffer alive, but stops reflecting the canvas once SwCanvas.set_target() is called again.
+        """
+        import numpy as np
+
+        if self.w is None:
+            raise RuntimeError("w cannot be None")
+        if self.h is None:
+            raise RuntimeError("h cannot be None")
+        if self.stride is None:
+            raise RuntimeError("stride cannot be None")
+        if self.buffer_arr is None:
+            raise RuntimeError("buffer_arr cannot be None")
+
+        arr = np.frombuffer(memoryview(self.buffer_arr), dtype=np.uint8)
+        return arr.reshape(self.h, self.stride, 4)[:, : self.w]
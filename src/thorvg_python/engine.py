@@ -3,8 +3,11 @@ import ctypes
 import os
 import sys
 import sysconfig
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
-from typing import List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
+from weakref import WeakSet
 
 from .base import Result
 
@@ -69,6 +72,80 @@ def _load_lib(thorvg_lib_path: Optional[str] = None) -> Optional[ctypes.CDLL]:
 
 THORVG_LIB = _load_lib()
 
+#: C function signatures registered by the wrapper modules,
+#: as ``{symbol: (restype, argtypes)}``.
+_SIGNATURES: Dict[str, Tuple[Any, Tuple[Any, ...]]] = {}
+
+#: Libraries that already have ``_SIGNATURES`` applied.
+_BOUND_LIBS: "WeakSet[ctypes.CDLL]" = WeakSet()
+
+
+#: Result members by value. Used as restype in place of the Result class, as a
+#: dict lookup is much cheaper than calling the IntEnum on every return.
+_RESULTS: Dict[int, Result] = {int(r): r for r in Result}
+
+
+def _apply_signatures(
+    thorvg_lib: ctypes.CDLL, signatures: Dict[str, Tuple[Any, Tuple[Any, ...]]]
+) -> None:
+    for name, (restype, argtypes) in signatures.items():
+        try:
+            func = getattr(thorvg_lib, name)
+        except AttributeError:
+            # Symbol not exported by this build of thorvg
+            continue
+        func.restype = _RESULTS.__getitem__ if restype is Result else restype
+        func.argtypes = argtypes
+
+
+def register_signatures(signatures: Dict[str, Tuple[Any, Tuple[Any, ...]]]) -> None:
+    """Registers the ``restype`` and ``argtypes`` of thorvg C functions.
+
+    The signatures are set once on every loaded thorvg library instead of on every
+    call, so wrapper methods can call the C function directly.
+
+    :param signatures: A mapping of symbol name to ``(restype, argtypes)``.
+    """
+    _SIGNATURES.update(signatures)
+    for thorvg_lib in _BOUND_LIBS:
+        _apply_signatures(thorvg_lib, signatures)
+
+
+register_signatures(
+    {
+        "tvg_engine_init": (Result, (ctypes.c_uint32,)),
+        "tvg_engine_term": (Result, ()),
+        "tvg_engine_version": (
+            Result,
+            (
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.c_char_p),
+            ),
+        ),
+    }
+)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool shared by the ``*_async()`` helpers, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="thorvg")
+        return _executor
+
+
+def _bind_lib(thorvg_lib: ctypes.CDLL) -> None:
+    if thorvg_lib not in _BOUND_LIBS:
+        _apply_signatures(thorvg_lib, _SIGNATURES)
+        _BOUND_LIBS.add(thorvg_lib)
+
 
 class Engine:
     """
@@ -92,6 +169,7 @@ class Engine:
                 raise OSError("Could not load thorvg library")
             else:
                 self.thorvg_lib = THORVG_LIB
+                _bind_lib(self.thorvg_lib)
                 return
 
         thorvg_lib = _load_lib(thorvg_lib_path)
@@ -99,6 +177,7 @@ class Engine:
             raise OSError(f"Could not load thorvg library from {thorvg_lib_path}")
         else:
             self.thorvg_lib = thorvg_lib
+            _bind_lib(self.thorvg_lib)
 
     def __del__(self) -> None:
         if self.thorvg_lib:
@@ -134,8 +213,6 @@ class Engine:
             and cannot be changed in subsequent calls.
         .. seealso:: Engine.term()
         """
-        self.thorvg_lib.tvg_engine_init.argtypes = [ctypes.c_uint32]
-        self.thorvg_lib.tvg_engine_init.restype = Result
         return self.thorvg_lib.tvg_engine_init(ctypes.c_uint32(threads))
 
     def term(self) -> Result:
@@ -148,8 +225,6 @@ class Engine:
 
         .. seealso:: Engine.init()
         """
-        self.thorvg_lib.tvg_engine_term.argtypes = []
-        self.thorvg_lib.tvg_engine_term.restype = Result
         return self.thorvg_lib.tvg_engine_term()
 
     def version(self) -> Tuple[Result, int, int, int, Optional[str]]:
@@ -169,22 +244,15 @@ class Engine:
 
         .. versionadded:: 0.15
         """
-        self.thorvg_lib.tvg_engine_version.argtypes = [
-            ctypes.POINTER(ctypes.c_uint32),
-            ctypes.POINTER(ctypes.c_uint32),
-            ctypes.POINTER(ctypes.c_uint32),
-            ctypes.POINTER(ctypes.c_char_p),
-        ]
-        self.thorvg_lib.tvg_engine_version.restype = Result
         major = ctypes.c_uint32()
         minor = ctypes.c_uint32()
         micro = ctypes.c_uint32()
         version = ctypes.c_char_p()
         result = self.thorvg_lib.tvg_engine_version(
-            ctypes.pointer(major),
-            ctypes.pointer(minor),
-            ctypes.pointer(micro),
-            ctypes.pointer(version),
+            ctypes.byref(major),
+            ctypes.byref(minor),
+            ctypes.byref(micro),
+            ctypes.byref(version),
         )
         if version.value is not None:
             v = version.value.decode("utf-8")
@@ -1,9 +1,66 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Optional, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple, Union, cast
 
 from ..base import ColorStop, GradientPointer, Matrix, Result, StrokeFill, TvgType
-from ..engine import Engine
+from ..engine import Engine, register_signatures
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+register_signatures(
+    {
+        "tvg_gradient_set_color_stops": (
+            Result,
+            (GradientPointer, ctypes.POINTER(ColorStop), ctypes.c_uint32),
+        ),
+        "tvg_gradient_get_color_stops": (
+            Result,
+            (
+                GradientPointer,
+                ctypes.POINTER(ctypes.POINTER(ColorStop)),
+                ctypes.POINTER(ctypes.c_uint32),
+            ),
+        ),
+        "tvg_gradient_set_spread": (Result, (GradientPointer, ctypes.c_uint32)),
+        "tvg_gradient_get_spread": (
+            Result,
+            (GradientPointer, ctypes.POINTER(ctypes.c_uint32)),
+        ),
+        "tvg_gradient_set_transform": (
+            Result,
+            (GradientPointer, ctypes.POINTER(Matrix)),
+        ),
+        "tvg_gradient_get_transform": (
+            Result,
+            (GradientPointer, ctypes.POINTER(Matrix)),
+        ),
+        "tvg_gradient_get_type": (
+            Result,
+            (GradientPointer, ctypes.POINTER(ctypes.c_uint32)),
+        ),
+        "tvg_gradient_duplicate": (GradientPointer, (GradientPointer,)),
+        "tvg_gradient_del": (Result, (GradientPointer,)),
+    }
+)
+
+
+def _color_stops_arg(color_stop: Any) -> Tuple[Any, int]:
+    """Returns ``color_stop`` as a ``ColorStop`` array and its length."""
+    try:
+        view = memoryview(color_stop)
+    except TypeError:
+        return (ColorStop * len(color_stop))(*color_stop), len(color_stop)
+    # Drop byte order and alignment markers, e.g. "T{<f:offset:<B:r:...}"
+    fmt = view.format.translate({ord(c): None for c in "@=<>!"})
+    if fmt != "T{f:offset:B:r:B:g:B:b:B:a:}":
+        raise ValueError(f"Unsupported color stop buffer format {view.format}")
+    cnt = view.nbytes // ctypes.sizeof(ColorStop)
+    if not view.c_contiguous:
+        return (ColorStop * cnt).from_buffer_copy(view.tobytes()), cnt
+    if view.readonly:
+        return (ColorStop * cnt).from_buffer_copy(view), cnt
+    return (ColorStop * cnt).from_buffer(view), cnt
 
 
 class Gradient:
@@ -26,26 +83,22 @@ class Gradient:
 
     def set_color_stops(
         self,
-        color_stop: Sequence[ColorStop],
+        color_stop: Union[Sequence[ColorStop], Any],
     ) -> Result:
         """Sets the parameters of the colors of the gradient and their position.
 
+        Besides sequences, ``color_stop`` accepts a ``ColorStop`` ctypes array or a numpy array of
+        dtype ``[('offset', '<f4'), ('r', 'u1'), ('g', 'u1'), ('b', 'u1'), ('a', 'u1')]``,
+        which are passed to ThorVG without converting each element.
+
         :param Sequence[thorvg_python.base.ColorStop] color_stop: An array of ColorStop data structure.
 
         :return: Result.INVALID_ARGUMENT An invalid GradientPointer.
         :rtype: thorvg_python.base.Result
         """
-        color_stop_arr_type = ColorStop * len(color_stop)
-        self.thorvg_lib.tvg_gradient_set_color_stops.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(color_stop_arr_type),
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_gradient_set_color_stops.restype = Result
+        color_stop_arr, cnt = _color_stops_arg(color_stop)
         return self.thorvg_lib.tvg_gradient_set_color_stops(
-            self._grad,
-            ctypes.pointer(color_stop_arr_type(*color_stop)),
-            ctypes.c_uint32(len(color_stop)),
+            self._grad, color_stop_arr, cnt
         )
 
     def get_color_stops(
@@ -60,24 +113,53 @@ class Gradient:
         :return: An array of ColorStop data structure.
         :rtype: Sequence[ColorStop]
         """
+        result, color_stop_arr = self._get_color_stops_array()
+        return result, list(color_stop_arr)
+
+    def _get_color_stops_array(self) -> Tuple[Result, Any]:
         color_stop_ptr = ctypes.POINTER(ColorStop)()
         cnt = ctypes.c_uint32()
-        self.thorvg_lib.tvg_gradient_get_color_stops.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(ctypes.POINTER(ColorStop)),
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_gradient_get_color_stops.restype = Result
         result = self.thorvg_lib.tvg_gradient_get_color_stops(
             self._grad,
-            ctypes.pointer(color_stop_ptr),
-            ctypes.pointer(cnt),
+            ctypes.byref(color_stop_ptr),
+            ctypes.byref(cnt),
         )
         color_stop_type = ColorStop * cnt.value
+        if cnt.value == 0:
+            return result, color_stop_type()
         color_stop_arr = color_stop_type.from_address(
             ctypes.addressof(color_stop_ptr.contents)
         )
-        return result, [color_stop_arr[i] for i in range(cnt.value)]
+        return result, color_stop_arr
+
+    def get_color_stops_numpy(self) -> Tuple[Result, "NDArray[Any]"]:
+        """Gets the parameters of the colors of the gradient as a numpy array.
+
+        Unlike Gradient.get_color_stops(), no Python object is created per color stop:
+        the returned array is a view of the color stops owned by ThorVG.
+
+        :return: Result.INVALID_ARGUMENT A ``None`` passed as the argument.
+        :rtype: thorvg_python.base.Result
+        :return: The color stops, with dtype ``[('offset', '<f4'), ('r', 'u1'), ('g', 'u1'), ('b', 'u1'), ('a', 'u1')]``.
+        :rtype: numpy.ndarray
+
+        .. warning::
+            The array aliases ThorVG memory. It becomes invalid once the color stops are changed
+            or the gradient is freed; use ``.copy()`` to keep the data. Call ``.tolist()`` for plain Python values.
+        """
+        import numpy as np
+
+        result, color_stop_arr = self._get_color_stops_array()
+        return result, np.frombuffer(
+            color_stop_arr,
+            dtype=[
+                ("offset", "<f4"),
+                ("r", "u1"),
+                ("g", "u1"),
+                ("b", "u1"),
+                ("a", "u1"),
+            ],
+        )
 
     def set_spread(
         self,
@@ -90,11 +172,6 @@ class Gradient:
         :return: Result.INVALID_ARGUMENT An invalid GradientPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_gradient_set_spread.argtypes = [
-            GradientPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_gradient_set_spread.restype = Result
         return self.thorvg_lib.tvg_gradient_set_spread(
             self._grad,
             spread,
@@ -109,14 +186,9 @@ class Gradient:
         :rtype: StrokeFill
         """
         spread = ctypes.c_uint32()
-        self.thorvg_lib.tvg_gradient_get_spread.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_gradient_get_spread.restype = Result
         result = self.thorvg_lib.tvg_gradient_get_spread(
             self._grad,
-            ctypes.pointer(spread),
+            ctypes.byref(spread),
         )
         return result, StrokeFill(spread.value)
 
@@ -130,14 +202,9 @@ class Gradient:
         :return: Result.INVALID_ARGUMENT A ``None`` is passed as the argument.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_gradient_set_transform.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(Matrix),
-        ]
-        self.thorvg_lib.tvg_gradient_set_transform.restype = Result
         return self.thorvg_lib.tvg_gradient_set_transform(
             self._grad,
-            ctypes.pointer(m),
+            ctypes.byref(m),
         )
 
     def get_transform(self) -> Tuple[Result, Matrix]:
@@ -151,14 +218,9 @@ class Gradient:
         :rtype: thorvg_python.base.Matrix
         """
         m = Matrix()
-        self.thorvg_lib.tvg_gradient_get_transform.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(Matrix),
-        ]
-        self.thorvg_lib.tvg_gradient_get_transform.restype = Result
         result = self.thorvg_lib.tvg_gradient_get_transform(
             self._grad,
-            ctypes.pointer(m),
+            ctypes.byref(m),
         )
         return result, m
 
@@ -174,14 +236,9 @@ class Gradient:
             Experimental API
         """
         _type = ctypes.c_uint32()
-        self.thorvg_lib.tvg_gradient_get_type.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_gradient_get_type.restype = Result
         result = self.thorvg_lib.tvg_gradient_get_type(
             self._grad,
-            ctypes.pointer(_type),
+            ctypes.byref(_type),
         )
         return result, TvgType(_type.value)
 
@@ -193,8 +250,6 @@ class Gradient:
         :return: A copied GradientPointer object if succeed, ``None`` otherwise.
         :rtype: thorvg_python.base.GradientPointer
         """
-        self.thorvg_lib.tvg_gradient_duplicate.argtypes = [GradientPointer]
-        self.thorvg_lib.tvg_gradient_duplicate.restype = GradientPointer
         tvg_gradient = cast(
             GradientPointer,
             self.thorvg_lib.tvg_gradient_duplicate(self._grad),
@@ -216,6 +271,4 @@ class Gradient:
         :return: Result.INVALID_ARGUMENT An invalid GradientPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_gradient_del.argtypes = [GradientPointer]
-        self.thorvg_lib.tvg_gradient_del.restype = Result
         return self.thorvg_lib.tvg_gradient_del(self._grad)
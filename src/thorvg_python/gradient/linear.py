@@ -3,9 +3,35 @@ import ctypes
 from typing import Optional, Tuple
 
 from ..base import GradientPointer, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from . import Gradient
 
+register_signatures(
+    {
+        "tvg_linear_gradient_new": (GradientPointer, ()),
+        "tvg_linear_gradient_set": (
+            Result,
+            (
+                GradientPointer,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+            ),
+        ),
+        "tvg_linear_gradient_get": (
+            Result,
+            (
+                GradientPointer,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+            ),
+        ),
+    }
+)
+
 
 class LinearGradient(Gradient):
     """
@@ -29,7 +55,6 @@ class LinearGradient(Gradient):
         .. note::
             You need not call this method as it is auto called when initializing ``LinearGradient()``.
         """
-        self.thorvg_lib.tvg_linear_gradient_new.restype = GradientPointer
         return self.thorvg_lib.tvg_linear_gradient_new()
 
     def set(
@@ -57,14 +82,6 @@ class LinearGradient(Gradient):
             In case the first and the second points are equal, an object is filled with a single color using the last color specified in the Gradient.set_color_stops().
         .. seealso:: Gradient.set_color_stops()
         """
-        self.thorvg_lib.tvg_linear_gradient_set.argtypes = [
-            GradientPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_linear_gradient_set.restype = Result
         return self.thorvg_lib.tvg_linear_gradient_set(
             self._grad,
             ctypes.c_float(x1),
@@ -97,19 +114,11 @@ class LinearGradient(Gradient):
         y1 = ctypes.c_float()
         x2 = ctypes.c_float()
         y2 = ctypes.c_float()
-        self.thorvg_lib.tvg_linear_gradient_get.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_linear_gradient_get.restype = Result
         result = self.thorvg_lib.tvg_linear_gradient_get(
             self._grad,
-            ctypes.pointer(x1),
-            ctypes.pointer(y1),
-            ctypes.pointer(x2),
-            ctypes.pointer(y2),
+            ctypes.byref(x1),
+            ctypes.byref(y1),
+            ctypes.byref(x2),
+            ctypes.byref(y2),
         )
         return result, x1.value, y1.value, x2.value, y2.value
@@ -3,9 +3,39 @@ import ctypes
 from typing import Optional, Tuple
 
 from ..base import GradientPointer, Result
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from . import Gradient
 
+register_signatures(
+    {
+        "tvg_radial_gradient_new": (GradientPointer, ()),
+        "tvg_radial_gradient_set": (
+            Result,
+            (
+                GradientPointer,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+            ),
+        ),
+        "tvg_radial_gradient_get": (
+            Result,
+            (
+                GradientPointer,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+            ),
+        ),
+    }
+)
+
 
 class RadialGradient(Gradient):
     """
@@ -29,7 +59,6 @@ class RadialGradient(Gradient):
         .. note::
             You need not call this method as it is auto called when initializing ``LinearGradient()``.
         """
-        self.thorvg_lib.tvg_radial_gradient_new.restype = GradientPointer
         return self.thorvg_lib.tvg_radial_gradient_new()
 
     def set(
@@ -71,16 +100,6 @@ class RadialGradient(Gradient):
 
         .. seealso:: Gradient.set_color_stops()
         """
-        self.thorvg_lib.tvg_radial_gradient_set.argtypes = [
-            GradientPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_radial_gradient_set.restype = Result
         return self.thorvg_lib.tvg_radial_gradient_set(
             self._grad,
             ctypes.c_float(cx),
@@ -115,23 +134,13 @@ class RadialGradient(Gradient):
         fx = ctypes.c_float()
         fy = ctypes.c_float()
         fr = ctypes.c_float()
-        self.thorvg_lib.tvg_radial_gradient_get.argtypes = [
-            GradientPointer,
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_radial_gradient_get.restype = Result
         result = self.thorvg_lib.tvg_radial_gradient_get(
             self._grad,
-            ctypes.pointer(cx),
-            ctypes.pointer(cy),
-            ctypes.pointer(r),
-            ctypes.pointer(fx),
-            ctypes.pointer(fy),
-            ctypes.pointer(fr),
+            ctypes.byref(cx),
+            ctypes.byref(cy),
+            ctypes.byref(r),
+            ctypes.byref(fx),
+            ctypes.byref(fy),
+            ctypes.byref(fr),
         )
         return result, cx.value, cy.value, r.value, fx.value, fy.value, fr.value
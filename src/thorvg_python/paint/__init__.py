@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Optional, Tuple
+import functools
+import inspect
+from typing import Any, Callable, ClassVar, Dict, Optional, Sequence, Tuple
 
 from ..base import (
     BlendMethod,
@@ -11,7 +13,76 @@ from ..base import (
     Result,
     TvgType,
 )
-from ..engine import Engine
+from ..engine import Engine, register_signatures
+
+_ARGS_P = (PaintPointer,)
+_ARGS_P_MATRIX = (PaintPointer, ctypes.POINTER(Matrix))
+
+register_signatures(
+    {
+        "tvg_paint_rel": (Result, _ARGS_P),
+        "tvg_paint_ref": (ctypes.c_uint16, _ARGS_P),
+        "tvg_paint_unref": (ctypes.c_uint16, (PaintPointer, ctypes.c_bool)),
+        "tvg_paint_get_ref": (ctypes.c_uint16, _ARGS_P),
+        "tvg_paint_set_visible": (Result, (PaintPointer, ctypes.c_bool)),
+        "tvg_paint_get_visible": (ctypes.c_bool, _ARGS_P),
+        "tvg_paint_get_id": (ctypes.c_uint32, _ARGS_P),
+        "tvg_paint_set_id": (Result, (PaintPointer, ctypes.c_uint32)),
+        "tvg_paint_scale": (Result, (PaintPointer, ctypes.c_float)),
+        "tvg_paint_rotate": (Result, (PaintPointer, ctypes.c_float)),
+        "tvg_paint_translate": (Result, (PaintPointer, ctypes.c_float, ctypes.c_float)),
+        "tvg_paint_set_transform": (Result, _ARGS_P_MATRIX),
+        "tvg_paint_get_transform": (Result, _ARGS_P_MATRIX),
+        "tvg_paint_set_opacity": (Result, (PaintPointer, ctypes.c_uint8)),
+        "tvg_paint_get_opacity": (
+            Result,
+            (PaintPointer, ctypes.POINTER(ctypes.c_uint8)),
+        ),
+        "tvg_paint_duplicate": (PaintPointer, _ARGS_P),
+        "tvg_paint_intersects": (
+            ctypes.c_bool,
+            (
+                PaintPointer,
+                ctypes.c_int32,
+                ctypes.c_int32,
+                ctypes.c_int32,
+                ctypes.c_int32,
+            ),
+        ),
+        "tvg_paint_get_aabb": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+            ),
+        ),
+        "tvg_paint_get_obb": (Result, (PaintPointer, ctypes.POINTER(PointStruct))),
+        "tvg_paint_set_mask_method": (
+            Result,
+            (PaintPointer, PaintPointer, ctypes.c_uint8),
+        ),
+        "tvg_paint_get_mask_method": (
+            Result,
+            (PaintPointer, PaintPointer, ctypes.POINTER(ctypes.c_uint8)),
+        ),
+        "tvg_paint_set_clip": (Result, (PaintPointer, PaintPointer)),
+        "tvg_paint_get_clip": (PaintPointer, _ARGS_P),
+        "tvg_paint_get_parent": (PaintPointer, _ARGS_P),
+        "tvg_paint_get_type": (Result, (PaintPointer, ctypes.POINTER(ctypes.c_uint32))),
+        "tvg_paint_set_blend_method": (Result, (PaintPointer, ctypes.c_uint8)),
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _setter_arity(setter: Callable[..., Result]) -> Tuple[int, int]:
+    """Returns the numbers of required and total arguments of ``setter``, besides ``self``."""
+    params = list(inspect.signature(setter).parameters.values())[1:]
+    required = sum(param.default is inspect.Parameter.empty for param in params)
+    return required, len(params)
 
 
 class Paint:
@@ -23,6 +94,8 @@ class Paint:
     This is base Paint class. Please instantiate with Shape, Picture, Scene or Text instead.
     """
 
+    __slots__ = ("__weakref__", "_paint", "engine", "thorvg_lib")
+
     def __init__(self, engine: Engine, paint: PaintPointer):
         self.engine = engine
         self.thorvg_lib = engine.thorvg_lib
@@ -34,10 +107,6 @@ class Paint:
         This is the counterpart to the ``new()`` API, and releases the given Paint object safely,
         handling ``None`` and managing ownership properly.
         """
-        self.thorvg_lib.tvg_paint_rel.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_rel.restype = Result
         return self.thorvg_lib.tvg_paint_rel(
             self._paint,
         )
@@ -58,10 +127,6 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_ref.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_ref.restype = ctypes.c_uint16
         return self.thorvg_lib.tvg_paint_ref(
             self._paint,
         )
@@ -82,12 +147,7 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_unref.argtypes = [
-            PaintPointer,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_paint_unref.restype = ctypes.c_uint16
-        return self.thorvg_lib.tvg_paint_unref(self._paint, ctypes.c_bool(free))
+        return self.thorvg_lib.tvg_paint_unref(self._paint, free)
 
     def get_ref(self) -> int:
         """Retrieve the current reference count of the PaintPointer object.
@@ -102,10 +162,6 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_get_ref.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_get_ref.restype = ctypes.c_uint16
         return self.thorvg_lib.tvg_paint_get_ref(
             self._paint,
         )
@@ -130,14 +186,7 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_set_visible.argtypes = [
-            PaintPointer,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_paint_set_visible.restype = Result
-        return self.thorvg_lib.tvg_paint_set_visible(
-            self._paint, ctypes.c_bool(visible)
-        )
+        return self.thorvg_lib.tvg_paint_set_visible(self._paint, visible)
 
     def get_visible(self) -> Result:
         """Gets the current visibility status of the Paint object..
@@ -151,10 +200,6 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_get_visible.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_get_visible.restype = ctypes.c_bool
         return self.thorvg_lib.tvg_paint_get_visible(
             self._paint,
         )
@@ -172,10 +217,6 @@ class Paint:
         .. note::
             Experimental API
         """
-        self.thorvg_lib.tvg_paint_get_id.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_get_id.restype = ctypes.c_uint32
         return self.thorvg_lib.tvg_paint_get_id(
             self._paint,
         )
@@ -192,11 +233,6 @@ class Paint:
         .. note::
             Experimental API
         """
-        self.thorvg_lib.tvg_paint_set_id.argtypes = [
-            PaintPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_paint_set_id.restype = Result
         return self.thorvg_lib.tvg_paint_set_id(
             self._paint,
             _id,
@@ -214,14 +250,9 @@ class Paint:
 
         .. seealso:: Paint.set_transform()
         """
-        self.thorvg_lib.tvg_paint_scale.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_paint_scale.restype = Result
         return self.thorvg_lib.tvg_paint_scale(
             self._paint,
-            ctypes.c_float(factor),
+            factor,
         )
 
     def rotate(
@@ -242,14 +273,9 @@ class Paint:
 
         .. seealso:: Paint.set_transform()
         """
-        self.thorvg_lib.tvg_paint_rotate.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_paint_rotate.restype = Result
         return self.thorvg_lib.tvg_paint_rotate(
             self._paint,
-            ctypes.c_float(degree),
+            degree,
         )
 
     def translate(
@@ -272,16 +298,10 @@ class Paint:
 
         .. seealso:: Paint.set_transform()
         """
-        self.thorvg_lib.tvg_paint_translate.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_paint_translate.restype = Result
         return self.thorvg_lib.tvg_paint_translate(
             self._paint,
-            ctypes.c_float(x),
-            ctypes.c_float(y),
+            x,
+            y,
         )
 
     def set_transform(
@@ -297,14 +317,9 @@ class Paint:
         :return: Result.INVALID_ARGUMENT A ``None`` is passed as the argument.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_paint_set_transform.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(Matrix),
-        ]
-        self.thorvg_lib.tvg_paint_set_transform.restype = Result
         return self.thorvg_lib.tvg_paint_set_transform(
             self._paint,
-            ctypes.pointer(m),
+            ctypes.byref(m),
         )
 
     def get_transform(
@@ -320,14 +335,9 @@ class Paint:
         :rtype: thorvg_python.base.Matrix
         """
         m = Matrix()
-        self.thorvg_lib.tvg_paint_get_transform.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(Matrix),
-        ]
-        self.thorvg_lib.tvg_paint_get_transform.restype = Result
         result = self.thorvg_lib.tvg_paint_get_transform(
             self._paint,
-            ctypes.pointer(m),
+            ctypes.byref(m),
         )
         return result, m
 
@@ -346,14 +356,9 @@ class Paint:
             Setting the opacity with this API may require multiple renderings using a composition.
             It is recommended to avoid changing the opacity if possible.
         """
-        self.thorvg_lib.tvg_paint_set_opacity.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_paint_set_opacity.restype = Result
         return self.thorvg_lib.tvg_paint_set_opacity(
             self._paint,
-            ctypes.c_uint8(opacity),
+            opacity,
         )
 
     def get_opacity(
@@ -367,14 +372,9 @@ class Paint:
         :rtype: int
         """
         opacity = ctypes.c_uint8()
-        self.thorvg_lib.tvg_paint_get_opacity.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint8),
-        ]
-        self.thorvg_lib.tvg_paint_get_opacity.restype = Result
         result = self.thorvg_lib.tvg_paint_get_opacity(
             self._paint,
-            ctypes.pointer(opacity),
+            ctypes.byref(opacity),
         )
         return result, opacity.value
 
@@ -388,10 +388,6 @@ class Paint:
         :return: A copied PaintPointer object if succeed, ``None`` otherwise.
         :rtype: Optional[thorvg_python.base.PaintPointer]
         """
-        self.thorvg_lib.tvg_paint_duplicate.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_duplicate.restype = PaintPointer
         return self.thorvg_lib.tvg_paint_duplicate(
             self._paint,
         )
@@ -431,20 +427,12 @@ class Paint:
             This test does take into account the the hidden paints as well. See ``Paint.set_visible()``.
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_intersects.argtypes = [
-            PaintPointer,
-            ctypes.c_int32,
-            ctypes.c_int32,
-            ctypes.c_int32,
-            ctypes.c_int32,
-        ]
-        self.thorvg_lib.tvg_paint_intersects.restype = PaintPointer
         return self.thorvg_lib.tvg_paint_intersects(
             self._paint,
-            ctypes.c_int32(x),
-            ctypes.c_int32(y),
-            ctypes.c_int32(w),
-            ctypes.c_int32(h),
+            x,
+            y,
+            w,
+            h,
         )
 
     def get_aabb(self) -> Tuple[Result, float, float, float, float]:
@@ -476,24 +464,16 @@ class Paint:
         y = ctypes.c_float()
         w = ctypes.c_float()
         h = ctypes.c_float()
-        self.thorvg_lib.tvg_paint_get_aabb.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_paint_get_aabb.restype = PaintPointer
         result = self.thorvg_lib.tvg_paint_get_aabb(
             self._paint,
-            ctypes.pointer(x),
-            ctypes.pointer(y),
-            ctypes.pointer(w),
-            ctypes.pointer(h),
+            ctypes.byref(x),
+            ctypes.byref(y),
+            ctypes.byref(w),
+            ctypes.byref(h),
         )
         return result, x.value, y.value, w.value, h.value
 
-    def get_obb(self) -> Tuple[Result, PointStruct]:
+    def get_obb(self) -> Tuple[Result, Sequence[PointStruct]]:
         """Retrieves the object-oriented bounding box (OBB) of the paint object in canvas space.
 
         This function returns the bounding box of the paint, as an oriented bounding box (OBB) after transformations are applied.
@@ -507,25 +487,20 @@ class Paint:
             - Result.INVALID_ARGUMENT ``paint`` or ``pt4`` is invalid.
             - Result.INSUFFICIENT_CONDITION If it failed to compute the bounding box (mostly due to invalid path information).
         :rtype: thorvg_python.base.Result
-        :return: An array of four points representing the bounding box. The array size must be 4.
-        :rtype: thorvg_python.base.PointStruct
+        :return: An array of four points representing the bounding box.
+        :rtype: Sequence[thorvg_python.base.PointStruct]
 
         .. seealso:: Paint.get_aabb()
         .. seealso:: Canvas.update()
 
         .. versionadded:: 1.0
         """
-        pt4 = PointStruct()
-        self.thorvg_lib.tvg_paint_get_aabb.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(PointStruct),
-        ]
-        self.thorvg_lib.tvg_paint_get_aabb.restype = PaintPointer
-        result = self.thorvg_lib.tvg_paint_get_aabb(
+        pt4 = (PointStruct * 4)()
+        result = self.thorvg_lib.tvg_paint_get_obb(
             self._paint,
-            ctypes.pointer(pt4),
+            pt4,
         )
-        return result, pt4
+        return result, list(pt4)
 
     def set_mask_method(
         self,
@@ -540,12 +515,6 @@ class Paint:
         :return: Result.INSUFFICIENT_CONDITION if the target has already belonged to another paint.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_paint_set_mask_method.argtypes = [
-            PaintPointer,
-            PaintPointer,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_paint_set_mask_method.restype = Result
         return self.thorvg_lib.tvg_paint_set_mask_method(
             self._paint, target._paint, method
         )
@@ -559,16 +528,10 @@ class Paint:
         :rtype: thorvg_python.base.MaskMethod
         """
         method = ctypes.c_uint8()
-        self.thorvg_lib.tvg_paint_get_mask_method.argtypes = [
-            PaintPointer,
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint8),
-        ]
-        self.thorvg_lib.tvg_paint_get_mask_method.restype = Result
         result = self.thorvg_lib.tvg_paint_get_mask_method(
             self._paint,
             target._paint,
-            ctypes.pointer(method),
+            ctypes.byref(method),
         )
         return result, MaskMethod(method.value)
 
@@ -584,11 +547,6 @@ class Paint:
             - Result.NOT_SUPPORTED If the ``clipper`` type is not Shape.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_paint_set_clip.argtypes = [
-            PaintPointer,
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_set_clip.restype = Result
         return self.thorvg_lib.tvg_paint_set_clip(
             self._paint,
             clipper._paint,
@@ -606,15 +564,10 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_get_clip.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_get_clip.restype = PaintPointer
         clipper = self.thorvg_lib.tvg_paint_get_clip(self._paint)
-        if clipper is not ctypes.c_void_p():
-            return Paint(self.engine, clipper)
-        else:
+        if clipper.value is None:
             return None
+        return Paint(self.engine, clipper)
 
     def get_parent(self) -> "Optional[Paint]":
         """Retrieves the parent paint object.
@@ -630,15 +583,10 @@ class Paint:
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_paint_get_parent.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_paint_get_parent.restype = PaintPointer
         parent = self.thorvg_lib.tvg_paint_get_parent(self._paint)
-        if isinstance(ctypes.c_void_p, parent):
+        if parent.value is None:
             return None
-        else:
-            return Paint(self.engine, parent)
+        return Paint(self.engine, parent)
 
     def get_type(self) -> Tuple[Result, TvgType]:
         """
@@ -650,14 +598,9 @@ class Paint:
         :rtype: thorvg_python.base.TvgType
         """
         _type = ctypes.c_uint32()
-        self.thorvg_lib.tvg_paint_get_type.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_paint_get_type.restype = Result
         result = self.thorvg_lib.tvg_paint_get_type(
             self._paint,
-            ctypes.pointer(_type),
+            ctypes.byref(_type),
         )
         return result, TvgType(_type.value)
 
@@ -675,12 +618,65 @@ class Paint:
 
         .. versionadded:: 0.15
         """
-        self.thorvg_lib.tvg_paint_set_blend_method.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_paint_set_blend_method.restype = Result
         return self.thorvg_lib.tvg_paint_set_blend_method(
             self._paint,
             method,
         )
+
+    def apply(self, **settings: Any) -> Result:
+        """Sets several properties at once.
+
+        Each keyword names a property and is applied with its setter, in the given order.
+        A property whose setter takes one argument is given its value unchanged, e.g. ``opacity=128``.
+        Otherwise the value is the tuple of setter arguments, e.g. ``translate=(10, 20)``
+        or ``stroke_dash=([7.0, 10.0], 0.0)``.
+
+        Available keywords for every paint: ``opacity``, ``visible``, ``scale``, ``rotate``,
+        ``translate``, ``transform`` and ``blend_method``.
+        Shape and Text add their own properties, listed in their class documentation.
+
+        :return: The result of the first setter that did not succeed, or Result.SUCCESS.
+            The remaining properties are not applied after a failure.
+        :rtype: thorvg_python.base.Result
+
+        :raises TypeError: If a keyword is not a property of this paint, or its value does not
+            match the number of setter arguments. All values are checked before anything is applied.
+        """
+        setters = self._SETTERS
+        unknown = settings.keys() - setters.keys()
+        if unknown:
+            raise TypeError(
+                f"{type(self).__name__}.apply() got unknown properties {sorted(unknown)}"
+            )
+        calls = []
+        for name, value in settings.items():
+            setter = setters[name]
+            required, total = _setter_arity(setter)
+            if total == 1:
+                args = (value,)
+            elif isinstance(value, tuple):
+                args = value
+            else:
+                args = (value,)
+            if not required <= len(args) <= total:
+                raise TypeError(
+                    f"{type(self).__name__}.apply() property {name!r} takes "
+                    f"a tuple of {total} arguments, got {value!r}"
+                )
+            calls.append((setter, args))
+        for setter, args in calls:
+            result = setter(self, *args)
+            if result != Result.SUCCESS:
+                return result
+        return Result.SUCCESS
+
+    #: Properties accepted by Paint.apply(), mapped to their setters
+    _SETTERS: ClassVar[Dict[str, Callable[..., Result]]] = {
+        "opacity": set_opacity,
+        "visible": set_visible,
+        "scale": scale,
+        "rotate": rotate,
+        "translate": translate,
+        "transform": set_transform,
+        "blend_method": set_blend_method,
+    }
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Callable, Optional, Tuple
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from weakref import WeakValueDictionary
 
 from ..base import (
     Colorspace,
@@ -9,9 +11,80 @@ from ..base import (
     PictureAssetResolverType,
     Result,
 )
-from ..engine import Engine
+from ..engine import Engine, _get_executor, register_signatures
 from . import Paint
 
+_ARGS_P_F_F = (PaintPointer, ctypes.c_float, ctypes.c_float)
+_ARGS_P_PF_PF = (
+    PaintPointer,
+    ctypes.POINTER(ctypes.c_float),
+    ctypes.POINTER(ctypes.c_float),
+)
+register_signatures(
+    {
+        "tvg_picture_new": (PaintPointer, ()),
+        "tvg_picture_load": (Result, (PaintPointer, ctypes.c_char_p)),
+        "tvg_picture_load_raw": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_void_p,
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+                ctypes.c_uint8,
+                ctypes.c_bool,
+            ),
+        ),
+        "tvg_picture_load_data": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_void_p,
+                ctypes.c_uint32,
+                ctypes.c_char_p,
+                ctypes.c_char_p,
+                ctypes.c_bool,
+            ),
+        ),
+        "tvg_picture_set_asset_resolver": (
+            Result,
+            (PaintPointer, PictureAssetResolverType, ctypes.c_void_p),
+        ),
+        "tvg_picture_set_size": (Result, _ARGS_P_F_F),
+        "tvg_picture_get_size": (Result, _ARGS_P_PF_PF),
+        "tvg_picture_set_origin": (Result, _ARGS_P_F_F),
+        "tvg_picture_get_origin": (Result, _ARGS_P_PF_PF),
+        "tvg_picture_get_paint": (PaintPointer, (PaintPointer, ctypes.c_uint32)),
+        "tvg_picture_set_accessible": (Result, (PaintPointer, ctypes.c_bool)),
+        "tvg_picture_set_filter": (Result, (PaintPointer, ctypes.c_uint8)),
+    }
+)
+
+#: Trampolines built for resolver callables, shared between pictures.
+#: Entries live only as long as some picture still holds the trampoline.
+_resolver_cache: "WeakValueDictionary[Callable[..., bool], Any]" = WeakValueDictionary()
+
+
+def _buffer_arg(data: Any) -> Any:
+    """Returns ``data`` in a form accepted by a ``ctypes.c_void_p`` argument.
+
+    ``bytes`` and whole-``bytes`` views are passed as is, writable buffers are
+    shared and other read-only buffers are copied.
+    """
+    if isinstance(data, bytes):
+        return data
+    if (
+        isinstance(data, memoryview)
+        and isinstance(data.obj, bytes)
+        and data.nbytes == len(data.obj)
+        and data.c_contiguous
+    ):
+        return data.obj
+    data_arr_type = ctypes.c_char * memoryview(data).nbytes
+    if memoryview(data).readonly:
+        return data_arr_type.from_buffer_copy(data)
+    return data_arr_type.from_buffer(data)
+
 
 class Picture(Paint):
     """
@@ -23,6 +96,7 @@ class Picture(Paint):
     def __init__(self, engine: Engine, paint: Optional[PaintPointer] = None):
         self.engine = engine
         self.thorvg_lib = engine.thorvg_lib
+        self._paint_cache: Dict[int, Paint] = {}
         if paint is None:
             self._paint = self._new()
         else:
@@ -36,7 +110,6 @@ class Picture(Paint):
         :return: A new picture object.
         :rtype: thorvg_python.base.PaintPointer
         """
-        self.thorvg_lib.tvg_picture_new.restype = PaintPointer
         return self.thorvg_lib.tvg_picture_new()
 
     def load(
@@ -55,22 +128,47 @@ class Picture(Paint):
             - Result.INVALID_ARGUMENT An invalid PaintPointer or an empty ``path``.
             - Result.NOT_SUPPORTED A file with an unknown extension.
         :rtype: thorvg_python.base.Result
+
+        .. note::
+            The GIL is released while ThorVG reads and parses the file, so other
+            Python threads keep running. See also ``Picture.load_async()``.
         """
-        path_bytes = path.encode() + b"\x00"
-        path_char = ctypes.create_string_buffer(path_bytes)
-        self.thorvg_lib.tvg_picture_load.argtypes = [
-            PaintPointer,
-            ctypes.c_char * ctypes.sizeof(path_char),
-        ]
-        self.thorvg_lib.tvg_picture_load.restype = Result
+        self._paint_cache.clear()
         return self.thorvg_lib.tvg_picture_load(
             self._paint,
-            path_char,
+            path.encode(),
         )
 
+    def load_async(
+        self,
+        path: str,
+        executor: Optional[Executor] = None,
+    ) -> "Future[Result]":
+        """Loads a picture data from a file on a worker thread.
+
+        Parsing large SVG or Lottie files can take a long time. Since the GIL is
+        released during ``Picture.load()``, several pictures may be loaded in
+        parallel while the calling thread keeps rendering other paints.
+
+        :param str path: The absolute path to the image file.
+        :param Optional[concurrent.futures.Executor] executor: The executor to run
+            the load on. If ``None``, a thread pool shared by the module is used.
+
+        :return: A future resolving to the result of ``Picture.load()``.
+        :rtype: concurrent.futures.Future
+
+        .. note::
+            The picture must not be used until the returned future is done.
+
+        .. seealso:: Picture.load()
+        """
+        if executor is None:
+            executor = _get_executor()
+        return executor.submit(self.load, path)
+
     def load_raw(
         self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         w: int,
         h: int,
         cs: Colorspace,
@@ -83,6 +181,7 @@ class Picture(Paint):
         for the sharable ``data``. Instead, ThorVG will reuse the previously loaded picture data.
 
         :param bytes data: A pointer to a memory location where the content of the picture raw data is stored.
+            Any object supporting the buffer protocol is accepted; writable buffers are passed without copying.
         :param int w: The width of the image ``data`` in pixels.
         :param int h: The height of the image ``data`` in pixels.
         :param thorvg.base.Colorspace cs: Specifies how the 32-bit color values should be interpreted (read/write).
@@ -93,29 +192,23 @@ class Picture(Paint):
 
         .. versionadded:: 0.9
         """
-        data_arr_type = ctypes.c_uint32 * int(len(data) / 4)
-        data_arr = data_arr_type.from_buffer_copy(data)
-        self.thorvg_lib.tvg_picture_load_raw.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(data_arr_type),
-            ctypes.c_uint32,
-            ctypes.c_uint32,
-            ctypes.c_uint8,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_picture_load_raw.restype = Result
+        data_ptr = _buffer_arg(data)
+        if not copy:
+            # ThorVG keeps pointing at the pixels, so they must outlive this call
+            self._raw_ref = data_ptr
+        self._paint_cache.clear()
         return self.thorvg_lib.tvg_picture_load_raw(
             self._paint,
-            ctypes.pointer(data_arr),
-            ctypes.c_uint32(w),
-            ctypes.c_uint32(h),
+            data_ptr,
+            w,
+            h,
             cs,
-            ctypes.c_bool(copy),
+            copy,
         )
 
     def load_data(
         self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         mimetype: str,
         rpath: Optional[str],
         copy: bool,
@@ -138,45 +231,28 @@ class Picture(Paint):
 
         .. warning::
             : It's the user responsibility to release the ``data`` memory if the ``copy`` is ``true``.
+        .. note::
+            The GIL is released while ThorVG parses ``data``.
         """
-        data_arr_type = ctypes.c_char * len(data)
-        data_arr = data_arr_type.from_buffer_copy(data)
-
-        mimetype_bytes = mimetype.encode() + b"\x00"
-        mimetype_char_type = ctypes.c_char * len(mimetype_bytes)
-        mimetype_char = mimetype_char_type.from_buffer_copy(mimetype_bytes)
-
-        if rpath is None:
-            rpath_char_type = ctypes.c_void_p
-            rpath_char_p = ctypes.c_void_p()
-        else:
-            rpath_bytes = rpath.encode() + b"\x00"
-            rpath_char_type = ctypes.c_char * len(rpath_bytes)  # type: ignore
-            rpath_char = mimetype_char_type.from_buffer_copy(rpath_bytes)
-            rpath_char_p = ctypes.pointer(rpath_char)  # type: ignore
-
-        self.thorvg_lib.tvg_picture_load_data.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(data_arr_type),
-            ctypes.c_uint32,
-            ctypes.POINTER(mimetype_char_type),
-            ctypes.POINTER(rpath_char_type),
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_picture_load_data.restype = Result
+        data_ptr = _buffer_arg(data)
+        if not copy:
+            self._data_ref = data_ptr
+        self._paint_cache.clear()
         return self.thorvg_lib.tvg_picture_load_data(
             self._paint,
-            ctypes.pointer(data_arr),
-            ctypes.c_uint32(ctypes.sizeof(data_arr)),
-            ctypes.pointer(mimetype_char),
-            rpath_char_p,
-            ctypes.c_bool(copy),
+            data_ptr,
+            memoryview(data).nbytes,
+            mimetype.encode(),
+            None if rpath is None else rpath.encode(),
+            copy,
         )
 
     def set_asset_resolver(
         self,
-        resolver: Callable[[PaintPointer, ctypes.c_char_p, ctypes.c_void_p], bool],
-        data: bytes,
+        resolver: Optional[
+            Callable[[PaintPointer, ctypes.c_char_p, ctypes.c_void_p], bool]
+        ],
+        data: Union[bytes, bytearray, memoryview],
     ) -> Result:
         """Sets the asset resolver callback for handling external resources (e.g., images and fonts).
 
@@ -206,20 +282,30 @@ class Picture(Paint):
         .. note::
             Experimental API
 
+        .. note::
+            The C callback built from ``resolver`` is reused across pictures that
+            share the same ``resolver``, and is kept alive by this picture together
+            with ``data`` for as long as ThorVG may call it.
+
         .. seealso:: PictureAssetResolverType
         """
-        data_arr_type = ctypes.c_char * len(data)
-        data_arr = data_arr_type.from_buffer_copy(data)
-
-        self.thorvg_lib.tvg_picture_set_asset_resolver.argtypes = [
-            PaintPointer,
-            PictureAssetResolverType,
-            data_arr_type,
-        ]
-        self.thorvg_lib.tvg_picture_set_asset_resolver.restype = Result
+        data_arr = _buffer_arg(data)
+
+        if resolver is None:
+            # A callback type instantiated without arguments is a NULL pointer
+            resolver_func = PictureAssetResolverType()
+        else:
+            cached = _resolver_cache.get(resolver)
+            if cached is None:
+                resolver_func = PictureAssetResolverType(resolver)
+                _resolver_cache[resolver] = resolver_func
+            else:
+                resolver_func = cached
+        self._resolver_ref = (resolver_func, data_arr)
+
         return self.thorvg_lib.tvg_picture_set_asset_resolver(
             self._paint,
-            PictureAssetResolverType(resolver),
+            resolver_func,
             data_arr,
         )
 
@@ -239,16 +325,10 @@ class Picture(Paint):
         :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_picture_set_size.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_picture_set_size.restype = Result
         return self.thorvg_lib.tvg_picture_set_size(
             self._paint,
-            ctypes.c_float(w),
-            ctypes.c_float(h),
+            w,
+            h,
         )
 
     def get_size(self) -> Tuple[Result, float, float]:
@@ -263,16 +343,10 @@ class Picture(Paint):
         """
         w = ctypes.c_float()
         h = ctypes.c_float()
-        self.thorvg_lib.tvg_picture_get_size.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_picture_get_size.restype = Result
         result = self.thorvg_lib.tvg_picture_get_size(
             self._paint,
-            ctypes.pointer(w),
-            ctypes.pointer(h),
+            ctypes.byref(w),
+            ctypes.byref(h),
         )
         return result, w.value, h.value
 
@@ -310,16 +384,10 @@ class Picture(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_picture_set_origin.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_picture_set_origin.restype = Result
         return self.thorvg_lib.tvg_picture_set_origin(
             self._paint,
-            ctypes.c_float(x),
-            ctypes.c_float(y),
+            x,
+            y,
         )
 
     def get_origin(self) -> Tuple[Result, float, float]:
@@ -336,16 +404,10 @@ class Picture(Paint):
         """
         x = ctypes.c_float()
         y = ctypes.c_float()
-        self.thorvg_lib.tvg_picture_get_size.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_picture_get_size.restype = Result
-        result = self.thorvg_lib.tvg_picture_get_size(
+        result = self.thorvg_lib.tvg_picture_get_origin(
             self._paint,
-            ctypes.pointer(x),
-            ctypes.pointer(y),
+            ctypes.byref(x),
+            ctypes.byref(y),
         )
         return result, x.value, y.value
 
@@ -360,23 +422,25 @@ class Picture(Paint):
 
         .. note::
             Setting Picture.set_accessible() to ``True`` enables more efficient access.
+        .. note::
+            Found paints are cached by ``id`` until the next ``Picture.load*()`` call,
+            so repeated lookups return the same ``Paint`` object.
 
         .. seealso:: Engine.accessor_generate_id()
         .. versionadded: 1.0
         """
-        self.thorvg_lib.tvg_picture_get_paint.argtypes = [
-            PaintPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_picture_get_paint.restype = PaintPointer
+        paint = self._paint_cache.get(_id)
+        if paint is not None:
+            return paint
         paint_struct = self.thorvg_lib.tvg_picture_get_paint(
             self._paint,
-            ctypes.c_uint32(_id),
+            _id,
         )
-        if paint_struct is not None:
-            return Paint(self.engine, paint_struct)
-        else:
+        if paint_struct.value is None:
             return None
+        paint = Paint(self.engine, paint_struct)
+        self._paint_cache[_id] = paint
+        return paint
 
     def set_accessible(self, accessible: bool) -> Result:
         """Enable or disable accessible mode for a Picture.
@@ -395,14 +459,9 @@ class Picture(Paint):
         .. seealso:: Picture.get_paint()
         .. versionadded: 1.0
         """
-        self.thorvg_lib.tvg_picture_set_accessible.argtypes = [
-            PaintPointer,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_picture_set_accessible.restype = PaintPointer
         result = self.thorvg_lib.tvg_picture_set_accessible(
             self._paint,
-            ctypes.c_bool(accessible),
+            accessible,
         )
         return result
 
@@ -422,12 +481,5 @@ class Picture(Paint):
         .. note::
             Experimental API
         """
-        self.thorvg_lib.tvg_picture_set_filter.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_picture_set_filter.restype = Result
-        result = self.thorvg_lib.tvg_picture_set_filter(
-            self._paint, ctypes.c_uint8(method)
-        )
+        result = self.thorvg_lib.tvg_picture_set_filter(self._paint, method)
         return result
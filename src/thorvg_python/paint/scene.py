@@ -1,10 +1,45 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Optional
-
-from ..base import PaintPointer, Result
-from ..engine import Engine
-from . import Paint
+from typing import Callable, ClassVar, Dict, Optional, Sequence, Tuple, Union
+
+from ..base import PaintPointer, Result, SceneEffect
+from ..engine import Engine, register_signatures
+from . import Paint, _setter_arity
+
+_ARGS_P = (PaintPointer,)
+_ARGS_P_P = (PaintPointer, PaintPointer)
+_ARGS_P_VP = (PaintPointer, ctypes.c_void_p)
+_RGB = (ctypes.c_int,) * 3
+
+register_signatures(
+    {
+        "tvg_scene_new": (PaintPointer, ()),
+        "tvg_scene_add": (Result, _ARGS_P_P),
+        "tvg_scene_insert": (Result, _ARGS_P_P),
+        "tvg_scene_remove": (Result, _ARGS_P_VP),
+        "tvg_scene_clear_effects": (Result, _ARGS_P),
+        "tvg_scene_add_effect_gaussian_blur": (
+            Result,
+            _ARGS_P + (ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_int),
+        ),
+        "tvg_scene_add_effect_drop_shadow": (
+            Result,
+            _ARGS_P
+            + _RGB
+            + (ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double)
+            + (ctypes.c_int,),
+        ),
+        "tvg_scene_add_effect_fill": (Result, _ARGS_P + _RGB + (ctypes.c_int,)),
+        "tvg_scene_add_effect_tint": (
+            Result,
+            _ARGS_P + _RGB + _RGB + (ctypes.c_double,),
+        ),
+        "tvg_scene_add_effect_tritone": (
+            Result,
+            _ARGS_P + _RGB + _RGB + _RGB + (ctypes.c_int,),
+        ),
+    }
+)
 
 
 class Scene(Paint):
@@ -36,7 +71,6 @@ class Scene(Paint):
 
         .. seealso:: Paint.rel()
         """
-        self.thorvg_lib.tvg_scene_new.restype = PaintPointer
         return self.thorvg_lib.tvg_scene_new()
 
     def add(
@@ -68,16 +102,41 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_add.argtypes = [
-            PaintPointer,
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_scene_add.restype = Result
         return self.thorvg_lib.tvg_scene_add(
             self._paint,
             paint._paint,
         )
 
+    def add_many(
+        self,
+        paints: Sequence[Paint],
+    ) -> Result:
+        """Adds several paint objects to the scene, in order.
+
+        Equivalent to calling ``Scene.add()`` for each paint, stopping at the
+        first paint that could not be added.
+
+        :param Sequence[thorvg_python.paint.Paint] paints:
+            The paint objects to be added to the scene.
+
+        :return: ``Result.SUCCESS`` if every paint was added, otherwise the
+            result of the first paint that failed.
+        :rtype: thorvg_python.base.Result
+
+        .. note::
+            Ownership of each added paint object is transferred to the scene,
+            as with ``Scene.add()``.
+
+        .. seealso:: Scene.add()
+        """
+        scene_add = self.thorvg_lib.tvg_scene_add
+        scene = self._paint
+        for paint in paints:
+            result = scene_add(scene, paint._paint)
+            if result != Result.SUCCESS:
+                return result
+        return Result.SUCCESS
+
     def insert(self, at: Paint) -> Result:
         """Inserts a paint object into the scene.
 
@@ -106,11 +165,6 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_insert.argtypes = [
-            PaintPointer,
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_scene_insert.restype = Result
         return self.thorvg_lib.tvg_scene_insert(
             self._paint,
             at._paint,
@@ -132,24 +186,25 @@ class Scene(Paint):
         :rtype: thorvg_python.base.Result
 
         .. seealso:: Scene.add()
+        .. seealso:: Scene.clear()
         .. versionadded:: 1.0
         """
-        if paint is None:
-            paint_type = ctypes.c_void_p
-            paint_ptr = ctypes.c_void_p()
-        else:
-            paint_type = PaintPointer
-            paint_ptr = paint._paint  # type: ignore
-        self.thorvg_lib.tvg_scene_remove.argtypes = [
-            PaintPointer,
-            paint_type,
-        ]
-        self.thorvg_lib.tvg_scene_remove.restype = Result
         return self.thorvg_lib.tvg_scene_remove(
             self._paint,
-            paint_ptr,
+            None if paint is None else paint._paint,
         )
 
+    def clear(self) -> Result:
+        """Removes all paint objects from the scene.
+
+        Same as ``Scene.remove(None)``.
+
+        :rtype: thorvg_python.base.Result
+
+        .. seealso:: Scene.remove()
+        """
+        return self.thorvg_lib.tvg_scene_remove(self._paint, None)
+
     def clear_effects(self) -> Result:
         """Clears all previously applied scene effects.
 
@@ -160,10 +215,6 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_clear_effects.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_scene_clear_effects.restype = Result
         return self.thorvg_lib.tvg_scene_clear_effects(
             self._paint,
         )
@@ -189,20 +240,12 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_add_effect_gaussian_blur.argtypes = [
-            PaintPointer,
-            ctypes.c_double,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-        ]
-        self.thorvg_lib.tvg_scene_add_effect_gaussian_blur.restype = Result
         return self.thorvg_lib.tvg_scene_add_effect_gaussian_blur(
             self._paint,
-            ctypes.c_double(sigma),
-            ctypes.c_int(direction),
-            ctypes.c_int(border),
-            ctypes.c_int(quality),
+            sigma,
+            direction,
+            border,
+            quality,
         )
 
     def add_effect_drop_shadow(
@@ -235,28 +278,16 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_add_effect_drop_shadow.argtypes = [
-            PaintPointer,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_double,
-            ctypes.c_double,
-            ctypes.c_double,
-            ctypes.c_int,
-        ]
-        self.thorvg_lib.tvg_scene_add_effect_drop_shadow.restype = Result
         return self.thorvg_lib.tvg_scene_add_effect_drop_shadow(
             self._paint,
-            ctypes.c_int(r),
-            ctypes.c_int(g),
-            ctypes.c_int(b),
-            ctypes.c_int(a),
-            ctypes.c_double(angle),
-            ctypes.c_double(distance),
-            ctypes.c_double(sigma),
-            ctypes.c_int(quality),
+            r,
+            g,
+            b,
+            a,
+            angle,
+            distance,
+            sigma,
+            quality,
         )
 
     def add_effect_fill(
@@ -279,20 +310,12 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_add_effect_fill.argtypes = [
-            PaintPointer,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-        ]
-        self.thorvg_lib.tvg_scene_add_effect_fill.restype = Result
         return self.thorvg_lib.tvg_scene_add_effect_fill(
             self._paint,
-            ctypes.c_int(r),
-            ctypes.c_int(g),
-            ctypes.c_int(b),
-            ctypes.c_int(a),
+            r,
+            g,
+            b,
+            a,
         )
 
     def add_effect_tint(
@@ -320,26 +343,15 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_add_effect_tint.argtypes = [
-            PaintPointer,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_double,
-        ]
-        self.thorvg_lib.tvg_scene_add_effect_tint.restype = Result
         return self.thorvg_lib.tvg_scene_add_effect_tint(
             self._paint,
-            ctypes.c_int(black_r),
-            ctypes.c_int(black_g),
-            ctypes.c_int(black_b),
-            ctypes.c_int(white_r),
-            ctypes.c_int(white_g),
-            ctypes.c_int(white_b),
-            ctypes.c_double(intensity),
+            black_r,
+            black_g,
+            black_b,
+            white_r,
+            white_g,
+            white_b,
+            intensity,
         )
 
     def add_effect_effect_tritone(
@@ -373,30 +385,66 @@ class Scene(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_scene_add_effect_tritone.argtypes = [
-            PaintPointer,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-        ]
-        self.thorvg_lib.tvg_scene_add_effect_tritone.restype = Result
         return self.thorvg_lib.tvg_scene_add_effect_tritone(
             self._paint,
-            ctypes.c_int(shadow_r),
-            ctypes.c_int(shadow_g),
-            ctypes.c_int(shadow_b),
-            ctypes.c_int(midtone_r),
-            ctypes.c_int(midtone_g),
-            ctypes.c_int(midtone_b),
-            ctypes.c_int(highlight_r),
-            ctypes.c_int(highlight_g),
-            ctypes.c_int(highlight_b),
-            ctypes.c_int(blend),
+            shadow_r,
+            shadow_g,
+            shadow_b,
+            midtone_r,
+            midtone_g,
+            midtone_b,
+            highlight_r,
+            highlight_g,
+            highlight_b,
+            blend,
         )
+
+    def add_effects(
+        self,
+        effects: Sequence[Tuple[SceneEffect, Sequence[Union[int, float]]]],
+    ) -> Result:
+        """Adds several post-processing effects to the scene in one call.
+
+        Each entry is a pair of the effect kind and its parameters, given in the
+        same order as the matching ``Scene.add_effect_*()`` method. Effects are
+        applied in sequence order, and processing stops at the first failure.
+
+        :param effects: The ``(SceneEffect, params)`` pairs to apply.
+
+        :return: ``Result.SUCCESS`` if every effect was added, otherwise the
+            result of the first effect that failed.
+        :rtype: thorvg_python.base.Result
+
+        :raises ValueError: If an effect kind is unknown.
+        :raises TypeError: If the parameters do not match the effect.
+            All entries are checked before any effect is added.
+
+        .. seealso:: Scene.clear_effects()
+        """
+        adders = self._EFFECT_ADDERS
+        calls = []
+        for effect, params in effects:
+            adder = adders.get(effect)
+            if adder is None:
+                raise ValueError(f"Scene.add_effects() got unknown effect {effect!r}")
+            required, total = _setter_arity(adder)
+            if not required <= len(params) <= total:
+                raise TypeError(
+                    f"Scene.add_effects() effect {effect!r} takes {total} "
+                    f"parameters, got {len(params)}"
+                )
+            calls.append((adder, params))
+        for adder, params in calls:
+            result = adder(self, *params)
+            if result != Result.SUCCESS:
+                return result
+        return Result.SUCCESS
+
+    #: Effects accepted by Scene.add_effects(), mapped to their add_effect_*() methods
+    _EFFECT_ADDERS: ClassVar[Dict[SceneEffect, Callable[..., Result]]] = {
+        SceneEffect.GAUSSIAN_BLUR: add_effect_gaussian_blur,
+        SceneEffect.DROP_SHADOW: add_effect_drop_shadow,
+        SceneEffect.FILL: add_effect_fill,
+        SceneEffect.TINT: add_effect_tint,
+        SceneEffect.TRITONE: add_effect_effect_tritone,
+    }
@@ -1,6 +1,24 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Optional, Sequence, Tuple, Union
+import enum
+import math
+import re
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from ..base import (
     FillRule,
@@ -13,12 +31,309 @@ from ..base import (
     StrokeJoin,
     TvgType,
 )
-from ..engine import Engine
+from ..engine import Engine, register_signatures
 from ..gradient import Gradient
 from ..gradient.linear import LinearGradient
 from ..gradient.radial import RadialGradient
 from . import Paint
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from typing_extensions import Self
+
+_E = TypeVar("_E", bound=enum.IntEnum)
+
+
+def _enum_lut(enum_type: Type[_E]) -> Tuple[_E, ...]:
+    """Returns the members of ``enum_type`` indexed by value, for the byte range.
+
+    Getters convert C values with a tuple lookup rather than an IntEnum call.
+    Values without a member map to the plain int.
+    """
+    members = {member.value: member for member in enum_type}
+    return cast(Tuple[_E, ...], tuple(members.get(i, i) for i in range(256)))
+
+
+_CMD_LUT = _enum_lut(PathCommand)
+_CAP_LUT = _enum_lut(StrokeCap)
+_JOIN_LUT = _enum_lut(StrokeJoin)
+_FILL_RULE_LUT = _enum_lut(FillRule)
+
+# Out-parameters of the color getters, passed as byref() offsets into one 4-byte buffer
+_ARGS_P_RGBA_OUT = (PaintPointer,) + (ctypes.c_void_p,) * 4
+
+register_signatures(
+    {
+        "tvg_shape_new": (PaintPointer, ()),
+        "tvg_shape_reset": (Result, (PaintPointer,)),
+        "tvg_shape_move_to": (Result, (PaintPointer, ctypes.c_float, ctypes.c_float)),
+        "tvg_shape_line_to": (Result, (PaintPointer, ctypes.c_float, ctypes.c_float)),
+        "tvg_shape_cubic_to": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+            ),
+        ),
+        "tvg_shape_close": (Result, (PaintPointer,)),
+        "tvg_shape_append_rect": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_bool,
+            ),
+        ),
+        "tvg_shape_append_circle": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_float,
+                ctypes.c_bool,
+            ),
+        ),
+        "tvg_shape_append_path": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.POINTER(ctypes.c_uint8),
+                ctypes.c_uint32,
+                ctypes.POINTER(PointStruct),
+                ctypes.c_uint32,
+            ),
+        ),
+        "tvg_shape_get_path": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.POINTER(PointStruct)),
+                ctypes.POINTER(ctypes.c_uint32),
+            ),
+        ),
+        "tvg_shape_set_stroke_width": (Result, (PaintPointer, ctypes.c_float)),
+        "tvg_shape_get_stroke_width": (
+            Result,
+            (PaintPointer, ctypes.POINTER(ctypes.c_float)),
+        ),
+        "tvg_shape_set_stroke_color": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+            ),
+        ),
+        "tvg_shape_get_stroke_color": (Result, _ARGS_P_RGBA_OUT),
+        "tvg_shape_set_stroke_gradient": (Result, (PaintPointer, GradientPointer)),
+        "tvg_shape_get_stroke_gradient": (
+            Result,
+            (PaintPointer, ctypes.POINTER(GradientPointer)),
+        ),
+        "tvg_shape_set_stroke_dash": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.c_uint32,
+                ctypes.c_float,
+            ),
+        ),
+        "tvg_shape_get_stroke_dash": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.POINTER(ctypes.POINTER(ctypes.c_float)),
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.c_float),
+            ),
+        ),
+        "tvg_shape_set_stroke_cap": (Result, (PaintPointer, ctypes.c_uint32)),
+        "tvg_shape_get_stroke_cap": (
+            Result,
+            (PaintPointer, ctypes.POINTER(ctypes.c_uint32)),
+        ),
+        "tvg_shape_set_stroke_join": (Result, (PaintPointer, ctypes.c_uint32)),
+        "tvg_shape_get_stroke_join": (
+            Result,
+            (PaintPointer, ctypes.POINTER(ctypes.c_uint32)),
+        ),
+        "tvg_shape_set_stroke_miterlimit": (Result, (PaintPointer, ctypes.c_float)),
+        "tvg_shape_get_stroke_miterlimit": (
+            Result,
+            (PaintPointer, ctypes.POINTER(ctypes.c_float)),
+        ),
+        "tvg_shape_set_trimpath": (
+            Result,
+            (PaintPointer, ctypes.c_float, ctypes.c_float, ctypes.c_bool),
+        ),
+        "tvg_shape_set_fill_color": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+            ),
+        ),
+        "tvg_shape_get_fill_color": (Result, _ARGS_P_RGBA_OUT),
+        "tvg_shape_set_fill_rule": (Result, (PaintPointer, ctypes.c_uint32)),
+        "tvg_shape_get_fill_rule": (
+            Result,
+            (PaintPointer, ctypes.POINTER(ctypes.c_uint32)),
+        ),
+        "tvg_shape_set_paint_order": (Result, (PaintPointer, ctypes.c_bool)),
+        "tvg_shape_set_gradient": (Result, (PaintPointer, GradientPointer)),
+        "tvg_shape_get_gradient": (
+            Result,
+            (PaintPointer, ctypes.POINTER(GradientPointer)),
+        ),
+    }
+)
+
+
+def _buffer_format(view: memoryview) -> str:
+    # Drop byte order and alignment markers, e.g. "T{<f:x:<f:y:}" -> "T{f:x:f:y:}"
+    return view.format.translate({ord(c): None for c in "@=<>!"})
+
+
+def _from_view(arr_type: Any, view: memoryview) -> Any:
+    if not view.c_contiguous:
+        return arr_type.from_buffer_copy(view.tobytes())
+    if view.readonly:
+        return arr_type.from_buffer_copy(view)
+    return arr_type.from_buffer(view)
+
+
+def _float32_view(data: Any) -> Optional[memoryview]:
+    """Returns a memoryview of ``data`` if it is a ``float32`` buffer, else ``None``."""
+    if data is None:
+        return None
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    if _buffer_format(view) != "f":
+        return None
+    return view
+
+
+#: Upper bound of the memory kept by the buffer pool of one Shape
+_POOL_MAX_BYTES = 64 * 1024
+
+
+class _BufferPool:
+    """Reusable ctypes arrays for the transient arguments of one Shape.
+
+    Arrays are allocated with a power of two length and kept per item type and length.
+    """
+
+    __slots__ = ("_free", "_nbytes")
+
+    def __init__(self) -> None:
+        self._free: Dict[Tuple[Any, int], List[Any]] = {}
+        self._nbytes = 0
+
+    def take(self, item_type: Any, cnt: int) -> Any:
+        """Returns an array of ``item_type`` holding at least ``cnt`` items."""
+        bucket = 1 << max(cnt - 1, 0).bit_length()
+        free = self._free.get((item_type, bucket))
+        if free:
+            buf = free.pop()
+            self._nbytes -= ctypes.sizeof(buf)
+            return buf
+        return (item_type * bucket)()
+
+    def give(self, buf: Any) -> None:
+        """Returns ``buf`` to the pool if it came from _BufferPool.take()."""
+        cnt = len(buf)
+        # Only arrays owning their memory can be reused, never views of caller buffers
+        if not buf._b_needsfree_ or cnt & (cnt - 1):
+            return
+        size = ctypes.sizeof(buf)
+        if self._nbytes + size > _POOL_MAX_BYTES:
+            return
+        self._free.setdefault((buf._type_, cnt), []).append(buf)
+        self._nbytes += size
+
+
+def _cmds_arg(cmds: Any, pool: _BufferPool) -> Tuple[Any, int]:
+    """Returns ``cmds`` as a ``c_uint8`` array and its length."""
+    try:
+        view = memoryview(cmds)
+    except TypeError:
+        view = None
+    if view is None or _buffer_format(view) not in ("B", "b"):
+        cnt = len(cmds)
+        cmds_arr = pool.take(ctypes.c_uint8, cnt)
+        cmds_arr[:cnt] = cmds
+        return cmds_arr, cnt
+    return _from_view(ctypes.c_uint8 * view.nbytes, view), view.nbytes
+
+
+def _pts_arg(pts: Any, pool: _BufferPool) -> Tuple[Any, int]:
+    """Returns ``pts`` as a ``PointStruct`` array and its length."""
+    try:
+        view = memoryview(pts)
+    except TypeError:
+        cnt = len(pts)
+        pts_arr = pool.take(PointStruct, cnt)
+        pts_arr[:cnt] = pts
+        return pts_arr, cnt
+    if _buffer_format(view) not in ("f", "T{f:x:f:y:}"):
+        raise ValueError(f"Unsupported point buffer format {view.format}")
+    if view.nbytes % ctypes.sizeof(PointStruct):
+        raise ValueError("Point buffer holds an odd number of coordinates")
+    cnt = view.nbytes // ctypes.sizeof(PointStruct)
+    return _from_view(PointStruct * cnt, view), cnt
+
+
+def _append_rows(func: Any, paint: PaintPointer, rows: Any) -> Result:
+    if hasattr(rows, "tolist"):
+        # numpy arrays: convert to Python scalars in one go
+        rows = rows.tolist()
+    for row in rows:
+        result = func(paint, *row)
+        if result != Result.SUCCESS:
+            return result
+    return Result.SUCCESS
+
+
+def _wrap_gradient(
+    engine: Engine, grad: GradientPointer
+) -> Optional[Union[LinearGradient, RadialGradient]]:
+    """Wraps ``grad`` in the Gradient subclass matching its type.
+
+    The type is queried on the raw pointer, without building a temporary Gradient.
+    """
+    if grad.value is None:
+        return None
+    grad_type = ctypes.c_uint32()
+    engine.thorvg_lib.tvg_gradient_get_type(grad, ctypes.byref(grad_type))
+    if grad_type.value == TvgType.LINEAR_GRAD:
+        return LinearGradient(engine, grad)
+    elif grad_type.value == TvgType.RADIAL_GRAD:
+        return RadialGradient(engine, grad)
+    else:
+        raise RuntimeError(f"Invalid gradient TvgType: {grad_type.value}")
+
 
 class Shape(Paint):
     """
@@ -32,16 +347,41 @@ class Shape(Paint):
 
     The stroke of a shape is an optional property in case the shape needs to be represented with/without the outline borders.
     It's efficient since the shape path and the stroking path can be shared with each other. It's also convenient when controlling both in one context.
+
+    Besides the properties of Paint.apply(), Shape.apply() accepts ``fill_color``, ``fill_rule``,
+    ``gradient``, ``trimpath``, ``paint_order``, ``stroke_width``, ``stroke_color``,
+    ``stroke_gradient``, ``stroke_dash``, ``stroke_cap``, ``stroke_join`` and ``stroke_miterlimit``,
+    each applied with the matching ``set_*`` method.
+
+    .. code-block:: python
+
+        shape.apply(fill_color=(255, 0, 0, 255), stroke_width=2, stroke_dash=([7.0, 10.0], 0.0))
     """
 
+    # Applications may create thousands of shapes, so avoid a per-instance __dict__
+    __slots__ = ("_buffers", "_c_close", "_c_cubic_to", "_c_line_to", "_c_move_to")
+
     def __init__(self, engine: Engine, paint: Optional[PaintPointer] = None):
         self.engine = engine
         self.thorvg_lib = engine.thorvg_lib
+        # Per-segment path commands are called the most, so skip the
+        # self.thorvg_lib.<symbol> lookup for them
+        self._c_move_to = self.thorvg_lib.tvg_shape_move_to
+        self._c_line_to = self.thorvg_lib.tvg_shape_line_to
+        self._c_cubic_to = self.thorvg_lib.tvg_shape_cubic_to
+        self._c_close = self.thorvg_lib.tvg_shape_close
+        self._buffers: Optional[_BufferPool] = None
         if paint is None:
             self._paint = self._new()
         else:
             self._paint = paint
 
+    def _buffer_pool(self) -> _BufferPool:
+        # Created on first use, as most shapes never need one
+        if self._buffers is None:
+            self._buffers = _BufferPool()
+        return self._buffers
+
     def _new(self) -> PaintPointer:
         """Creates a new shape object.
 
@@ -50,7 +390,6 @@ class Shape(Paint):
         :return: A new shape object.
         :rtype: thorvg_python.base.PaintPointer
         """
-        self.thorvg_lib.tvg_shape_new.restype = PaintPointer
         return self.thorvg_lib.tvg_shape_new()
 
     def reset(self) -> Result:
@@ -64,8 +403,6 @@ class Shape(Paint):
         .. note::
             The memory, where the path data is stored, is not deallocated at this stage for caching effect.
         """
-        self.thorvg_lib.tvg_shape_reset.argtypes = [PaintPointer]
-        self.thorvg_lib.tvg_shape_reset.restype = Result
         return self.thorvg_lib.tvg_shape_reset(self._paint)
 
     def move_to(self, x: float, y: float) -> Result:
@@ -79,16 +416,10 @@ class Shape(Paint):
         :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_shape_move_to.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_shape_move_to.restype = Result
-        return self.thorvg_lib.tvg_shape_move_to(
+        return self._c_move_to(
             self._paint,
-            ctypes.c_float(x),
-            ctypes.c_float(y),
+            x,
+            y,
         )
 
     def line_to(self, x: float, y: float) -> Result:
@@ -106,16 +437,10 @@ class Shape(Paint):
         .. note::
             In case this is the first command in the path, it corresponds to the Shape.move_to() call.
         """
-        self.thorvg_lib.tvg_shape_line_to.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_shape_line_to.restype = Result
-        return self.thorvg_lib.tvg_shape_line_to(
+        return self._c_line_to(
             self._paint,
-            ctypes.c_float(x),
-            ctypes.c_float(y),
+            x,
+            y,
         )
 
     def cubic_to(
@@ -146,24 +471,14 @@ class Shape(Paint):
         .. note::
             In case this is the first command in the path, no data from the path are rendered.
         """
-        self.thorvg_lib.tvg_shape_cubic_to.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_shape_cubic_to.restype = Result
-        return self.thorvg_lib.tvg_shape_cubic_to(
+        return self._c_cubic_to(
             self._paint,
-            ctypes.c_float(cx1),
-            ctypes.c_float(cy1),
-            ctypes.c_float(cx2),
-            ctypes.c_float(cy2),
-            ctypes.c_float(x),
-            ctypes.c_float(y),
+            cx1,
+            cy1,
+            cx2,
+            cy2,
+            x,
+            y,
         )
 
     def close(
@@ -179,13 +494,48 @@ class Shape(Paint):
         .. note::
             In case the sub-path does not contain any points, this function has no effect.
         """
-        self.thorvg_lib.tvg_shape_close.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_shape_close.restype = Result
-        return self.thorvg_lib.tvg_shape_close(
-            self._paint,
-        )
+        return self._c_close(self._paint)
+
+    def builder(self, capacity: int = 64) -> "PathBuilder":
+        """Creates a PathBuilder appending to this shape.
+
+        The builder records ``move_to``, ``line_to``, ``cubic_to`` and ``close``
+        commands in Python and hands them to ThorVG with a single
+        Shape.append_path() call on ``flush()``, instead of one call per command.
+
+        :param int capacity: The initial number of commands and points to reserve.
+
+        :rtype: thorvg_python.paint.shape.PathBuilder
+
+        .. code-block:: python
+
+            with shape.builder() as path:
+                path.move_to(0, 0)
+                path.line_to(100, 0)
+                path.line_to(100, 100)
+                path.close()
+        """
+        return PathBuilder(self, capacity)
+
+    def append_svg_path(self, d: str) -> Result:
+        """Appends the path described by SVG path data.
+
+        The path data is parsed in Python and appended with a single Shape.append_path() call.
+        Quadratic curves and elliptical arcs are converted to cubic Bezier curves.
+
+        :param str d: The path data, as in the ``d`` attribute of an SVG ``<path>`` element,
+            e.g. ``"M10 10 h80 v80 h-80 Z"``.
+
+        :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
+        :rtype: thorvg_python.base.Result
+
+        :raises ValueError: If ``d`` is not valid path data.
+
+        .. seealso:: PathBuilder.append_svg_path()
+        """
+        builder = PathBuilder(self, max(len(d) // 4, 16))
+        builder.append_svg_path(d)
+        return builder.flush()
 
     def append_rect(
         self,
@@ -224,26 +574,15 @@ class Shape(Paint):
             For ``rx`` and ``ry`` greater than or equal to the half of ``w`` and the half of ``h``,
             respectively, the shape become an ellipse.
         """
-        self.thorvg_lib.tvg_shape_append_rect.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_shape_append_rect.restype = Result
         return self.thorvg_lib.tvg_shape_append_rect(
             self._paint,
-            ctypes.c_float(x),
-            ctypes.c_float(y),
-            ctypes.c_float(w),
-            ctypes.c_float(h),
-            ctypes.c_float(rx),
-            ctypes.c_float(ry),
-            ctypes.c_bool(cw),
+            x,
+            y,
+            w,
+            h,
+            rx,
+            ry,
+            cw,
         )
 
     def append_circle(
@@ -271,28 +610,51 @@ class Shape(Paint):
         :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_shape_append_circle.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_shape_append_circle.restype = Result
         return self.thorvg_lib.tvg_shape_append_circle(
             self._paint,
-            ctypes.c_float(cx),
-            ctypes.c_float(cy),
-            ctypes.c_float(rx),
-            ctypes.c_float(ry),
-            ctypes.c_bool(cw),
+            cx,
+            cy,
+            rx,
+            ry,
+            cw,
+        )
+
+    def append_rects(self, rects: Any) -> Result:
+        """Appends several rectangles to the path.
+
+        Equivalent to calling Shape.append_rect() for each row, stopping at the first failure.
+
+        :param rects: An iterable of ``(x, y, w, h, rx, ry, cw)`` rows, such as a list of tuples
+            or a numpy array of shape ``(N, 7)``.
+
+        :return: ``Result.SUCCESS`` if every rectangle was appended, otherwise the result of the first failure.
+        :rtype: thorvg_python.base.Result
+
+        .. seealso:: Shape.append_rect()
+        """
+        return _append_rows(self.thorvg_lib.tvg_shape_append_rect, self._paint, rects)
+
+    def append_circles(self, circles: Any) -> Result:
+        """Appends several ellipses to the path.
+
+        Equivalent to calling Shape.append_circle() for each row, stopping at the first failure.
+
+        :param circles: An iterable of ``(cx, cy, rx, ry, cw)`` rows, such as a list of tuples
+            or a numpy array of shape ``(N, 5)``.
+
+        :return: ``Result.SUCCESS`` if every ellipse was appended, otherwise the result of the first failure.
+        :rtype: thorvg_python.base.Result
+
+        .. seealso:: Shape.append_circle()
+        """
+        return _append_rows(
+            self.thorvg_lib.tvg_shape_append_circle, self._paint, circles
         )
 
     def append_path(
         self,
-        cmds: Sequence[PathCommand],
-        pts: Sequence[PointStruct],
+        cmds: Union[Sequence[PathCommand], bytes, Any],
+        pts: Union[Sequence[PointStruct], Any],
     ) -> Result:
         """Appends a given sub-path to the path.
 
@@ -300,31 +662,57 @@ class Shape(Paint):
         For each command from the ``cmds`` array, an appropriate number of points in ``pts`` array should be specified.
         If the number of points in the ``pts`` array is different than the number required by the ``cmds`` array, the shape with this sub-path will not be displayed on the screen.
 
+        Besides sequences, both arguments accept objects supporting the buffer protocol, which are passed
+        to ThorVG without converting each element:
+
+        - ``cmds``: ``bytes`` or any buffer of unsigned 8-bit integers, e.g. a ``numpy.uint8`` array.
+        - ``pts``: a ``PointStruct`` ctypes array, a numpy array of dtype ``[('x', '<f4'), ('y', '<f4')]``
+          or a ``float32`` array holding ``x, y`` pairs.
+
         :param Sequence[thorvg_python.base.PathCommand] cmds: The array of the commands in the sub-path.
         :param Sequence[thorvg_python.base.PointStruct] pts: The array of the two-dimensional points.
 
         :return: Result.INVALID_ARGUMENT A ``None`` passed as the argument or ``cmdCnt`` or ``ptsCnt`` equal to zero.
         :rtype: thorvg_python.base.Result
         """
-        cmds_arr_type = ctypes.c_uint8 * len(cmds)
-        pts_arr_type = PointStruct * len(pts)
-        cmds_arr = cmds_arr_type(*cmds)
-        pts_arr = pts_arr_type(*pts)
-        self.thorvg_lib.tvg_shape_append_path.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(cmds_arr_type),
-            ctypes.c_uint32,
-            ctypes.POINTER(pts_arr_type),
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_shape_append_path.restype = Result
-        return self.thorvg_lib.tvg_shape_append_path(
+        pool = self._buffer_pool()
+        cmds_arr, cmds_cnt = _cmds_arg(cmds, pool)
+        pts_arr, pts_cnt = _pts_arg(pts, pool)
+        result = self.thorvg_lib.tvg_shape_append_path(
             self._paint,
-            ctypes.pointer(cmds_arr),
-            ctypes.c_uint32(len(cmds)),
-            ctypes.pointer(pts_arr),
-            ctypes.c_uint32(len(pts)),
+            cmds_arr,
+            cmds_cnt,
+            pts_arr,
+            pts_cnt,
         )
+        # ThorVG copies the path, so the arrays can be reused right away
+        pool.give(cmds_arr)
+        pool.give(pts_arr)
+        return result
+
+    def _get_path_arrays(self) -> Tuple[Result, Any, Any]:
+        cmds_ptr = ctypes.POINTER(ctypes.c_uint8)()
+        cmds_cnt = ctypes.c_uint32()
+
+        pts_ptr = ctypes.POINTER(PointStruct)()
+        pts_cnt = ctypes.c_uint32()
+
+        result = self.thorvg_lib.tvg_shape_get_path(
+            self._paint,
+            ctypes.byref(cmds_ptr),
+            ctypes.byref(cmds_cnt),
+            ctypes.byref(pts_ptr),
+            ctypes.byref(pts_cnt),
+        )
+
+        cmds_arr_type = ctypes.c_uint8 * cmds_cnt.value
+        pts_arr_type = PointStruct * pts_cnt.value
+        if cmds_cnt.value == 0 or pts_cnt.value == 0:
+            return result, cmds_arr_type(), pts_arr_type()
+
+        cmds_arr = cmds_arr_type.from_address(ctypes.addressof(cmds_ptr.contents))
+        pts_arr = pts_arr_type.from_address(ctypes.addressof(pts_ptr.contents))
+        return result, cmds_arr, pts_arr
 
     def get_path(self) -> Tuple[Result, Sequence[PathCommand], Sequence[PointStruct]]:
         """Gets the points values of the path.
@@ -337,41 +725,70 @@ class Shape(Paint):
         :rtype: Sequence[thorvg_python.base.PathCommand]
         :return: A sequence of the two-dimensional points from the path.
         :rtype: Sequence[thorvg_python.base.PointStruct]
-        """
-        cmds_ptr = ctypes.POINTER(ctypes.c_uint8)()
-        cmds_cnt = ctypes.c_uint32()
 
-        pts_ptr = ctypes.POINTER(PointStruct)()
-        pts_cnt = ctypes.c_uint32()
-
-        self.thorvg_lib.tvg_shape_get_path.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-            ctypes.POINTER(ctypes.c_uint32),
-            ctypes.POINTER(ctypes.POINTER(PointStruct)),
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_shape_get_path.restype = Result
-        result = self.thorvg_lib.tvg_shape_get_path(
-            self._paint,
-            ctypes.pointer(cmds_ptr),
-            ctypes.pointer(cmds_cnt),
-            ctypes.pointer(pts_ptr),
-            ctypes.pointer(pts_cnt),
+        .. seealso:: Shape.get_path_numpy()
+        """
+        result, cmds_arr, pts_arr = self._get_path_arrays()
+        return (
+            result,
+            list(map(_CMD_LUT.__getitem__, bytes(cmds_arr))),
+            list(pts_arr),
         )
 
-        cmds_arr_type = ctypes.c_uint8 * cmds_cnt.value
-        cmds_arr = cmds_arr_type.from_address(ctypes.addressof(cmds_ptr.contents))
+    def get_path_numpy(self) -> Tuple[Result, "NDArray[Any]", "NDArray[Any]"]:
+        """Gets the points values of the path as numpy arrays.
 
-        pts_arr_type = PointStruct * pts_cnt.value
-        pts_arr = pts_arr_type.from_address(ctypes.addressof(pts_ptr.contents))
+        Unlike Shape.get_path(), no Python object is created per command or point:
+        the returned arrays are views of the path data owned by ThorVG.
 
+        :return: Result.INVALID_ARGUMENT A ``None`` passed as the argument.
+        :rtype: thorvg_python.base.Result
+        :return: The commands from the path, as ``numpy.uint8`` values of thorvg_python.base.PathCommand.
+        :rtype: numpy.ndarray
+        :return: The two-dimensional points from the path, with dtype ``[('x', '<f4'), ('y', '<f4')]``.
+        :rtype: numpy.ndarray
+
+        .. warning::
+            The arrays alias ThorVG memory. They become invalid once the path is modified
+            or the shape is freed; use ``.copy()`` to keep the data. Call ``.tolist()`` for plain Python values.
+        """
+        import numpy as np
+
+        result, cmds_arr, pts_arr = self._get_path_arrays()
         return (
             result,
-            [PathCommand(cmds_arr[i]) for i in range(cmds_cnt.value)],
-            [pts_arr[i] for i in range(pts_cnt.value)],
+            np.frombuffer(cmds_arr, dtype=np.uint8),
+            np.frombuffer(pts_arr, dtype=[("x", "<f4"), ("y", "<f4")]),
         )
 
+    def get_path_soa(
+        self,
+    ) -> Tuple[Result, "NDArray[Any]", "NDArray[Any]", "NDArray[Any]"]:
+        """Gets the points values of the path as separate x and y numpy arrays.
+
+        Same as Shape.get_path_numpy(), but the point coordinates are returned as
+        two ``numpy.float32`` arrays, ready for vectorized operations such as
+        ``xs.min()`` or ``xs * scale + tx``.
+
+        :return: Result.INVALID_ARGUMENT A ``None`` passed as the argument.
+        :rtype: thorvg_python.base.Result
+        :return: The commands from the path, as ``numpy.uint8`` values of thorvg_python.base.PathCommand.
+        :rtype: numpy.ndarray
+        :return: The x coordinates of the points from the path.
+        :rtype: numpy.ndarray
+        :return: The y coordinates of the points from the path.
+        :rtype: numpy.ndarray
+
+        .. note::
+            ``xs`` and ``ys`` are strided views of the same interleaved buffer; no data is copied.
+
+        .. warning::
+            The arrays alias ThorVG memory. They become invalid once the path is modified
+            or the shape is freed; use ``.copy()`` to keep the data.
+        """
+        result, cmds, pts = self.get_path_numpy()
+        return result, cmds, pts["x"], pts["y"]
+
     def set_stroke_width(self, width: float) -> Result:
         """Sets the stroke width for the path.
 
@@ -389,14 +806,9 @@ class Shape(Paint):
 
         .. seealso:: Shape.set_stroke_color()
         """
-        self.thorvg_lib.tvg_shape_set_stroke_width.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_width.restype = Result
         return self.thorvg_lib.tvg_shape_set_stroke_width(
             self._paint,
-            ctypes.c_float(width),
+            width,
         )
 
     def get_stroke_width(self) -> Tuple[Result, float]:
@@ -408,14 +820,9 @@ class Shape(Paint):
         :rtype: float
         """
         width = ctypes.c_float()
-        self.thorvg_lib.tvg_shape_get_stroke_width.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_width.restype = Result
         result = self.thorvg_lib.tvg_shape_get_stroke_width(
             self._paint,
-            ctypes.pointer(width),
+            ctypes.byref(width),
         )
         return result, width.value
 
@@ -444,20 +851,34 @@ class Shape(Paint):
         .. seealso:: Shape.set_stroke_width()
         .. seealso:: Shape.set_stroke_gradient()
         """
-        self.thorvg_lib.tvg_shape_set_stroke_color.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_color.restype = Result
         return self.thorvg_lib.tvg_shape_set_stroke_color(
             self._paint,
-            ctypes.c_uint8(r),
-            ctypes.c_uint8(g),
-            ctypes.c_uint8(b),
-            ctypes.c_uint8(a),
+            r,
+            g,
+            b,
+            a,
+        )
+
+    def set_stroke_color_rgba32(self, rgba: int) -> Result:
+        """Sets the shape's stroke color from a packed 32-bit color.
+
+        The channels are packed with red in the lowest byte, i.e. ``0xAABBGGRR``,
+        which is the in-memory RGBA byte order on little-endian machines.
+
+        :param int rgba: The packed color. A numpy ``uint32`` value is also accepted.
+
+        :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
+        :rtype: thorvg_python.base.Result
+
+        .. seealso:: Shape.set_stroke_color()
+        """
+        rgba = int(rgba)
+        return self.thorvg_lib.tvg_shape_set_stroke_color(
+            self._paint,
+            rgba & 0xFF,
+            (rgba >> 8) & 0xFF,
+            (rgba >> 16) & 0xFF,
+            (rgba >> 24) & 0xFF,
         )
 
     def get_stroke_color(self) -> Tuple[Result, int, int, int, int]:
@@ -476,27 +897,15 @@ class Shape(Paint):
         :return: The alpha channel value in the range [0 ~ 255], where 0 is completely transparent and 255 is opaque.
         :rtype: int
         """
-        r = ctypes.c_uint8()
-        g = ctypes.c_uint8()
-        b = ctypes.c_uint8()
-        a = ctypes.c_uint8()
-
-        self.thorvg_lib.tvg_shape_get_stroke_color.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint8),
-            ctypes.POINTER(ctypes.c_uint8),
-            ctypes.POINTER(ctypes.c_uint8),
-            ctypes.POINTER(ctypes.c_uint8),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_color.restype = Result
+        rgba = (ctypes.c_uint8 * 4)()
         result = self.thorvg_lib.tvg_shape_get_stroke_color(
             self._paint,
-            ctypes.pointer(r),
-            ctypes.pointer(g),
-            ctypes.pointer(b),
-            ctypes.pointer(a),
+            ctypes.byref(rgba, 0),
+            ctypes.byref(rgba, 1),
+            ctypes.byref(rgba, 2),
+            ctypes.byref(rgba, 3),
         )
-        return result, r.value, g.value, b.value, a.value
+        return result, rgba[0], rgba[1], rgba[2], rgba[3]
 
     def set_stroke_gradient(self, grad: "Gradient") -> Result:
         """Sets the gradient fill of the stroke for all of the figures from the path.
@@ -513,11 +922,6 @@ class Shape(Paint):
 
         .. seealso:: Shape.set_stroke_color()
         """
-        self.thorvg_lib.tvg_shape_set_stroke_gradient.argtypes = [
-            PaintPointer,
-            GradientPointer,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_gradient.restype = Result
         return self.thorvg_lib.tvg_shape_set_stroke_gradient(
             self._paint,
             grad._grad,  # type: ignore
@@ -530,35 +934,26 @@ class Shape(Paint):
 
         :return: Result.INVALID_ARGUMENT An invalid pointer passed as an argument.
         :rtype: thorvg_python.base.Result
-        :return: The gradient fill.
+        :return: The gradient fill, or ``None`` if the stroke has none.
         :rtype: Optional[thorvg_python.Gradient]
         """
         grad = GradientPointer()
-        self.thorvg_lib.tvg_shape_get_stroke_gradient.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(GradientPointer),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_gradient.restype = Result
         result = self.thorvg_lib.tvg_shape_get_stroke_gradient(
             self._paint,
-            ctypes.pointer(grad),
-        )
-        _, grad_type = Gradient(self.engine, grad).get_type()
-        if grad_type == TvgType.LINEAR_GRAD:
-            return result, LinearGradient(self.engine, grad)
-        elif grad_type == TvgType.RADIAL_GRAD:
-            return result, RadialGradient(self.engine, grad)
-        elif result != Result.SUCCESS:
+            ctypes.byref(grad),
+        )
+        if result != Result.SUCCESS:
             return result, None
-        else:
-            raise RuntimeError(f"Invalid gradient type {grad_type}")
+        return result, _wrap_gradient(self.engine, grad)
 
     def set_stroke_dash(
-        self, dash_pattern: Optional[Sequence[float]], offset: float
+        self, dash_pattern: Optional[Union[Sequence[float], Any]], offset: float
     ) -> Result:
         """Sets the shape's stroke dash pattern.
 
         :param Optional[Sequence[float]] dash_pattern: An array of alternating dash and gap lengths.
+            A ``float32`` buffer such as ``array.array('f')`` or a ``numpy.float32`` array is passed
+            to ThorVG without converting each value.
         :param float offset: The shift of the starting point within the repeating dash pattern, from which the pattern begins to be applied.
 
         :return: Result.INVALID_ARGUMENT In case ``dash_pattern`` is ``None`` and ``cnt`` > 0 or ``dash_pattern`` is not ``None`` and ``cnt`` is zero.
@@ -575,26 +970,27 @@ class Shape(Paint):
             order to form an even-length pattern, preserving the alternation of dashes and gaps.
         .. versionadded:: 1.0
         """
-        if dash_pattern is not None:
+        view = _float32_view(dash_pattern)
+        pool = None
+        if view is not None:
+            cnt = view.nbytes // ctypes.sizeof(ctypes.c_float)
+            dash_pattern_arr = _from_view(ctypes.c_float * cnt, view)
+        elif dash_pattern is not None:
             cnt = len(dash_pattern)
-            dash_pattern_type = ctypes.c_float * cnt
-            dash_pattern_type_ptr = ctypes.POINTER(dash_pattern_type)
-            dash_pattern_ptr = ctypes.pointer(dash_pattern_type(*dash_pattern))
+            pool = self._buffer_pool()
+            dash_pattern_arr = pool.take(ctypes.c_float, cnt)
+            dash_pattern_arr[:cnt] = dash_pattern
         else:
             cnt = 0
-            dash_pattern_type_ptr = ctypes.c_void_p  # type: ignore
-            dash_pattern_ptr = ctypes.c_void_p()  # type: ignore
+            dash_pattern_arr = None
 
-        self.thorvg_lib.tvg_shape_set_stroke_dash.argtypes = [
-            PaintPointer,
-            dash_pattern_type_ptr,
-            ctypes.c_uint32,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_dash.restype = Result
-        return self.thorvg_lib.tvg_shape_set_stroke_dash(
-            self._paint, dash_pattern_ptr, ctypes.c_uint32(cnt), ctypes.c_float(offset)
+        result = self.thorvg_lib.tvg_shape_set_stroke_dash(
+            self._paint, dash_pattern_arr, cnt, offset
         )
+        if pool is not None:
+            # ThorVG copies the pattern, so the array can be reused right away
+            pool.give(dash_pattern_arr)
+        return result
 
     def get_stroke_dash(self) -> Tuple[Result, Sequence[float], float]:
         """Gets the dash pattern of the stroke.
@@ -613,19 +1009,14 @@ class Shape(Paint):
         dash_pattern_ptr = ctypes.POINTER(ctypes.c_float)()
         cnt = ctypes.c_uint32()
         offset = ctypes.c_float()
-        self.thorvg_lib.tvg_shape_get_stroke_dash.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_float)),
-            ctypes.POINTER(ctypes.c_uint32),
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_dash.restype = Result
         result = self.thorvg_lib.tvg_shape_get_stroke_dash(
             self._paint,
-            ctypes.pointer(dash_pattern_ptr),
-            ctypes.pointer(cnt),
-            ctypes.pointer(offset),
+            ctypes.byref(dash_pattern_ptr),
+            ctypes.byref(cnt),
+            ctypes.byref(offset),
         )
+        if cnt.value == 0:
+            return result, [], offset.value
         dash_pattern_arr_type = ctypes.c_float * cnt.value
         dash_pattern_arr = dash_pattern_arr_type.from_address(
             ctypes.addressof(dash_pattern_ptr.contents)
@@ -645,11 +1036,6 @@ class Shape(Paint):
         :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_shape_set_stroke_cap.argtypes = [
-            PaintPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_cap.restype = Result
         return self.thorvg_lib.tvg_shape_set_stroke_cap(
             self._paint,
             cap,
@@ -664,16 +1050,11 @@ class Shape(Paint):
         :rtype: thorvg_python.base.StrokeCap
         """
         cap = ctypes.c_uint32()
-        self.thorvg_lib.tvg_shape_get_stroke_cap.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_cap.restype = Result
         result = self.thorvg_lib.tvg_shape_get_stroke_cap(
             self._paint,
-            ctypes.pointer(cap),
+            ctypes.byref(cap),
         )
-        return result, StrokeCap(cap.value)
+        return result, _CAP_LUT[cap.value]
 
     def set_stroke_join(self, join: StrokeJoin) -> Result:
         """Sets the join style for stroked path segments.
@@ -683,11 +1064,6 @@ class Shape(Paint):
         :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_shape_set_stroke_join.argtypes = [
-            PaintPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_join.restype = Result
         return self.thorvg_lib.tvg_shape_set_stroke_join(
             self._paint,
             join,
@@ -702,16 +1078,11 @@ class Shape(Paint):
         :rtype: thorvg_python.base.StrokeJoin
         """
         join = ctypes.c_uint32()
-        self.thorvg_lib.tvg_shape_get_stroke_join.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_join.restype = Result
         result = self.thorvg_lib.tvg_shape_get_stroke_join(
             self._paint,
-            ctypes.pointer(join),
+            ctypes.byref(join),
         )
-        return result, StrokeJoin(join.value)
+        return result, _JOIN_LUT[join.value]
 
     def set_stroke_miterlimit(self, miterlimit: float) -> Result:
         """Sets the stroke miterlimit.
@@ -724,11 +1095,6 @@ class Shape(Paint):
 
         .. versionadded:: 0.11
         """
-        self.thorvg_lib.tvg_shape_set_stroke_miterlimit.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_shape_set_stroke_miterlimit.restype = Result
         return self.thorvg_lib.tvg_shape_set_stroke_miterlimit(
             self._paint,
             miterlimit,
@@ -745,17 +1111,71 @@ class Shape(Paint):
         .. versionadded:: 0.11
         """
         miterlimit = ctypes.c_float()
-        self.thorvg_lib.tvg_shape_get_stroke_miterlimit.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self.thorvg_lib.tvg_shape_get_stroke_miterlimit.restype = Result
         result = self.thorvg_lib.tvg_shape_get_stroke_miterlimit(
             self._paint,
-            ctypes.pointer(miterlimit),
+            ctypes.byref(miterlimit),
         )
         return result, miterlimit.value
 
+    def configure_stroke(
+        self,
+        *,
+        width: Optional[float] = None,
+        color: Optional[Tuple[int, int, int, int]] = None,
+        gradient: "Optional[Gradient]" = None,
+        dash: Optional[Tuple[Optional[Union[Sequence[float], Any]], float]] = None,
+        cap: Optional[StrokeCap] = None,
+        join: Optional[StrokeJoin] = None,
+        miterlimit: Optional[float] = None,
+    ) -> Result:
+        """Sets several stroke properties at once.
+
+        Each given property is applied with its ``set_stroke_*`` counterpart, in the order of the parameters.
+        Properties left as ``None`` are not changed.
+
+        :param float width: See Shape.set_stroke_width().
+        :param tuple[int, int, int, int] color: The ``(r, g, b, a)`` color, see Shape.set_stroke_color().
+        :param thorvg_python.gradient.Gradient gradient: See Shape.set_stroke_gradient().
+        :param tuple dash: The ``(dash_pattern, offset)`` pair, see Shape.set_stroke_dash().
+        :param thorvg_python.base.StrokeCap cap: See Shape.set_stroke_cap().
+        :param thorvg_python.base.StrokeJoin join: See Shape.set_stroke_join().
+        :param float miterlimit: See Shape.set_stroke_miterlimit().
+
+        :return: The result of the first setter that did not succeed, or Result.SUCCESS.
+            The remaining properties are not applied after a failure.
+        :rtype: thorvg_python.base.Result
+        """
+        lib = self.thorvg_lib
+        paint = self._paint
+        result = Result.SUCCESS
+        if width is not None:
+            result = lib.tvg_shape_set_stroke_width(paint, width)
+            if result != Result.SUCCESS:
+                return result
+        if color is not None:
+            result = lib.tvg_shape_set_stroke_color(paint, *color)
+            if result != Result.SUCCESS:
+                return result
+        if gradient is not None:
+            result = self.set_stroke_gradient(gradient)
+            if result != Result.SUCCESS:
+                return result
+        if dash is not None:
+            result = self.set_stroke_dash(*dash)
+            if result != Result.SUCCESS:
+                return result
+        if cap is not None:
+            result = lib.tvg_shape_set_stroke_cap(paint, cap)
+            if result != Result.SUCCESS:
+                return result
+        if join is not None:
+            result = lib.tvg_shape_set_stroke_join(paint, join)
+            if result != Result.SUCCESS:
+                return result
+        if miterlimit is not None:
+            result = lib.tvg_shape_set_stroke_miterlimit(paint, miterlimit)
+        return result
+
     def set_trimpath(
         self,
         begin: float,
@@ -776,18 +1196,11 @@ class Shape(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_shape_set_trimpath.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_shape_set_trimpath.restype = Result
         return self.thorvg_lib.tvg_shape_set_trimpath(
             self._paint,
-            ctypes.c_float(begin),
-            ctypes.c_float(end),
-            ctypes.c_bool(simultaneous),
+            begin,
+            end,
+            simultaneous,
         )
 
     def set_fill_color(
@@ -813,22 +1226,42 @@ class Shape(Paint):
             Either a solid color or a gradient fill is applied, depending on what was set as last.
         .. seealso:: Shape.set_fill_rule()
         """
-        self.thorvg_lib.tvg_shape_set_fill_color.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_shape_set_fill_color.restype = Result
         return self.thorvg_lib.tvg_shape_set_fill_color(
             self._paint,
-            ctypes.c_uint8(r),
-            ctypes.c_uint8(g),
-            ctypes.c_uint8(b),
-            ctypes.c_uint8(a),
+            r,
+            g,
+            b,
+            a,
         )
 
+    @staticmethod
+    def set_fill_colors(shapes: Sequence["Shape"], colors: Any) -> Result:
+        """Sets the solid color of many shapes.
+
+        Equivalent to calling Shape.set_fill_color() on each shape, stopping at the first failure.
+
+        :param Sequence[thorvg_python.Shape] shapes: The shapes to color.
+        :param colors: One ``(r, g, b, a)`` row per shape, such as a list of tuples
+            or a numpy ``uint8`` array of shape ``(N, 4)``.
+
+        :return: ``Result.SUCCESS`` if every color was set, otherwise the result of the first failure.
+        :rtype: thorvg_python.base.Result
+
+        :raises ValueError: If ``shapes`` and ``colors`` differ in length.
+
+        .. seealso:: Shape.set_fill_color()
+        """
+        if hasattr(colors, "tolist"):
+            # numpy arrays: convert to Python scalars in one go
+            colors = colors.tolist()
+        if len(shapes) != len(colors):
+            raise ValueError(f"Got {len(colors)} colors for {len(shapes)} shapes")
+        for shape, color in zip(shapes, colors):
+            result = shape.thorvg_lib.tvg_shape_set_fill_color(shape._paint, *color)
+            if result != Result.SUCCESS:
+                return result
+        return Result.SUCCESS
+
     def get_fill_color(self) -> Tuple[Result, int, int, int, int]:
         """Gets the shape's solid color.
 
@@ -843,27 +1276,15 @@ class Shape(Paint):
         :return: Result.INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        r = ctypes.c_uint8()
-        g = ctypes.c_uint8()
-        b = ctypes.c_uint8()
-        a = ctypes.c_uint8()
-        self.thorvg_lib.tvg_shape_get_fill_color.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint8),
-            ctypes.POINTER(ctypes.c_uint8),
-            ctypes.POINTER(ctypes.c_uint8),
-            ctypes.POINTER(ctypes.c_uint8),
-        ]
-        self.thorvg_lib.tvg_shape_get_fill_color.restype = Result
+        rgba = (ctypes.c_uint8 * 4)()
         result = self.thorvg_lib.tvg_shape_get_fill_color(
             self._paint,
-            ctypes.pointer(r),
-            ctypes.pointer(g),
-            ctypes.pointer(b),
-            ctypes.pointer(a),
+            ctypes.byref(rgba, 0),
+            ctypes.byref(rgba, 1),
+            ctypes.byref(rgba, 2),
+            ctypes.byref(rgba, 3),
         )
-
-        return result, r.value, g.value, b.value, a.value
+        return result, rgba[0], rgba[1], rgba[2], rgba[3]
 
     def set_fill_rule(self, rule: FillRule) -> Result:
         """Sets the fill rule for the shape.
@@ -876,14 +1297,9 @@ class Shape(Paint):
         :return: TVG_RESULT_INVALID_ARGUMENT An invalid PaintPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_shape_set_fill_rule.argtypes = [
-            PaintPointer,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_shape_set_fill_rule.restype = Result
         return self.thorvg_lib.tvg_shape_set_fill_rule(
             self._paint,
-            ctypes.c_uint32(rule),
+            rule,
         )
 
     def get_fill_rule(self) -> Tuple[Result, FillRule]:
@@ -898,17 +1314,12 @@ class Shape(Paint):
         :rtype: thorvg_python.base.Result
         """
         rule = ctypes.c_uint32()
-        self.thorvg_lib.tvg_shape_get_fill_rule.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ctypes.c_uint32),
-        ]
-        self.thorvg_lib.tvg_shape_get_fill_rule.restype = Result
         result = self.thorvg_lib.tvg_shape_get_fill_rule(
             self._paint,
-            ctypes.pointer(rule),
+            ctypes.byref(rule),
         )
 
-        return result, FillRule(rule.value)
+        return result, _FILL_RULE_LUT[rule.value]
 
     def set_paint_order(self, stroke_first: bool) -> Result:
         """Sets the rendering order of the stroke and the fill.
@@ -920,14 +1331,9 @@ class Shape(Paint):
 
         .. versionadded:: 0.10
         """
-        self.thorvg_lib.tvg_shape_set_paint_order.argtypes = [
-            PaintPointer,
-            ctypes.c_bool,
-        ]
-        self.thorvg_lib.tvg_shape_set_paint_order.restype = Result
         return self.thorvg_lib.tvg_shape_set_paint_order(
             self._paint,
-            ctypes.c_bool(stroke_first),
+            stroke_first,
         )
 
     def set_gradient(self, grad: "Gradient") -> Result:
@@ -946,40 +1352,375 @@ class Shape(Paint):
             Either a solid color or a gradient fill is applied, depending on what was set as last.
         .. seealso:: Shape.set_fill_rule()
         """
-        self.thorvg_lib.tvg_shape_set_gradient.argtypes = [
-            PaintPointer,
-            GradientPointer,
-        ]
-        self.thorvg_lib.tvg_shape_set_gradient.restype = Result
         return self.thorvg_lib.tvg_shape_set_gradient(
             self._paint,
             grad._grad,  # type: ignore
         )
 
-    def get_gradient(self) -> Tuple[Result, Union["LinearGradient", "RadialGradient"]]:
+    def get_gradient(
+        self,
+    ) -> Tuple[Result, Optional[Union["LinearGradient", "RadialGradient"]]]:
         """Gets the gradient fill of the shape.
 
         The function does not allocate any data.
 
         :return: Result.INVALID_ARGUMENT An invalid pointer passed as an argument.
         :rtype: thorvg_python.base.Result
-        :return: The gradient fill.
-        :rtype: thorvg_python.base.GradientPointer
+        :return: The gradient fill, or ``None`` if the shape has none.
+        :rtype: Optional[Union[thorvg_python.LinearGradient, thorvg_python.RadialGradient]]
         """
         grad = GradientPointer()
-        self.thorvg_lib.tvg_shape_get_gradient.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(GradientPointer),
-        ]
-        self.thorvg_lib.tvg_shape_get_gradient.restype = Result
         result = self.thorvg_lib.tvg_shape_get_gradient(
             self._paint,
-            ctypes.pointer(grad),
+            ctypes.byref(grad),
         )
-        _, tvg_type = Gradient(self.engine, grad).get_type()
-        if tvg_type == TvgType.LINEAR_GRAD:
-            return result, LinearGradient(self.engine, grad)
-        elif tvg_type == TvgType.RADIAL_GRAD:
-            return result, RadialGradient(self.engine, grad)
-        else:
-            raise RuntimeError(f"Invalid gradient TvgType: {tvg_type}")
+        if result != Result.SUCCESS:
+            return result, None
+        return result, _wrap_gradient(self.engine, grad)
+
+    _SETTERS: ClassVar[Dict[str, Callable[..., Result]]] = {
+        **Paint._SETTERS,
+        "fill_color": set_fill_color,
+        "fill_rule": set_fill_rule,
+        "gradient": set_gradient,
+        "trimpath": set_trimpath,
+        "paint_order": set_paint_order,
+        "stroke_width": set_stroke_width,
+        "stroke_color": set_stroke_color,
+        "stroke_gradient": set_stroke_gradient,
+        "stroke_dash": set_stroke_dash,
+        "stroke_cap": set_stroke_cap,
+        "stroke_join": set_stroke_join,
+        "stroke_miterlimit": set_stroke_miterlimit,
+    }
+
+
+class PathBuilder:
+    """Accumulates path commands and points, then appends them to a Shape at once.
+
+    Usable as a context manager, in which case the path is flushed on exit.
+
+    .. seealso:: Shape.builder()
+    """
+
+    def __init__(self, shape: Shape, capacity: int = 64):
+        self.shape = shape
+        capacity = max(capacity, 1)
+        self._cmds = (ctypes.c_uint8 * capacity)()
+        self._pts = (PointStruct * capacity)()
+        self._cmds_cnt = 0
+        self._pts_cnt = 0
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def _reserve(self, pts_cnt: int) -> None:
+        if self._cmds_cnt == len(self._cmds):
+            cmds = (ctypes.c_uint8 * (len(self._cmds) * 2))()
+            ctypes.memmove(cmds, self._cmds, ctypes.sizeof(self._cmds))
+            self._cmds = cmds
+        if self._pts_cnt + pts_cnt > len(self._pts):
+            pts = (PointStruct * (len(self._pts) * 2 + pts_cnt))()
+            ctypes.memmove(pts, self._pts, ctypes.sizeof(self._pts))
+            self._pts = pts
+
+    def move_to(self, x: float, y: float) -> None:
+        """Records Shape.move_to()."""
+        self._reserve(1)
+        self._cmds[self._cmds_cnt] = PathCommand.MOVE_TO
+        self._cmds_cnt += 1
+        pt = self._pts[self._pts_cnt]
+        pt.x = x
+        pt.y = y
+        self._pts_cnt += 1
+
+    def line_to(self, x: float, y: float) -> None:
+        """Records Shape.line_to()."""
+        self._reserve(1)
+        self._cmds[self._cmds_cnt] = PathCommand.LINE_TO
+        self._cmds_cnt += 1
+        pt = self._pts[self._pts_cnt]
+        pt.x = x
+        pt.y = y
+        self._pts_cnt += 1
+
+    def cubic_to(
+        self,
+        cx1: float,
+        cy1: float,
+        cx2: float,
+        cy2: float,
+        x: float,
+        y: float,
+    ) -> None:
+        """Records Shape.cubic_to()."""
+        self._reserve(3)
+        self._cmds[self._cmds_cnt] = PathCommand.CUBIC_TO
+        self._cmds_cnt += 1
+        pts = self._pts
+        i = self._pts_cnt
+        pts[i].x = cx1
+        pts[i].y = cy1
+        pts[i + 1].x = cx2
+        pts[i + 1].y = cy2
+        pts[i + 2].x = x
+        pts[i + 2].y = y
+        self._pts_cnt += 3
+
+    def close(self) -> None:
+        """Records Shape.close()."""
+        self._reserve(0)
+        self._cmds[self._cmds_cnt] = PathCommand.CLOSE
+        self._cmds_cnt += 1
+
+    def append_svg_path(self, d: str) -> None:
+        """Records the commands of SVG path data.
+
+        All SVG path commands are supported, absolute and relative.
+        Quadratic curves and elliptical arcs are converted to cubic Bezier curves.
+
+        :param str d: The path data, as in the ``d`` attribute of an SVG ``<path>`` element.
+
+        :raises ValueError: If ``d`` is not valid path data.
+        """
+        _SvgPathParser(d, self).parse()
+
+    def flush(self) -> Result:
+        """Appends the recorded commands to the shape and clears the builder.
+
+        :return: Result.SUCCESS if nothing was recorded, otherwise the result of appending the path.
+        :rtype: thorvg_python.base.Result
+        """
+        if self._cmds_cnt == 0:
+            return Result.SUCCESS
+        shape = self.shape
+        result = shape.thorvg_lib.tvg_shape_append_path(
+            shape._paint,
+            self._cmds,
+            self._cmds_cnt,
+            self._pts,
+            self._pts_cnt,
+        )
+        self._cmds_cnt = 0
+        self._pts_cnt = 0
+        return result
+
+
+_SVG_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_SVG_SEPARATORS = " \t\r\n,"
+
+
+def _arc_to_cubics(
+    x1: float,
+    y1: float,
+    rx: float,
+    ry: float,
+    angle: float,
+    large_arc: bool,
+    sweep: bool,
+    x2: float,
+    y2: float,
+) -> List[Tuple[float, float, float, float, float, float]]:
+    """Approximates an SVG elliptical arc with cubic Bezier curves.
+
+    Follows the endpoint to center parameterization of the SVG specification,
+    using one curve per quarter turn at most.
+    """
+    phi = math.radians(angle)
+    cos_phi = math.cos(phi)
+    sin_phi = math.sin(phi)
+
+    dx = (x1 - x2) / 2
+    dy = (y1 - y2) / 2
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+
+    rx = abs(rx)
+    ry = abs(ry)
+    scale = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if scale > 1:
+        rx *= math.sqrt(scale)
+        ry *= math.sqrt(scale)
+
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    den = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coef = math.sqrt(max(0.0, num / den))
+    if large_arc == sweep:
+        coef = -coef
+    cxp = coef * rx * y1p / ry
+    cyp = -coef * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+
+    ux = (x1p - cxp) / rx
+    uy = (y1p - cyp) / ry
+    vx = (-x1p - cxp) / rx
+    vy = (-y1p - cyp) / ry
+    theta = math.atan2(uy, ux)
+    delta = math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    segments = max(1, math.ceil(abs(delta) / (math.pi / 2) - 1e-9))
+    step = delta / segments
+    t = 4 / 3 * math.tan(step / 4)
+
+    def point(ex: float, ey: float) -> Tuple[float, float]:
+        return (
+            cx + rx * cos_phi * ex - ry * sin_phi * ey,
+            cy + rx * sin_phi * ex + ry * cos_phi * ey,
+        )
+
+    curves: List[Tuple[float, float, float, float, float, float]] = []
+    for i in range(segments):
+        a1 = theta + i * step
+        a2 = a1 + step
+        cos1, sin1 = math.cos(a1), math.sin(a1)
+        cos2, sin2 = math.cos(a2), math.sin(a2)
+        c1 = point(cos1 - t * sin1, sin1 + t * cos1)
+        c2 = point(cos2 + t * sin2, sin2 - t * cos2)
+        end = point(cos2, sin2)
+        curves.append((*c1, *c2, *end))
+    # Land exactly on the requested end point
+    curves[-1] = curves[-1][:4] + (x2, y2)
+    return curves
+
+
+class _SvgPathParser:
+    """Parses SVG path data into a PathBuilder."""
+
+    def __init__(self, d: str, builder: PathBuilder):
+        self.d = d
+        self.pos = 0
+        self.builder = builder
+
+    def _skip(self) -> None:
+        d = self.d
+        while self.pos < len(d) and d[self.pos] in _SVG_SEPARATORS:
+            self.pos += 1
+
+    def _number(self) -> float:
+        self._skip()
+        match = _SVG_NUMBER.match(self.d, self.pos)
+        if match is None:
+            raise ValueError(f"Expected a number at position {self.pos} of {self.d!r}")
+        self.pos = match.end()
+        return float(match.group())
+
+    def _flag(self) -> bool:
+        self._skip()
+        if self.pos >= len(self.d) or self.d[self.pos] not in "01":
+            raise ValueError(f"Expected a flag at position {self.pos} of {self.d!r}")
+        self.pos += 1
+        return self.d[self.pos - 1] == "1"
+
+    def parse(self) -> None:
+        builder = self.builder
+        d = self.d
+        cmd: Optional[str] = None
+        x = y = 0.0  # current point
+        start_x = start_y = 0.0  # start of the current sub-path
+        ctrl_x = ctrl_y = 0.0  # last control point, for S and T
+        last = ""
+
+        while True:
+            self._skip()
+            if self.pos >= len(d):
+                break
+            if d[self.pos].isalpha():
+                cmd = d[self.pos]
+                self.pos += 1
+            elif cmd is None:
+                raise ValueError(f"Expected a command at position {self.pos} of {d!r}")
+
+            upper = cmd.upper()
+            if not last and upper != "M":
+                raise ValueError(f"Path data must start with a moveto, got {d!r}")
+            ox, oy = (x, y) if cmd.islower() else (0.0, 0.0)
+
+            if upper == "Z":
+                builder.close()
+                x, y = start_x, start_y
+                cmd = None
+            elif upper == "M":
+                x = self._number() + ox
+                y = self._number() + oy
+                builder.move_to(x, y)
+                start_x, start_y = x, y
+                # Coordinates following a moveto are implicit lineto commands
+                cmd = "l" if cmd == "m" else "L"
+            elif upper == "L":
+                x = self._number() + ox
+                y = self._number() + oy
+                builder.line_to(x, y)
+            elif upper == "H":
+                x = self._number() + ox
+                builder.line_to(x, y)
+            elif upper == "V":
+                y = self._number() + oy
+                builder.line_to(x, y)
+            elif upper in ("C", "S"):
+                if upper == "C":
+                    cx1 = self._number() + ox
+                    cy1 = self._number() + oy
+                elif last in ("C", "S"):
+                    cx1, cy1 = 2 * x - ctrl_x, 2 * y - ctrl_y
+                else:
+                    cx1, cy1 = x, y
+                ctrl_x = self._number() + ox
+                ctrl_y = self._number() + oy
+                x = self._number() + ox
+                y = self._number() + oy
+                builder.cubic_to(cx1, cy1, ctrl_x, ctrl_y, x, y)
+            elif upper in ("Q", "T"):
+                if upper == "Q":
+                    qx = self._number() + ox
+                    qy = self._number() + oy
+                elif last in ("Q", "T"):
+                    qx, qy = 2 * x - ctrl_x, 2 * y - ctrl_y
+                else:
+                    qx, qy = x, y
+                x0, y0 = x, y
+                x = self._number() + ox
+                y = self._number() + oy
+                builder.cubic_to(
+                    x0 + 2 / 3 * (qx - x0),
+                    y0 + 2 / 3 * (qy - y0),
+                    x + 2 / 3 * (qx - x),
+                    y + 2 / 3 * (qy - y),
+                    x,
+                    y,
+                )
+                ctrl_x, ctrl_y = qx, qy
+            elif upper == "A":
+                rx = self._number()
+                ry = self._number()
+                angle = self._number()
+                large_arc = self._flag()
+                sweep = self._flag()
+                x0, y0 = x, y
+                x = self._number() + ox
+                y = self._number() + oy
+                if x == x0 and y == y0:
+                    pass
+                elif rx == 0 or ry == 0:
+                    builder.line_to(x, y)
+                else:
+                    for curve in _arc_to_cubics(
+                        x0, y0, rx, ry, angle, large_arc, sweep, x, y
+                    ):
+                        builder.cubic_to(*curve)
+            else:
+                raise ValueError(f"Unknown path command {cmd!r} in {d!r}")
+            last = upper
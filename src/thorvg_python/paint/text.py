@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Optional, Tuple
+import functools
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Union
 
 from ..base import (
     GlyphMetrics,
@@ -10,9 +12,74 @@ from ..base import (
     TextMetrics,
     TextWrap,
 )
-from ..engine import Engine
+from ..engine import Engine, _get_executor, register_signatures
 from ..gradient import Gradient
 from . import Paint
+from .picture import _buffer_arg
+
+register_signatures(
+    {
+        "tvg_text_new": (PaintPointer, ()),
+        "tvg_text_set_font": (Result, (PaintPointer, ctypes.c_char_p)),
+        "tvg_text_set_size": (Result, (PaintPointer, ctypes.c_float)),
+        "tvg_text_set_text": (Result, (PaintPointer, ctypes.c_char_p)),
+        "tvg_text_get_text": (ctypes.c_char_p, (PaintPointer,)),
+        "tvg_text_align": (Result, (PaintPointer, ctypes.c_float, ctypes.c_float)),
+        "tvg_text_layout": (Result, (PaintPointer, ctypes.c_float, ctypes.c_float)),
+        "tvg_text_wrap_mode": (Result, (PaintPointer, ctypes.c_uint32)),
+        "tvg_text_line_count": (ctypes.c_uint32, (PaintPointer,)),
+        "tvg_text_spacing": (Result, (PaintPointer, ctypes.c_float, ctypes.c_float)),
+        "tvg_text_set_italic": (Result, (PaintPointer, ctypes.c_float)),
+        "tvg_text_set_outline": (
+            Result,
+            (
+                PaintPointer,
+                ctypes.c_float,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+                ctypes.c_uint8,
+            ),
+        ),
+        "tvg_text_set_color": (
+            Result,
+            (PaintPointer, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8),
+        ),
+        "tvg_text_set_gradient": (Result, (PaintPointer, GradientPointer)),
+        "tvg_text_get_text_metrics": (
+            Result,
+            (PaintPointer, ctypes.POINTER(TextMetrics)),
+        ),
+        "tvg_text_get_glyph_metrics": (
+            Result,
+            (PaintPointer, ctypes.c_char_p, ctypes.POINTER(GlyphMetrics)),
+        ),
+        "tvg_font_load": (Result, (ctypes.c_char_p,)),
+        "tvg_font_load_data": (
+            Result,
+            (
+                ctypes.c_char_p,
+                ctypes.c_void_p,
+                ctypes.c_uint32,
+                ctypes.c_char_p,
+                ctypes.c_bool,
+            ),
+        ),
+        "tvg_font_unload": (Result, (ctypes.c_char_p,)),
+    }
+)
+
+#: Font data loaded with ``copy=False``, kept alive until unloaded by name.
+_font_data: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _encode(s: str) -> bytes:
+    """Encodes font names, paths and mimetypes, which are passed again and again.
+
+    Only the encoding is cached. The C calls are always made, so a font that was
+    unloaded is loaded again on the next call.
+    """
+    return s.encode()
 
 
 class Text(Paint):
@@ -20,11 +87,23 @@ class Text(Paint):
     Text API
 
     A class to represent text objects in a graphical context, allowing for rendering and manipulation of unicode text.
+
+    Besides the properties of Paint.apply(), Text.apply() accepts ``font``, ``size``, ``text``,
+    ``color``, ``gradient``, ``outline``, ``italic``, ``align``, ``layout``, ``spacing``
+    and ``wrap_mode``, each applied with the matching method.
+
+    .. code-block:: python
+
+        text.apply(font="Arial", size=32, text="Hello", color=(0, 0, 0))
     """
 
     def __init__(self, engine: Engine, paint: Optional[PaintPointer] = None):
         self.engine = engine
         self.thorvg_lib = engine.thorvg_lib
+        # Last string passed to set_text() and its encoding, as labels such
+        # as counters are often set again with the same text on every frame
+        self._text = ""
+        self._text_bytes = b""
         if paint is None:
             self._paint = self._new()
         else:
@@ -43,7 +122,6 @@ class Text(Paint):
 
         .. note:: You need not call this method as it is auto called when initializing ``Text()``.
         """
-        self.thorvg_lib.tvg_text_new.restype = PaintPointer
         return self.thorvg_lib.tvg_text_new()
 
     def set_font(
@@ -71,24 +149,10 @@ class Text(Paint):
 
         .. versionadded:: 1.0
         """
-        if name is not None and name != "":
-            name_bytes = name.encode() + b"\x00"
-            name_arr_type = ctypes.c_char * len(name_bytes)
-            name_arr_type_ptr = ctypes.POINTER(name_arr_type)
-            name_arr = name_arr_type.from_buffer_copy(name_bytes)
-            name_arr_ptr = ctypes.pointer(name_arr)
-        else:
-            name_arr_type_ptr = ctypes.c_void_p  # type: ignore
-            name_arr_ptr = ctypes.c_void_p()  # type: ignore
-
-        self.thorvg_lib.tvg_text_set_font.argtypes = [
-            PaintPointer,
-            name_arr_type_ptr,
-        ]
-        self.thorvg_lib.tvg_text_set_font.restype = Result
+        # c_char_p passes None as NULL, which selects the fallback font
         return self.thorvg_lib.tvg_text_set_font(
             self._paint,
-            name_arr_ptr,
+            _encode(name) if name else None,
         )
 
     def set_size(self, size: float) -> Result:
@@ -114,14 +178,9 @@ class Text(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_text_set_size.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_text_set_size.restype = Result
         return self.thorvg_lib.tvg_text_set_size(
             self._paint,
-            ctypes.c_float(size),
+            size,
         )
 
     def set_text(
@@ -140,17 +199,12 @@ class Text(Paint):
         .. seealso:: Text.get_text()
         .. versionadded: 1.0
         """
-        utf8_bytes = utf8.encode() + b"\x00"
-        text_arr_type = ctypes.c_char * len(utf8_bytes)
-        text_arr = text_arr_type.from_buffer_copy(utf8_bytes)
-        self.thorvg_lib.tvg_text_set_text.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(text_arr_type),
-        ]
-        self.thorvg_lib.tvg_text_set_text.restype = Result
+        if utf8 != self._text:
+            self._text_bytes = utf8.encode()
+            self._text = utf8
         return self.thorvg_lib.tvg_text_set_text(
             self._paint,
-            ctypes.pointer(text_arr),
+            self._text_bytes,
         )
 
     def get_text(self) -> str:
@@ -167,14 +221,11 @@ class Text(Paint):
         .. note::
             Experimental API
         """
-        self.thorvg_lib.tvg_text_set_text.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_text_set_text.restype = ctypes.c_char_p
 
-        return self.thorvg_lib.tvg_text_set_text(
+        text = self.thorvg_lib.tvg_text_get_text(
             self._paint,
-        ).decode("utf-8")
+        )
+        return "" if text is None else text.decode("utf-8")
 
     def align(self, x: float, y: float) -> Result:
         """Sets text alignment or anchor per axis.
@@ -190,16 +241,10 @@ class Text(Paint):
 
         .. seealso:: Text.layout()
         """
-        self.thorvg_lib.tvg_text_align.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_text_align.restype = Result
         return self.thorvg_lib.tvg_text_align(
             self._paint,
-            ctypes.c_float(x),
-            ctypes.c_float(y),
+            x,
+            y,
         )
 
     def layout(self, w: float, h: float) -> Result:
@@ -219,16 +264,10 @@ class Text(Paint):
         .. seealso:: Text.align()
         .. seealso:: Text.spacing()
         """
-        self.thorvg_lib.tvg_text_layout.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_text_layout.restype = Result
         return self.thorvg_lib.tvg_text_layout(
             self._paint,
-            ctypes.c_float(w),
-            ctypes.c_float(h),
+            w,
+            h,
         )
 
     def wrap_mode(self, mode: TextWrap) -> Result:
@@ -244,11 +283,6 @@ class Text(Paint):
         .. seealso:: Text.line_count()
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_text_wrap_mode.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_text_wrap_mode.restype = Result
         return self.thorvg_lib.tvg_text_wrap_mode(
             self._paint,
             mode,
@@ -268,11 +302,7 @@ class Text(Paint):
         .. note::
             Experimental API
         """
-        self.thorvg_lib.tvg_text_wrap_mode.argtypes = [
-            PaintPointer,
-        ]
-        self.thorvg_lib.tvg_text_wrap_mode.restype = ctypes.c_uint32
-        return self.thorvg_lib.tvg_text_wrap_mode(
+        return self.thorvg_lib.tvg_text_line_count(
             self._paint,
         )
 
@@ -296,16 +326,10 @@ class Text(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_text_spacing.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_text_spacing.restype = Result
         return self.thorvg_lib.tvg_text_spacing(
             self._paint,
-            ctypes.c_float(letter),
-            ctypes.c_float(line),
+            letter,
+            line,
         )
 
     def set_italic(self, shear: float) -> Result:
@@ -335,14 +359,9 @@ class Text(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_text_set_italic.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-        ]
-        self.thorvg_lib.tvg_text_set_italic.restype = Result
         return self.thorvg_lib.tvg_text_set_italic(
             self._paint,
-            ctypes.c_float(shear),
+            shear,
         )
 
     def set_outline(self, width: float, r: int, g: int, b: int) -> Result:
@@ -362,20 +381,12 @@ class Text(Paint):
 
         .. versionadded:: 1.0
         """
-        self.thorvg_lib.tvg_text_set_outline.argtypes = [
-            PaintPointer,
-            ctypes.c_float,
-            ctypes.c_int8,
-            ctypes.c_int8,
-            ctypes.c_int8,
-        ]
-        self.thorvg_lib.tvg_text_set_outline.restype = Result
         return self.thorvg_lib.tvg_text_set_outline(
             self._paint,
-            ctypes.c_float(width),
-            ctypes.c_int8(r),
-            ctypes.c_int8(g),
-            ctypes.c_int8(b),
+            width,
+            r,
+            g,
+            b,
         )
 
     def set_color(
@@ -400,18 +411,11 @@ class Text(Paint):
 
         .. versionadded:: 0.15
         """
-        self.thorvg_lib.tvg_text_set_color.argtypes = [
-            PaintPointer,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-            ctypes.c_uint8,
-        ]
-        self.thorvg_lib.tvg_text_set_color.restype = Result
         return self.thorvg_lib.tvg_text_set_color(
             self._paint,
-            ctypes.c_uint8(r),
-            ctypes.c_uint8(g),
-            ctypes.c_uint8(b),
+            r,
+            g,
+            b,
         )
 
     def set_gradient(
@@ -433,11 +437,6 @@ class Text(Paint):
 
         .. versionadded:: 0.15
         """
-        self.thorvg_lib.tvg_text_set_gradient.argtypes = [
-            PaintPointer,
-            GradientPointer,
-        ]
-        self.thorvg_lib.tvg_text_set_gradient.restype = Result
         return self.thorvg_lib.tvg_text_set_gradient(
             self._paint,
             gradient._grad,  # type: ignore
@@ -462,14 +461,9 @@ class Text(Paint):
             Experimental API
         """
         metrics = TextMetrics()
-        self.thorvg_lib.tvg_text_get_text_metrics.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(TextMetrics),
-        ]
-        self.thorvg_lib.tvg_text_get_text_metrics.restype = Result
         result = self.thorvg_lib.tvg_text_get_text_metrics(
             self._paint,
-            ctypes.pointer(metrics),
+            ctypes.byref(metrics),
         )
         return result, metrics
 
@@ -499,20 +493,10 @@ class Text(Paint):
         """
         metrics = GlyphMetrics()
 
-        ch_bytes = ch.encode() + b"\x00"
-        ch_arr_type = ctypes.c_char * len(ch_bytes)
-        ch_arr = ch_arr_type.from_buffer_copy(ch_bytes)
-
-        self.thorvg_lib.tvg_text_get_glyph_metrics.argtypes = [
-            PaintPointer,
-            ctypes.POINTER(ch_arr_type),
-            ctypes.POINTER(GlyphMetrics),
-        ]
-        self.thorvg_lib.tvg_text_get_glyph_metrics.restype = Result
         result = self.thorvg_lib.tvg_text_get_glyph_metrics(
             self._paint,
-            ctypes.pointer(ch_arr),
-            ctypes.pointer(metrics),
+            ch.encode(),
+            ctypes.byref(metrics),
         )
         return result, metrics
 
@@ -533,23 +517,44 @@ class Text(Paint):
             - Result.NOT_SUPPORTED When trying to load a file with an unknown extension.
         :rtype: thorvg_python.base.Result
 
+        .. note::
+            The GIL is released while ThorVG parses the font.
         .. seealso:: Engine.font_unload()
 
         .. versionadded:: 0.15
         """
-        path_bytes = path.encode() + b"\x00"
-        path_arr_type = ctypes.c_char * len(path_bytes)
-        path_arr = path_arr_type.from_buffer_copy(path_bytes)
-        self.thorvg_lib.tvg_font_load.argtypes = [
-            ctypes.POINTER(path_arr_type),
-        ]
-        self.thorvg_lib.tvg_font_load.restype = Result
-        return self.thorvg_lib.tvg_font_load(ctypes.pointer(path_arr))
+        return self.thorvg_lib.tvg_font_load(_encode(path))
+
+    def font_load_async(
+        self,
+        path: str,
+        executor: Optional[Executor] = None,
+    ) -> "Future[Result]":
+        """Loads a scalable font data from a file on a worker thread.
+
+        Since the GIL is released during ``Text.font_load()``, several fonts may be
+        loaded in parallel while the calling thread keeps working.
+
+        :param str path: The path to the font file.
+        :param Optional[concurrent.futures.Executor] executor: The executor to run
+            the load on. If ``None``, a thread pool shared by the module is used.
+
+        :return: A future resolving to the result of ``Text.font_load()``.
+        :rtype: concurrent.futures.Future
+
+        .. note::
+            The font must not be set until the returned future is done.
+
+        .. seealso:: Text.font_load()
+        """
+        if executor is None:
+            executor = _get_executor()
+        return executor.submit(self.font_load, path)
 
     def font_load_data(
         self,
         name: str,
-        data: bytes,
+        data: Optional[Union[bytes, bytearray, memoryview]],
         mimetype: Optional[str],
         copy: bool,
     ) -> Result:
@@ -560,7 +565,7 @@ class Text(Paint):
         Instead, ThorVG will reuse the previously loaded font data.
 
         :param str name: The name under which the font will be stored and accessible (e.x. in a ``Text.set_font`` API).
-        :param bytes data: A pointer to a memory location where the content of the font data is stored.
+        :param Optional[Union[bytes, bytearray, memoryview]] data: A pointer to a memory location where the content of the font data is stored.
         :param str mimetype: Mimetype or extension of font data. In case a ``None`` or an empty "" value is provided the loader will be determined automatically.
         :param bool copy: If ``true`` the data are copied into the engine local buffer, otherwise they are not (default).
 
@@ -570,43 +575,36 @@ class Text(Paint):
             - Result.INSUFFICIENT_CONDITION When trying to unload the font data that has not been previously loaded.
         :rtype: thorvg_python.base.Result
 
-        .. warning::
-            : It's the user responsibility to release the ``data`` memory.
+        .. note::
+            ``data`` is handed to ThorVG without being copied. When ``copy`` is ``false``,
+            a reference to it is kept until the font is unloaded, so a ``bytearray``
+            passed this way must not be resized in the meantime.
 
         .. note::
             To unload the font data loaded using this API, pass the proper ``name`` and ``None`` as ``data``.
+        .. note::
+            The GIL is released while ThorVG parses ``data``.
 
         .. versionadded:: 0.15
         """
-        name_bytes = name.encode() + b"\x00"
-        name_bytes += b"\x00"
-        name_char_type = ctypes.c_char * len(name_bytes)
-        name_char = name_char_type.from_buffer_copy(name_bytes)
-        data_arr_type = ctypes.c_ubyte * len(data)
-        data_arr = data_arr_type.from_buffer_copy(data)
-        if mimetype is not None and mimetype != "":
-            mimetype_bytes = name.encode() + b"\x00"
-            mimetype_char_type = ctypes.c_char * len(mimetype_bytes)
-            mimetype_char_ptr_type = ctypes.POINTER(mimetype_char_type)
-            mimetype_char = mimetype_char_type.from_buffer_copy(mimetype_bytes)
-            mimetype_char_ptr = ctypes.pointer(mimetype_char)
-        else:
-            mimetype_char_ptr_type = ctypes.c_void_p  # type: ignore
-            mimetype_char_ptr = ctypes.c_void_p()  # type: ignore
-        self.thorvg_lib.tvg_picture_load_raw.argtypes = [
-            ctypes.POINTER(name_char_type),
-            ctypes.POINTER(data_arr_type),
-            ctypes.c_uint32,
-            mimetype_char_ptr_type,
-            ctypes.c_bool,
-        ]
-        return self.thorvg_lib.tvg_picture_load_raw(
-            ctypes.pointer(name_char),
-            ctypes.pointer(data_arr),
-            ctypes.c_uint32(ctypes.sizeof(data_arr)),
-            mimetype_char_ptr,
-            ctypes.c_bool(copy),
+        if data is None:
+            result = self.thorvg_lib.tvg_font_load_data(
+                _encode(name), None, 0, None, copy
+            )
+            if result == Result.SUCCESS:
+                _font_data.pop(name, None)
+            return result
+        data_ptr = _buffer_arg(data)
+        result = self.thorvg_lib.tvg_font_load_data(
+            _encode(name),
+            data_ptr,
+            memoryview(data).nbytes,
+            _encode(mimetype) if mimetype else None,
+            copy,
         )
+        if result == Result.SUCCESS and not copy:
+            _font_data[name] = data_ptr
+        return result
 
     def font_unload(
         self,
@@ -627,11 +625,19 @@ class Text(Paint):
 
         .. versionadded:: 0.15
         """
-        path_bytes = path.encode() + b"\x00"
-        path_arr_type = ctypes.c_char * len(path_bytes)
-        path_arr = path_arr_type.from_buffer_copy(path_bytes)
-        self.thorvg_lib.tvg_font_unload.argtypes = [
-            ctypes.POINTER(path_arr_type),
-        ]
-        self.thorvg_lib.tvg_font_unload.restype = Result
-        return self.thorvg_lib.tvg_font_unload(ctypes.pointer(path_arr))
+        return self.thorvg_lib.tvg_font_unload(_encode(path))
+
+    _SETTERS: ClassVar[Dict[str, Callable[..., Result]]] = {
+        **Paint._SETTERS,
+        "font": set_font,
+        "size": set_size,
+        "text": set_text,
+        "color": set_color,
+        "gradient": set_gradient,
+        "outline": set_outline,
+        "italic": set_italic,
+        "align": align,
+        "layout": layout,
+        "spacing": spacing,
+        "wrap_mode": wrap_mode,
+    }
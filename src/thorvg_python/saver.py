@@ -1,12 +1,61 @@
 #!/usr/bin/env python3
 import ctypes
-from typing import Optional
+import os
+import threading
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .animation import Animation
 from .base import AnimationPointer, PaintPointer, Result, SaverPointer
-from .engine import Engine
+from .engine import Engine, _get_executor, register_signatures
 from .paint import Paint
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+#: Anything accepted as a save path.
+_PathType = Union[str, bytes, "os.PathLike[str]", "os.PathLike[bytes]"]
+
+register_signatures(
+    {
+        "tvg_saver_new": (SaverPointer, ()),
+        "tvg_saver_save_paint": (
+            Result,
+            (
+                SaverPointer,
+                PaintPointer,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+            ),
+        ),
+        "tvg_saver_save_animation": (
+            Result,
+            (
+                SaverPointer,
+                AnimationPointer,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+            ),
+        ),
+        "tvg_saver_sync": (Result, (SaverPointer,)),
+        "tvg_saver_del": (Result, (SaverPointer,)),
+    }
+)
+
 
 class Saver:
     """
@@ -16,16 +65,44 @@ class Saver:
 
     The module enables to save the composed scene and/or image from a paint object.
     Once it's successfully exported to a file, it can be recreated using the Picture module.
+
+    A saver created by this class is deleted when it is garbage collected, or when
+    leaving a ``with`` block. Deleting a saver waits for any pending save to finish.
     """
 
+    #: Number of encoded paths kept by each saver.
+    PATH_CACHE_SIZE = 16
+
     def __init__(self, engine: Engine, saver: Optional[SaverPointer] = None):
         self.engine = engine
         self.thorvg_lib = engine.thorvg_lib
+        self._path_cache: Dict[str, bytes] = {}
+        # A saver runs one save at a time; held by the *_async() workers
+        self._lock = threading.Lock()
+        # Savers passed in are owned by the caller and never deleted here
+        self._owns_saver = saver is None
+        self._saver: Optional[SaverPointer]
         if saver is None:
             self._saver = self._new()
         else:
             self._saver = saver
 
+    def __del__(self) -> None:
+        if getattr(self, "_owns_saver", False) and self._saver is not None:
+            self._del()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if self._saver is not None:
+            self._del()
+
     def _new(self) -> SaverPointer:
         """Creates a new SaverPointer object.
 
@@ -34,13 +111,37 @@ class Saver:
 
         .. note:: You need not call this method as it is auto called when initializing ``Saver()``.
         """
-        self.thorvg_lib.tvg_saver_new.restype = SaverPointer
         return self.thorvg_lib.tvg_saver_new()
 
+    def _encode_path(self, path: _PathType) -> bytes:
+        path = os.fspath(path)
+        if isinstance(path, bytes):
+            return path
+        # Frame dumps often save to the same few paths over and over
+        path_bytes = self._path_cache.get(path)
+        if path_bytes is None:
+            path_bytes = os.fsencode(path)
+            if len(self._path_cache) >= self.PATH_CACHE_SIZE:
+                # Dicts keep insertion order, so this evicts the oldest entry
+                del self._path_cache[next(iter(self._path_cache))]
+            self._path_cache[path] = path_bytes
+        return path_bytes
+
+    def _invoke_save(
+        self,
+        func: Callable[..., Result],
+        obj: Union[PaintPointer, AnimationPointer],
+        path: _PathType,
+        *args: int,
+    ) -> Result:
+        # Shared by the save_*() methods, which differ only in the C function,
+        # the object saved and the trailing integer settings
+        return func(self._saver, obj, self._encode_path(path), *args)
+
     def save_paint(
         self,
         paint: Paint,
-        path: str,
+        path: _PathType,
         quality: int,
     ) -> Result:
         """Exports the given ``paint`` data to the given ``path``
@@ -50,7 +151,7 @@ class Saver:
         if you wish to optimize for speed.
 
         :param thorvg_python.paint.Paint paint: The paint to be saved with all its associated properties.
-        :param str path: A path to the file, in which the paint data is to be saved.
+        :param Union[str, bytes, os.PathLike] path: A path to the file, in which the paint data is to be saved.
         :param bool quality: If ``true`` then compress data if possible.
 
         :return:
@@ -62,29 +163,91 @@ class Saver:
 
         .. note::
             Saving can be asynchronous if the assigned thread number is greater than zero. To guarantee the saving is done, call Saver.sync() afterwards.
+        .. note::
+            The GIL is released while ThorVG encodes and writes the file.
         .. seealso:: Saver.sync()
         """
-        path_bytes = path.encode() + b"\x00"
-        path_arr_type = ctypes.c_char * len(path)
-        path_arr = path_arr_type.from_buffer_copy(path_bytes)
-        self.thorvg_lib.tvg_saver_save_paint.argtypes = [
-            SaverPointer,
-            PaintPointer,
-            ctypes.POINTER(path_arr_type),
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_saver_save_paint.restype = Result
-        return self.thorvg_lib.tvg_saver_save_paint(
-            self._saver,
+        return self._invoke_save(
+            self.thorvg_lib.tvg_saver_save_paint,
             paint._paint,  # type: ignore
-            ctypes.pointer(path_arr),
-            ctypes.c_uint32(quality),
+            path,
+            quality,
         )
 
+    def save_paint_async(
+        self,
+        paint: Paint,
+        path: _PathType,
+        quality: int,
+        executor: Optional[Executor] = None,
+    ) -> "Future[Result]":
+        """Exports the given ``paint`` on a worker thread and waits for it to finish.
+
+        The worker calls Saver.save_paint() and then Saver.sync(), so the calling
+        thread can prepare the next frame meanwhile. Saves submitted to the same
+        saver run one after another.
+
+        :param thorvg_python.paint.Paint paint: The paint to be saved with all its associated properties.
+        :param Union[str, bytes, os.PathLike] path: A path to the file, in which the paint data is to be saved.
+        :param int quality: The encoded quality level.
+        :param Optional[concurrent.futures.Executor] executor: The executor to run
+            the save on. If ``None``, a thread pool shared by the module is used.
+
+        :return: A future resolving to the result of Saver.save_paint(), or to the
+            result of Saver.sync() if saving started successfully.
+        :rtype: concurrent.futures.Future
+
+        .. seealso:: Saver.save_paint()
+        """
+        if executor is None:
+            executor = _get_executor()
+        return executor.submit(self._save_paint_sync, paint, path, quality)
+
+    def _save_paint_sync(self, paint: Paint, path: _PathType, quality: int) -> Result:
+        with self._lock:
+            result = self.save_paint(paint, path, quality)
+            if result == Result.SUCCESS:
+                result = self.sync()
+            return result
+
+    def save_paints(
+        self,
+        items: Iterable[Tuple[Paint, _PathType]],
+        quality: int,
+    ) -> List[Result]:
+        """Exports each paint of ``items`` to its own path.
+
+        A saver handles one saving task at a time, so every save is followed by
+        Saver.sync() before the next one starts.
+
+        :param Iterable[Tuple[thorvg_python.paint.Paint, Union[str, bytes, os.PathLike]]] items: The paints to be saved, with the path to save each to.
+        :param int quality: The encoded quality level, applied to every paint.
+
+        :return: The result of each save, in the order of ``items``. When saving succeeds,
+            the result of the following Saver.sync() is reported instead.
+        :rtype: List[thorvg_python.base.Result]
+
+        .. seealso:: Saver.save_paint()
+        """
+        save = self.thorvg_lib.tvg_saver_save_paint
+        sync = self.thorvg_lib.tvg_saver_sync
+        results: List[Result] = []
+        for paint, path in items:
+            result = self._invoke_save(
+                save,
+                paint._paint,  # type: ignore
+                path,
+                quality,
+            )
+            if result == Result.SUCCESS:
+                result = sync(self._saver)
+            results.append(result)
+        return results
+
     def save_animation(
         self,
         animation: Animation,
-        path: str,
+        path: _PathType,
         quality: int,
         fps: int,
     ) -> Result:
@@ -95,7 +258,7 @@ class Saver:
         if you wish to optimize for speed.
 
         :param thorvg_python.animation.Animation animation: The animation to be saved with all its associated properties.
-        :param str path: A path to the file, in which the animation data is to be saved.
+        :param Union[str, bytes, os.PathLike] path: A path to the file, in which the animation data is to be saved.
         :param int quality: The encoded quality level. ``0`` is the minimum, ``100`` is the maximum value(recommended).
         :param int fps: The frames per second for the animation. If ``0``, the default fps is used.
 
@@ -110,28 +273,19 @@ class Saver:
             A higher frames per second (FPS) would result in a larger file size. It is recommended to use the default value.
         .. note::
             Saving can be asynchronous if the assigned thread number is greater than zero. To guarantee the saving is done, call Saver.sync() afterwards.
+        .. note::
+            The GIL is released while ThorVG encodes and writes the file.
 
         .. seealso:: Saver.sync()
 
         .. versionadded:: 1.0
         """
-        path_bytes = path.encode() + b"\x00"
-        path_arr_type = ctypes.c_char * len(path)
-        path_arr = path_arr_type.from_buffer_copy(path_bytes)
-        self.thorvg_lib.tvg_saver_save_paint.argtypes = [
-            SaverPointer,
-            AnimationPointer,
-            ctypes.POINTER(path_arr_type),
-            ctypes.c_uint32,
-            ctypes.c_uint32,
-        ]
-        self.thorvg_lib.tvg_saver_save_paint.restype = Result
-        return self.thorvg_lib.tvg_saver_save_paint(
-            self._saver,
+        return self._invoke_save(
+            self.thorvg_lib.tvg_saver_save_animation,
             animation._animation,  # type: ignore
-            ctypes.pointer(path_arr),
-            ctypes.c_uint32(quality),
-            ctypes.c_uint32(fps),
+            path,
+            quality,
+            fps,
         )
 
     def sync(self) -> Result:
@@ -148,12 +302,10 @@ class Saver:
 
         .. note::
             The asynchronous tasking is dependent on the Saver module implementation.
+        .. note::
+            The GIL is released while waiting, so other threads keep running.
         .. seealso:: Saver.save()
         """
-        self.thorvg_lib.tvg_saver_sync.argtypes = [
-            SaverPointer,
-        ]
-        self.thorvg_lib.tvg_saver_sync.restype = Result
         return self.thorvg_lib.tvg_saver_sync(
             self._saver,
         )
@@ -161,13 +313,79 @@ class Saver:
     def _del(self) -> Result:
         """Deletes the given SaverPointer object.
 
+        Calling this again once the saver is deleted returns Result.INVALID_ARGUMENT.
+
         :return: Result.INVALID_ARGUMENT An invalid SaverPointer.
         :rtype: thorvg_python.base.Result
         """
-        self.thorvg_lib.tvg_saver_del.argtypes = [
-            SaverPointer,
-        ]
-        self.thorvg_lib.tvg_saver_del.restype = Result
-        return self.thorvg_lib.tvg_saver_del(
+        result = self.thorvg_lib.tvg_saver_del(
             self._saver,
         )
+        self._saver = None
+        return result
+
+
+class SaverPool:
+    """
+    A pool of savers that are reused instead of deleted.
+
+    Saving many files one after another, e.g. dumping frames, would otherwise
+    create and delete a saver for every file. Savers returned to the pool are
+    synced, so they are ready for the next save.
+
+    .. code-block:: python
+
+        pool = SaverPool(engine)
+        with pool.borrow() as saver:
+            saver.save_animation(animation, "out.gif", 100, 0)
+    """
+
+    def __init__(self, engine: Engine, max_size: int = 4):
+        self.engine = engine
+        self.max_size = max_size
+        self._free: List[Saver] = []
+
+    def acquire(self) -> Saver:
+        """Takes a saver from the pool, creating one if the pool is empty.
+
+        :return: A saver that is not saving anything.
+        :rtype: thorvg_python.Saver
+
+        .. seealso:: SaverPool.release()
+        """
+        if self._free:
+            return self._free.pop()
+        return Saver(self.engine)
+
+    def release(self, saver: Saver) -> None:
+        """Waits for ``saver`` to finish saving and returns it to the pool.
+
+        Savers beyond ``max_size`` and savers that were already deleted are not kept.
+
+        :param thorvg_python.Saver saver: A saver taken with SaverPool.acquire().
+        """
+        if saver._saver is None:
+            return
+        saver.sync()
+        if len(self._free) < self.max_size:
+            self._free.append(saver)
+        else:
+            saver._del()
+
+    @contextmanager
+    def borrow(self) -> Iterator[Saver]:
+        """Lends a saver for the duration of a ``with`` block.
+
+        :return: A saver, returned to the pool when leaving the block.
+        :rtype: Iterator[thorvg_python.Saver]
+        """
+        saver = self.acquire()
+        try:
+            yield saver
+        finally:
+            self.release(saver)
+
+    def clear(self) -> None:
+        """Deletes all savers kept by the pool."""
+        while self._free:
+            self._free.pop()._del()
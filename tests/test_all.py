@@ -1,38 +1,106 @@
 #!/usr/bin/env python3
+import ctypes
+import functools
+import gc
+import mmap
 import os
 import platform
+from array import array
 from importlib.util import find_spec
-from typing import TYPE_CHECKING, List, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
 import pytest
 
 import thorvg_python as tvg
+from thorvg_python.paint.shape import _BufferPool
 
 PILLOW_LOADED = True if find_spec("PIL") else False
+NUMPY_LOADED = True if find_spec("numpy") else False
 file_dir = os.path.split(__file__)[0]
 ref_dir = os.path.join(file_dir, "ref")
 
-if TYPE_CHECKING:
-    from PIL import Image
+if PILLOW_LOADED:
+    from PIL import Image, ImageChops
+if NUMPY_LOADED:
+    import numpy as np
 
 
-def check_im_same(im: "Image.Image", im_ref_name: str):
-    from PIL import Image, ImageChops
+@functools.lru_cache(maxsize=None)
+def _load_ref(im_ref_name: str) -> "Image.Image":
+    # Several tests share a reference, so each one is decoded once per session
+    im_ref = Image.open(os.path.join(ref_dir, im_ref_name))
+    im_ref.load()
+    return im_ref
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ref_array(im_ref_name: str) -> "np.ndarray":
+    arr_ref = np.asarray(_load_ref(im_ref_name))
+    # Shared between tests, so make sure none of them can modify it
+    arr_ref.setflags(write=False)
+    return arr_ref
 
+
+def check_im_same(im: Union["Image.Image", tvg.SwCanvas], im_ref_name: str):
     # im.save(os.path.join(ref_dir, im_ref_name))
-    im_ref = Image.open(os.path.join(ref_dir, im_ref_name))
+    im_ref = _load_ref(im_ref_name)
+    if NUMPY_LOADED:
+        # One vectorized pass over both buffers, without building a diff image.
+        # Matches the check below: difference() compares the overlapping area and
+        # getbbox() only looks at the alpha band of RGBA images.
+        # A canvas is compared through a view of its buffer, without copying it.
+        arr = im.get_numpy() if isinstance(im, tvg.SwCanvas) else np.asarray(im)
+        h = min(im_ref.height, arr.shape[0])
+        w = min(im_ref.width, arr.shape[1])
+        arr_ref = _load_ref_array(im_ref_name)[:h, :w]
+        arr = arr[:h, :w]
+        if im_ref.mode == "RGBA":
+            arr_ref, arr = arr_ref[..., 3], arr[..., 3]
+        return np.array_equal(arr_ref, arr)
+    if isinstance(im, tvg.SwCanvas):
+        im = im.get_pillow()
     return ImageChops.difference(im_ref, im).getbbox() is None
 
 
 def test_engine():
     engine = tvg.Engine()
-    assert engine.init_result == tvg.Result.SUCCESS
+    assert engine.init_result is tvg.Result.SUCCESS
     _, _, _, _, version = engine.version()
     assert version is not None
-    assert engine.term() == tvg.Result.SUCCESS
-
-
-def _test_swcanvas(cs: tvg.Colorspace, op: tvg.EngineOption, with_stride: bool):
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.parametrize(
+    "cs,op,with_stride",
+    [
+        pytest.param(
+            tvg.Colorspace.ABGR8888, tvg.EngineOption.DEFAULT, True, id="abgr8888"
+        ),
+        pytest.param(
+            tvg.Colorspace.ABGR8888S, tvg.EngineOption.DEFAULT, True, id="abgr8888s"
+        ),
+        pytest.param(
+            tvg.Colorspace.ARGB8888, tvg.EngineOption.DEFAULT, True, id="argb8888"
+        ),
+        pytest.param(
+            tvg.Colorspace.ARGB8888S, tvg.EngineOption.DEFAULT, True, id="argb8888s"
+        ),
+        pytest.param(
+            tvg.Colorspace.ABGR8888, tvg.EngineOption.NONE, True, id="op_none"
+        ),
+        pytest.param(
+            tvg.Colorspace.ABGR8888,
+            tvg.EngineOption.SMART_RENDER,
+            True,
+            id="op_smart_render",
+        ),
+        pytest.param(
+            tvg.Colorspace.ABGR8888, tvg.EngineOption.DEFAULT, False, id="no_stride"
+        ),
+    ],
+)
+def test_swcanvas(cs: tvg.Colorspace, op: tvg.EngineOption, with_stride: bool):
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine, op)
     if with_stride:
@@ -42,48 +110,20 @@ def _test_swcanvas(cs: tvg.Colorspace, op: tvg.EngineOption, with_stride: bool):
     canvas.set_target(512, 256, stride, cs)
 
     rect = tvg.Shape(engine)
-    assert rect.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert canvas.add(rect) == tvg.Result.SUCCESS
+    assert rect.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(rect) is tvg.Result.SUCCESS
 
-    assert canvas.update() == tvg.Result.SUCCESS
-    assert canvas.draw(clear=True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(clear=True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
         im = canvas.get_pillow()
         assert check_im_same(im, "test_canvas_ref.png") is True
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
-
-
-def test_swcanvas_abgr8888():
-    _test_swcanvas(tvg.Colorspace.ABGR8888, tvg.EngineOption.DEFAULT, True)
-
-
-def test_swcanvas_abgr8888s():
-    _test_swcanvas(tvg.Colorspace.ABGR8888S, tvg.EngineOption.DEFAULT, True)
-
-
-def test_swcanvas_argb8888():
-    _test_swcanvas(tvg.Colorspace.ARGB8888, tvg.EngineOption.DEFAULT, True)
-
-
-def test_swcanvas_argb8888s():
-    _test_swcanvas(tvg.Colorspace.ARGB8888S, tvg.EngineOption.DEFAULT, True)
-
-
-def test_swcanvas_op_none():
-    _test_swcanvas(tvg.Colorspace.ABGR8888, tvg.EngineOption.NONE, True)
-
-
-def test_swcanvas_op_smart_render():
-    _test_swcanvas(tvg.Colorspace.ABGR8888, tvg.EngineOption.SMART_RENDER, True)
-
-
-def test_swcanvas_no_stride():
-    _test_swcanvas(tvg.Colorspace.ABGR8888, tvg.EngineOption.DEFAULT, False)
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_canvas_viewport():
@@ -92,30 +132,29 @@ def test_canvas_viewport():
     canvas.set_target(512, 256, 512)
 
     # Shapes at the right should not be rendered
-    assert canvas.set_viewport(0, 0, 256, 256) == tvg.Result.SUCCESS
+    assert canvas.set_viewport(0, 0, 256, 256) is tvg.Result.SUCCESS
 
     # Shape at left
     rect1 = tvg.Shape(engine)
-    assert rect1.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect1.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert canvas.add(rect1) == tvg.Result.SUCCESS
+    assert rect1.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect1.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(rect1) is tvg.Result.SUCCESS
 
     # Shape at right
     rect2 = tvg.Shape(engine)
-    assert rect2.append_rect(260, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect2.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert canvas.add(rect2) == tvg.Result.SUCCESS
+    assert rect2.append_rect(260, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect2.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(rect2) is tvg.Result.SUCCESS
 
-    assert canvas.update() == tvg.Result.SUCCESS
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_canvas_ref.png") is True
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_canvas_clear():
@@ -124,26 +163,94 @@ def test_canvas_clear():
     canvas.set_target(512, 256, 512)
 
     rect1 = tvg.Shape(engine)
-    assert rect1.append_rect(0, 0, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect1.set_fill_color(128, 32, 64, 50) == tvg.Result.SUCCESS
-    assert canvas.add(rect1) == tvg.Result.SUCCESS
-    assert canvas.remove(None) == tvg.Result.SUCCESS
+    assert rect1.append_rect(0, 0, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect1.set_fill_color(128, 32, 64, 50) is tvg.Result.SUCCESS
+    assert canvas.add(rect1) is tvg.Result.SUCCESS
+    assert canvas.remove(None) is tvg.Result.SUCCESS
 
     rect2 = tvg.Shape(engine)
-    assert rect2.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect2.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert canvas.add(rect2) == tvg.Result.SUCCESS
+    assert rect2.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect2.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(rect2) is tvg.Result.SUCCESS
 
-    assert canvas.update() == tvg.Result.SUCCESS
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_canvas_ref.png") is True
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
+
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.skipif(NUMPY_LOADED is False, reason="numpy not installed")
+def test_swcanvas_get_numpy():
+    engine = tvg.Engine()
+    canvas = tvg.SwCanvas(engine)
+    assert canvas.set_target(512, 256, 600) is tvg.Result.SUCCESS
+
+    # A view taken before drawing sees the rendered pixels
+    arr = canvas.get_numpy()
+    assert arr.shape == (256, 512, 4)
+    assert arr.flags.c_contiguous is False
+    assert not arr.any()
+
+    rect = tvg.Shape(engine)
+    assert rect.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(rect) is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
+
+    assert arr.any()
+    if PILLOW_LOADED:
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
+
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+
+# Paths drawn by test_shape_path
+_STAR_CMDS = bytes(
+    [tvg.PathCommand.MOVE_TO] + [tvg.PathCommand.LINE_TO] * 9 + [tvg.PathCommand.CLOSE]
+)
+_STAR_PTS = [
+    (199, 34),
+    (253, 143),
+    (374, 160),
+    (287, 244),
+    (307, 365),
+    (199, 309),
+    (97, 365),
+    (112, 245),
+    (26, 161),
+    (146, 143),
+]
+
+# A circle made of four cubic Bezier curves
+_CX = 256
+_CY = 256
+_RADIUS = 256
+_HALF_RADIUS = _RADIUS * 0.552284
+_CIRCLE_CMDS = bytes(
+    [tvg.PathCommand.MOVE_TO] + [tvg.PathCommand.CUBIC_TO] * 4 + [tvg.PathCommand.CLOSE]
+)
+_CIRCLE_PTS = [
+    (_CX, _CY - _RADIUS),
+    (_CX + _HALF_RADIUS, _CY - _RADIUS),
+    (_CX + _RADIUS, _CY - _HALF_RADIUS),
+    (_CX + _RADIUS, _CY),
+    (_CX + _RADIUS, _CY + _HALF_RADIUS),
+    (_CX + _HALF_RADIUS, _CY + _RADIUS),
+    (_CX, _CY + _RADIUS),
+    (_CX - _HALF_RADIUS, _CY + _RADIUS),
+    (_CX - _RADIUS, _CY + _HALF_RADIUS),
+    (_CX - _RADIUS, _CY),
+    (_CX - _RADIUS, _CY - _HALF_RADIUS),
+    (_CX - _HALF_RADIUS, _CY - _RADIUS),
+    (_CX, _CY - _RADIUS),
+]
 
 
 def test_shape_path():
@@ -153,71 +260,29 @@ def test_shape_path():
 
     shape = tvg.Shape(engine)
 
-    assert shape.move_to(199, 34) == tvg.Result.SUCCESS
-    assert shape.line_to(253, 143) == tvg.Result.SUCCESS
-    assert shape.line_to(374, 160) == tvg.Result.SUCCESS
-    assert shape.line_to(287, 244) == tvg.Result.SUCCESS
-    assert shape.line_to(307, 365) == tvg.Result.SUCCESS
-    assert shape.line_to(199, 309) == tvg.Result.SUCCESS
-    assert shape.line_to(97, 365) == tvg.Result.SUCCESS
-    assert shape.line_to(112, 245) == tvg.Result.SUCCESS
-    assert shape.line_to(26, 161) == tvg.Result.SUCCESS
-    assert shape.line_to(146, 143) == tvg.Result.SUCCESS
-    assert shape.close() == tvg.Result.SUCCESS
-    assert shape.set_fill_color(0, 0, 255, 255) == tvg.Result.SUCCESS
-    assert canvas.add(shape) == tvg.Result.SUCCESS
-
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert shape.append_path(_STAR_CMDS, _STAR_PTS) is tvg.Result.SUCCESS
+    assert shape.set_fill_color(0, 0, 255, 255) is tvg.Result.SUCCESS
+    assert canvas.add(shape) is tvg.Result.SUCCESS
 
-    if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_shape_path_ref1.png") is True
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
-    cx = 256
-    cy = 256
-    radius = 256
-    halfRadius = radius * 0.552284
+    if PILLOW_LOADED:
+        assert check_im_same(canvas, "test_shape_path_ref1.png") is True
 
-    assert canvas.set_target(512, 512) == tvg.Result.SUCCESS
-    assert shape.reset() == tvg.Result.SUCCESS
-    assert shape.move_to(cx, cy - radius) == tvg.Result.SUCCESS
-    assert (
-        shape.cubic_to(
-            cx + halfRadius, cy - radius, cx + radius, cy - halfRadius, cx + radius, cy
-        )
-        == tvg.Result.SUCCESS
-    )
-    assert (
-        shape.cubic_to(
-            cx + radius, cy + halfRadius, cx + halfRadius, cy + radius, cx, cy + radius
-        )
-        == tvg.Result.SUCCESS
-    )
-    assert (
-        shape.cubic_to(
-            cx - halfRadius, cy + radius, cx - radius, cy + halfRadius, cx - radius, cy
-        )
-        == tvg.Result.SUCCESS
-    )
-    assert (
-        shape.cubic_to(
-            cx - radius, cy - halfRadius, cx - halfRadius, cy - radius, cx, cy - radius
-        )
-        == tvg.Result.SUCCESS
-    )
-    assert shape.close() == tvg.Result.SUCCESS
-    assert shape.set_fill_color(255, 0, 0, 255) == tvg.Result.SUCCESS
+    assert canvas.set_target(512, 512) is tvg.Result.SUCCESS
+    assert shape.reset() is tvg.Result.SUCCESS
+    assert shape.append_path(_CIRCLE_CMDS, _CIRCLE_PTS) is tvg.Result.SUCCESS
+    assert shape.set_fill_color(255, 0, 0, 255) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_shape_path_ref2.png") is True
+        assert check_im_same(canvas, "test_shape_path_ref2.png") is True
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_shape_append_rect():
@@ -226,19 +291,18 @@ def test_shape_append_rect():
     canvas.set_target(512, 256)
 
     shape = tvg.Shape(engine)
-    assert shape.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert shape.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert canvas.add(shape) == tvg.Result.SUCCESS
+    assert shape.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert shape.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(shape) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_canvas_ref.png") is True
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_shape_append_circle():
@@ -247,19 +311,18 @@ def test_shape_append_circle():
     canvas.set_target(512, 256)
 
     shape = tvg.Shape(engine)
-    assert shape.append_circle(256, 128, 64, 32, True) == tvg.Result.SUCCESS
-    assert shape.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert canvas.add(shape) == tvg.Result.SUCCESS
+    assert shape.append_circle(256, 128, 64, 32, True) is tvg.Result.SUCCESS
+    assert shape.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert canvas.add(shape) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_shape_append_circle_ref.png") is True
+        assert check_im_same(canvas, "test_shape_append_circle_ref.png") is True
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_shape_get_path_commands():
@@ -271,6 +334,7 @@ def test_shape_get_path_commands():
     assert result is tvg.Result.SUCCESS
     cmds_list: List[tvg.PathCommand] = []
     for cmd in cmds:
+        assert isinstance(cmd, tvg.PathCommand)
         cmds_list.append(cmd)
     pts_list: List[Tuple[float, float]] = []
     for pt in pts:
@@ -283,7 +347,341 @@ def test_shape_get_path_commands():
         tvg.PathCommand.CLOSE,
     ]
     assert pts_list == [(80.0, 32.0), (80.0, 160.0), (16.0, 160.0), (16.0, 32.0)]
-    assert engine.term() == tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def _rect_path_pts() -> List[Tuple[float, float]]:
+    return [(80.0, 32.0), (80.0, 160.0), (16.0, 160.0), (16.0, 32.0)]
+
+
+def test_shape_append_path_buffer():
+    engine = tvg.Engine()
+    shape = tvg.Shape(engine)
+
+    cmds = bytes([tvg.PathCommand.MOVE_TO] + [tvg.PathCommand.LINE_TO] * 3)
+    pts = (tvg.PointStruct * 4)(*_rect_path_pts())
+    assert shape.append_path(cmds, pts) is tvg.Result.SUCCESS
+
+    result, _, pts_out = shape.get_path()
+    assert result is tvg.Result.SUCCESS
+    assert [(pt.x, pt.y) for pt in pts_out] == _rect_path_pts()
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.skipif(NUMPY_LOADED is False, reason="numpy not installed")
+def test_shape_append_path_numpy():
+    engine = tvg.Engine()
+    cmds = np.array(
+        [tvg.PathCommand.MOVE_TO] + [tvg.PathCommand.LINE_TO] * 3, dtype=np.uint8
+    )
+    pts_list = [
+        np.array(_rect_path_pts(), dtype=[("x", "<f4"), ("y", "<f4")]),
+        np.array(_rect_path_pts(), dtype=np.float32),
+        np.asfortranarray(np.array(_rect_path_pts(), dtype=np.float32)),
+    ]
+    for pts in pts_list:
+        shape = tvg.Shape(engine)
+        assert shape.append_path(cmds, pts) is tvg.Result.SUCCESS
+        _, _, pts_out = shape.get_path()
+        assert [(pt.x, pt.y) for pt in pts_out] == _rect_path_pts()
+
+    with pytest.raises(ValueError):
+        tvg.Shape(engine).append_path(cmds, np.zeros((4, 2), dtype=np.float64))
+    with pytest.raises(ValueError):
+        tvg.Shape(engine).append_path(
+            b"\x01\x02", np.array([0, 0, 10, 10, 99], dtype=np.float32)
+        )
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.skipif(NUMPY_LOADED is False, reason="numpy not installed")
+def test_shape_get_path_numpy():
+    engine = tvg.Engine()
+    shape = tvg.Shape(engine)
+
+    result, cmds, pts = shape.get_path_numpy()
+    assert result is tvg.Result.SUCCESS
+    assert len(cmds) == 0
+    assert len(pts) == 0
+
+    assert shape.append_rect(16, 32, 64, 128, 0, 0, True) is tvg.Result.SUCCESS
+    result, cmds, pts = shape.get_path_numpy()
+    assert result is tvg.Result.SUCCESS
+    assert cmds.tolist() == [
+        tvg.PathCommand.MOVE_TO,
+        tvg.PathCommand.LINE_TO,
+        tvg.PathCommand.LINE_TO,
+        tvg.PathCommand.LINE_TO,
+        tvg.PathCommand.CLOSE,
+    ]
+    assert pts.tolist() == _rect_path_pts()
+
+    result, cmds, xs, ys = shape.get_path_soa()
+    assert result is tvg.Result.SUCCESS
+    assert len(cmds) == 5
+    assert list(zip(xs.tolist(), ys.tolist())) == _rect_path_pts()
+    assert (xs.min(), ys.max()) == (16, 160)
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_shape_append_rects_circles():
+    engine = tvg.Engine()
+
+    shape = tvg.Shape(engine)
+    assert (
+        shape.append_rects([(16, 32, 64, 128, 0, 0, True), (0, 0, 8, 8, 2, 2, False)])
+        is tvg.Result.SUCCESS
+    )
+    assert shape.append_circles([(64, 64, 16, 8, True)]) is tvg.Result.SUCCESS
+    assert shape.append_rects([]) is tvg.Result.SUCCESS
+
+    ref = tvg.Shape(engine)
+    assert ref.append_rect(16, 32, 64, 128, 0, 0, True) is tvg.Result.SUCCESS
+    assert ref.append_rect(0, 0, 8, 8, 2, 2, False) is tvg.Result.SUCCESS
+    assert ref.append_circle(64, 64, 16, 8, True) is tvg.Result.SUCCESS
+
+    _, cmds, pts = shape.get_path()
+    _, ref_cmds, ref_pts = ref.get_path()
+    assert list(cmds) == list(ref_cmds)
+    assert [(pt.x, pt.y) for pt in pts] == [(pt.x, pt.y) for pt in ref_pts]
+
+    if NUMPY_LOADED:
+        shape_np = tvg.Shape(engine)
+        rects = np.array([[16, 32, 64, 128, 0, 0, 1], [0, 0, 8, 8, 2, 2, 0]])
+        assert shape_np.append_rects(rects) is tvg.Result.SUCCESS
+        assert shape_np.append_circles(np.array([[64, 64, 16, 8, 1]])) == (
+            tvg.Result.SUCCESS
+        )
+        _, np_cmds, np_pts = shape_np.get_path()
+        assert list(np_cmds) == list(ref_cmds)
+        assert [(pt.x, pt.y) for pt in np_pts] == [(pt.x, pt.y) for pt in ref_pts]
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_shape_buffer_pool():
+    engine = tvg.Engine()
+    shape = tvg.Shape(engine)
+
+    # Reused arrays of different lengths must not leak stale items into later calls
+    cmds = [tvg.PathCommand.MOVE_TO] + [tvg.PathCommand.LINE_TO] * 3
+    for pattern in ([1.0, 2.0, 3.0], [4.0], [5.0, 6.0, 7.0, 8.0], [9.0, 10.0]):
+        assert shape.append_path(cmds, _rect_path_pts()) is tvg.Result.SUCCESS
+        assert shape.append_path(cmds[:2], _rect_path_pts()[:2]) is tvg.Result.SUCCESS
+        assert shape.set_stroke_dash(pattern, 0) is tvg.Result.SUCCESS
+        assert shape.get_stroke_dash() == (tvg.Result.SUCCESS, pattern, 0.0)
+
+    result, cmds_out, pts_out = shape.get_path()
+    assert result is tvg.Result.SUCCESS
+    assert list(cmds_out) == (cmds + cmds[:2]) * 4
+    assert [(pt.x, pt.y) for pt in pts_out] == (
+        _rect_path_pts() + _rect_path_pts()[:2]
+    ) * 4
+
+    pool = _BufferPool()
+    buf = pool.take(ctypes.c_float, 3)
+    assert len(buf) == 4
+    pool.give(buf)
+    assert pool.take(ctypes.c_float, 4) is buf
+    assert pool.take(ctypes.c_float, 4) is not buf
+
+    # Caller buffers are never kept
+    caller_buf = (ctypes.c_float * 4).from_buffer(bytearray(16))
+    pool.give(caller_buf)
+    assert pool.take(ctypes.c_float, 4) is not caller_buf
+
+    # Pooled memory is capped
+    big_buf = (ctypes.c_uint8 * (1 << 20))()
+    pool.give(big_buf)
+    assert pool.take(ctypes.c_uint8, 1 << 20) is not big_buf
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_shape_slots():
+    engine = tvg.Engine()
+
+    shape = tvg.Shape(engine)
+    assert not hasattr(shape, "__dict__")
+    with pytest.raises(AttributeError):
+        shape.foo = 1  # type: ignore[attr-defined]
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_shape_builder():
+    engine = tvg.Engine()
+
+    shape = tvg.Shape(engine)
+    with shape.builder(capacity=2) as path:
+        path.move_to(0, 0)
+        path.line_to(64, 0)
+        path.cubic_to(64, 32, 32, 64, 0, 64)
+        path.close()
+        path.move_to(80, 80)
+        path.line_to(96, 96)
+
+    ref = tvg.Shape(engine)
+    assert ref.move_to(0, 0) is tvg.Result.SUCCESS
+    assert ref.line_to(64, 0) is tvg.Result.SUCCESS
+    assert ref.cubic_to(64, 32, 32, 64, 0, 64) is tvg.Result.SUCCESS
+    assert ref.close() is tvg.Result.SUCCESS
+    assert ref.move_to(80, 80) is tvg.Result.SUCCESS
+    assert ref.line_to(96, 96) is tvg.Result.SUCCESS
+
+    result, cmds, pts = shape.get_path()
+    assert result is tvg.Result.SUCCESS
+    _, ref_cmds, ref_pts = ref.get_path()
+    assert list(cmds) == list(ref_cmds)
+    assert [(pt.x, pt.y) for pt in pts] == [(pt.x, pt.y) for pt in ref_pts]
+
+    assert shape.builder().flush() is tvg.Result.SUCCESS
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_shape_append_svg_path():
+    engine = tvg.Engine()
+
+    shape = tvg.Shape(engine)
+    assert (
+        shape.append_svg_path("M0 0 L64,0 C64 32 32 64 0 64 Z m80 80 l16 16")
+        is tvg.Result.SUCCESS
+    )
+
+    ref = tvg.Shape(engine)
+    with ref.builder() as path:
+        path.move_to(0, 0)
+        path.line_to(64, 0)
+        path.cubic_to(64, 32, 32, 64, 0, 64)
+        path.close()
+        path.move_to(80, 80)
+        path.line_to(96, 96)
+
+    _, cmds, pts = shape.get_path()
+    _, ref_cmds, ref_pts = ref.get_path()
+    assert list(cmds) == list(ref_cmds)
+    assert [(pt.x, pt.y) for pt in pts] == [(pt.x, pt.y) for pt in ref_pts]
+
+    arc = tvg.Shape(engine)
+    assert arc.append_svg_path("M10 50 A40 40 0 1 1 90 50") is tvg.Result.SUCCESS
+    _, cmds, pts = arc.get_path()
+    assert cmds[0] == tvg.PathCommand.MOVE_TO
+    assert all(cmd == tvg.PathCommand.CUBIC_TO for cmd in cmds[1:])
+    assert (pts[-1].x, pts[-1].y) == (90, 50)
+
+    with pytest.raises(ValueError):
+        arc.append_svg_path("M0 0 X10 10")
+    with pytest.raises(ValueError):
+        arc.append_svg_path("M0 0 Z 10 10")
+    with pytest.raises(ValueError):
+        arc.append_svg_path("S10 10 20 20")
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_paint_bounding_box():
+    engine = tvg.Engine()
+    shape = tvg.Shape(engine)
+    assert shape.append_rect(16, 32, 64, 128, 0, 0, True) is tvg.Result.SUCCESS
+    assert shape.translate(10, 0) is tvg.Result.SUCCESS
+
+    assert shape.get_aabb() == (tvg.Result.SUCCESS, 26, 32, 64, 128)
+    result, pt4 = shape.get_obb()
+    assert result is tvg.Result.SUCCESS
+    assert [(pt.x, pt.y) for pt in pt4] == [(26, 32), (90, 32), (90, 160), (26, 160)]
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_paint_apply():
+    engine = tvg.Engine()
+
+    shape = tvg.Shape(engine)
+    assert (
+        shape.apply(
+            fill_color=(32, 64, 128, 100),
+            fill_rule=tvg.FillRule.EVEN_ODD,
+            stroke_width=3,
+            stroke_dash=([1.0, 2.0], 0.5),
+            opacity=60,
+            translate=(10, 20),
+        )
+        is tvg.Result.SUCCESS
+    )
+    assert shape.get_fill_color() == (tvg.Result.SUCCESS, 32, 64, 128, 100)
+    assert shape.get_fill_rule() == (tvg.Result.SUCCESS, tvg.FillRule.EVEN_ODD)
+    assert shape.get_stroke_width() == (tvg.Result.SUCCESS, 3)
+    assert shape.get_stroke_dash() == (tvg.Result.SUCCESS, [1.0, 2.0], 0.5)
+    assert shape.get_opacity() == (tvg.Result.SUCCESS, 60)
+    _, matrix = shape.get_transform()
+    assert (matrix.e13, matrix.e23) == (10, 20)
+
+    assert shape.apply(stroke_miterlimit=-1) == tvg.Result.INVALID_ARGUMENT
+    with pytest.raises(TypeError):
+        shape.apply(opacity=0, size=32)
+    assert shape.get_opacity() == (tvg.Result.SUCCESS, 60)
+    with pytest.raises(TypeError):
+        shape.apply(stroke_width=5, stroke_dash=[7.0, 10.0])
+    assert shape.get_stroke_width() == (tvg.Result.SUCCESS, 3)
+    assert (
+        shape.apply(stroke_width=5, stroke_dash=((7.0, 10.0), 0.0))
+        is tvg.Result.SUCCESS
+    )
+    assert shape.get_stroke_dash() == (tvg.Result.SUCCESS, [7.0, 10.0], 0.0)
+
+    text = tvg.Text(engine)
+    assert text.apply(size=32, text="apply", color=(0, 0, 0)) is tvg.Result.SUCCESS
+    assert text.get_text() == "apply"
+    with pytest.raises(TypeError):
+        text.apply(fill_color=(0, 0, 0, 0))
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_shape_set_fill_colors():
+    engine = tvg.Engine()
+
+    shapes = [tvg.Shape(engine) for _ in range(3)]
+    colors = [(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 0)]
+    assert tvg.Shape.set_fill_colors(shapes, colors) is tvg.Result.SUCCESS
+    assert [shape.get_fill_color()[1:] for shape in shapes] == colors
+
+    with pytest.raises(ValueError):
+        tvg.Shape.set_fill_colors(shapes, colors[:2])
+
+    if NUMPY_LOADED:
+        rgba = np.array(colors[::-1], dtype=np.uint8)
+        assert tvg.Shape.set_fill_colors(shapes, rgba) is tvg.Result.SUCCESS
+        assert [shape.get_fill_color()[1:] for shape in shapes] == colors[::-1]
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_paint_parent_clip():
+    engine = tvg.Engine()
+    scene = tvg.Scene(engine)
+    shape = tvg.Shape(engine)
+    clipper = tvg.Shape(engine)
+
+    assert shape.get_parent() is None
+    assert shape.get_clip() is None
+
+    assert scene.add(shape) is tvg.Result.SUCCESS
+    assert clipper.append_rect(0, 0, 8, 8, 0, 0, True) is tvg.Result.SUCCESS
+    assert shape.set_clip(clipper) is tvg.Result.SUCCESS
+
+    parent = shape.get_parent()
+    assert parent is not None
+    assert parent._paint.value == scene._paint.value
+    clip = shape.get_clip()
+    assert clip is not None
+    assert clip._paint.value == clipper._paint.value
+
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_paint():
@@ -291,20 +689,20 @@ def test_paint():
     scene = tvg.Scene(engine)
 
     shape = tvg.Shape(engine)
-    assert scene.add(shape) == tvg.Result.SUCCESS
-    assert shape.append_rect(16, 32, 64, 128, 0, 0, True) == tvg.Result.SUCCESS
-    assert shape.scale(2.0) == tvg.Result.SUCCESS
-    assert shape.rotate(45) == tvg.Result.SUCCESS
-    assert shape.translate(60, 80) == tvg.Result.SUCCESS
+    assert scene.add(shape) is tvg.Result.SUCCESS
+    assert shape.append_rect(16, 32, 64, 128, 0, 0, True) is tvg.Result.SUCCESS
+    assert shape.scale(2.0) is tvg.Result.SUCCESS
+    assert shape.rotate(45) is tvg.Result.SUCCESS
+    assert shape.translate(60, 80) is tvg.Result.SUCCESS
 
-    assert shape.set_opacity(60) == tvg.Result.SUCCESS
+    assert shape.set_opacity(60) is tvg.Result.SUCCESS
     assert shape.get_opacity() == (tvg.Result.SUCCESS, 60)
 
     matrix_list = [1, 0, 0, 0, 1, 0, 0, 0, 1]
     matrix = tvg.Matrix(*matrix_list)
     shape.set_transform(matrix)
     transform_result, matrix_out = shape.get_transform()
-    assert transform_result == tvg.Result.SUCCESS
+    assert transform_result is tvg.Result.SUCCESS
     matrix_out_list = [
         matrix_out.e11,
         matrix_out.e12,
@@ -317,33 +715,38 @@ def test_paint():
         matrix_out.e33,
     ]
     assert matrix_list == matrix_out_list
+    if NUMPY_LOADED:
+        matrix_arr = matrix_out.as_array()
+        assert matrix_arr.tolist() == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        matrix_arr[0, 2] = 60
+        assert matrix_out.e13 == 60
 
     assert shape.get_ref() == 1
     assert shape.ref() == 2
     assert shape.unref(free=False) == 1
 
-    assert shape.set_visible(False) == tvg.Result.SUCCESS
+    assert shape.set_visible(False) is tvg.Result.SUCCESS
     assert shape.get_visible() is False
-    assert shape.set_visible(True) == tvg.Result.SUCCESS
+    assert shape.set_visible(True) is tvg.Result.SUCCESS
 
     assert shape.get_id() == 0
-    assert shape.set_id(1337) == tvg.Result.SUCCESS
+    assert shape.set_id(1337) is tvg.Result.SUCCESS
     assert shape.get_id() == 1337
 
     shape2 = tvg.Shape(engine)
-    assert shape.set_mask_method(shape2, tvg.MaskMethod.DARKEN) == tvg.Result.SUCCESS
+    assert shape.set_mask_method(shape2, tvg.MaskMethod.DARKEN) is tvg.Result.SUCCESS
     result, method = shape.get_mask_method(shape2)
-    assert result == tvg.Result.SUCCESS
+    assert result is tvg.Result.SUCCESS
     assert method == tvg.MaskMethod.DARKEN
 
     shape3 = tvg.Shape(engine)
-    assert shape.set_clip(shape3) == tvg.Result.SUCCESS
+    assert shape.set_clip(shape3) is tvg.Result.SUCCESS
     assert shape.get_type() == (tvg.Result.SUCCESS, tvg.TvgType.SHAPE)
-    assert shape.set_blend_method(tvg.BlendMethod.ADD) == tvg.Result.SUCCESS
+    assert shape.set_blend_method(tvg.BlendMethod.ADD) is tvg.Result.SUCCESS
 
     # assert isinstance(shape.duplicate(), tvg.base.PaintPointer)
 
-    assert engine.term() == tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_stroke():
@@ -353,28 +756,27 @@ def test_stroke():
 
     line = tvg.Shape(engine)
 
-    assert line.move_to(20, 40) == tvg.Result.SUCCESS
-    assert line.line_to(256, 40) == tvg.Result.SUCCESS
-    assert line.line_to(256, 128) == tvg.Result.SUCCESS
-    assert line.line_to(20, 128) == tvg.Result.SUCCESS
-    assert line.close() == tvg.Result.SUCCESS
-
-    assert line.set_fill_color(150, 150, 255, 100) == tvg.Result.SUCCESS
-    assert line.set_stroke_width(5) == tvg.Result.SUCCESS
-    assert line.set_stroke_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert line.set_stroke_cap(tvg.StrokeCap.SQUARE) == tvg.Result.SUCCESS
-    assert line.set_stroke_join(tvg.StrokeJoin.BEVEL) == tvg.Result.SUCCESS
-    assert line.set_stroke_miterlimit(3.0) == tvg.Result.SUCCESS
+    assert line.move_to(20, 40) is tvg.Result.SUCCESS
+    assert line.line_to(256, 40) is tvg.Result.SUCCESS
+    assert line.line_to(256, 128) is tvg.Result.SUCCESS
+    assert line.line_to(20, 128) is tvg.Result.SUCCESS
+    assert line.close() is tvg.Result.SUCCESS
+
+    assert line.set_fill_color(150, 150, 255, 100) is tvg.Result.SUCCESS
+    assert line.set_stroke_width(5) is tvg.Result.SUCCESS
+    assert line.set_stroke_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert line.set_stroke_cap(tvg.StrokeCap.SQUARE) is tvg.Result.SUCCESS
+    assert line.set_stroke_join(tvg.StrokeJoin.BEVEL) is tvg.Result.SUCCESS
+    assert line.set_stroke_miterlimit(3.0) is tvg.Result.SUCCESS
     pattern = [7.0, 10.0]
-    assert line.set_stroke_dash(pattern, 0) == tvg.Result.SUCCESS
-    assert canvas.add(line) == tvg.Result.SUCCESS
+    assert line.set_stroke_dash(pattern, 0) is tvg.Result.SUCCESS
+    assert canvas.add(line) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_stroke_ref.png") is True
+        assert check_im_same(canvas, "test_stroke_ref.png") is True
 
     assert line.get_stroke_width() == (tvg.Result.SUCCESS, 5.0)
     assert line.get_stroke_color() == (tvg.Result.SUCCESS, 32, 64, 128, 100)
@@ -383,8 +785,46 @@ def test_stroke():
     assert line.get_stroke_join() == (tvg.Result.SUCCESS, tvg.StrokeJoin.BEVEL)
     assert line.get_stroke_miterlimit() == (tvg.Result.SUCCESS, 3.0)
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert line.set_stroke_color_rgba32(0x64804020) is tvg.Result.SUCCESS
+    assert line.get_stroke_color() == (tvg.Result.SUCCESS, 32, 64, 128, 100)
+
+    long_pattern = [1.0, 2.0, 3.0, 4.0]
+    assert line.set_stroke_dash(long_pattern, 1) is tvg.Result.SUCCESS
+    assert line.get_stroke_dash() == (tvg.Result.SUCCESS, long_pattern, 1.0)
+    assert line.set_stroke_dash(pattern, 0) is tvg.Result.SUCCESS
+    assert line.get_stroke_dash() == (tvg.Result.SUCCESS, pattern, 0.0)
+
+    assert line.set_stroke_dash(array("f", long_pattern), 0) is tvg.Result.SUCCESS
+    assert line.get_stroke_dash() == (tvg.Result.SUCCESS, long_pattern, 0.0)
+    if NUMPY_LOADED:
+        readonly_pattern = np.array(pattern, dtype=np.float32)
+        readonly_pattern.flags.writeable = False
+        assert line.set_stroke_dash(readonly_pattern, 0) is tvg.Result.SUCCESS
+        assert line.get_stroke_dash() == (tvg.Result.SUCCESS, pattern, 0.0)
+    assert tvg.Shape(engine).get_stroke_dash() == (tvg.Result.SUCCESS, [], 0.0)
+
+    configured = tvg.Shape(engine)
+    assert (
+        configured.configure_stroke(
+            width=5,
+            color=(32, 64, 128, 100),
+            dash=(pattern, 0),
+            cap=tvg.StrokeCap.SQUARE,
+            join=tvg.StrokeJoin.BEVEL,
+            miterlimit=3,
+        )
+        is tvg.Result.SUCCESS
+    )
+    assert configured.get_stroke_width() == line.get_stroke_width()
+    assert configured.get_stroke_color() == line.get_stroke_color()
+    assert configured.get_stroke_dash() == (tvg.Result.SUCCESS, pattern, 0.0)
+    assert configured.get_stroke_cap() == line.get_stroke_cap()
+    assert configured.get_stroke_join() == line.get_stroke_join()
+    assert configured.get_stroke_miterlimit() == line.get_stroke_miterlimit()
+    assert configured.configure_stroke(miterlimit=-1) == tvg.Result.INVALID_ARGUMENT
+
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_fill():
@@ -393,37 +833,37 @@ def test_fill():
     canvas.set_target(512, 256)
 
     shape = tvg.Shape(engine)
-    assert shape.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
+    assert shape.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
 
-    assert shape.set_fill_rule(tvg.FillRule.EVEN_ODD) == tvg.Result.SUCCESS
-    assert shape.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert shape.set_paint_order(True) == tvg.Result.SUCCESS
-    assert shape.set_stroke_color(128, 64, 32, 150) == tvg.Result.SUCCESS
-    assert shape.set_stroke_width(3) == tvg.Result.SUCCESS
+    assert shape.set_fill_rule(tvg.FillRule.EVEN_ODD) is tvg.Result.SUCCESS
+    assert shape.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert shape.set_paint_order(True) is tvg.Result.SUCCESS
+    assert shape.set_stroke_color(128, 64, 32, 150) is tvg.Result.SUCCESS
+    assert shape.set_stroke_width(3) is tvg.Result.SUCCESS
 
-    assert canvas.add(shape) == tvg.Result.SUCCESS
+    assert canvas.add(shape) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_fill_ref.png") is True
+        assert check_im_same(canvas, "test_fill_ref.png") is True
 
     assert shape.get_fill_color() == (tvg.Result.SUCCESS, 32, 64, 128, 100)
     assert shape.get_fill_rule() == (tvg.Result.SUCCESS, tvg.FillRule.EVEN_ODD)
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
-def _test_gradient(gradient_type: str):
+@pytest.mark.parametrize("gradient_type", ["linear", "radial"])
+def test_gradient(gradient_type: str):
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(512, 256)
 
     shape = tvg.Shape(engine)
-    assert shape.append_rect(0, 0, 512, 256, 0, 0, True) == tvg.Result.SUCCESS
+    assert shape.append_rect(0, 0, 512, 256, 0, 0, True) is tvg.Result.SUCCESS
 
     fill: tvg.Gradient
     if gradient_type == "linear":
@@ -441,27 +881,28 @@ def _test_gradient(gradient_type: str):
     matrix = tvg.Matrix(*matrix_list)
 
     if isinstance(fill, tvg.LinearGradient):
-        assert fill.set(0, 0, 100, 100) == tvg.Result.SUCCESS
+        assert fill.set(0, 0, 100, 100) is tvg.Result.SUCCESS
     elif isinstance(fill, tvg.RadialGradient):  # type: ignore
-        assert fill.set(100, 100, 50, 100, 100, 50) == tvg.Result.SUCCESS
+        assert fill.set(100, 100, 50, 100, 100, 50) is tvg.Result.SUCCESS
     else:
         raise RuntimeError(f"Invalid fill type {type(fill)}")
 
-    assert fill.set_color_stops(color_stops) == tvg.Result.SUCCESS
-    assert fill.set_spread(tvg.StrokeFill.REPEAT) == tvg.Result.SUCCESS
-    assert fill.set_transform(matrix) == tvg.Result.SUCCESS
-    assert shape.set_gradient(fill) == tvg.Result.SUCCESS
-    assert canvas.add(shape) == tvg.Result.SUCCESS
+    assert fill.get_color_stops() == (tvg.Result.SUCCESS, [])
+    assert fill.set_color_stops(color_stops) is tvg.Result.SUCCESS
+    assert fill.set_spread(tvg.StrokeFill.REPEAT) is tvg.Result.SUCCESS
+    assert fill.set_transform(matrix) is tvg.Result.SUCCESS
+    assert shape.set_gradient(fill) is tvg.Result.SUCCESS
+    assert canvas.add(shape) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, f"test_{gradient_type}_gradient_ref.png") is True
+        assert check_im_same(canvas, f"test_{gradient_type}_gradient_ref.png") is True
 
     result_get, fill_out = shape.get_gradient()
-    assert result_get == tvg.Result.SUCCESS
+    assert result_get is tvg.Result.SUCCESS
+    assert shape.get_stroke_gradient() == (tvg.Result.SUCCESS, None)
 
     if isinstance(fill_out, tvg.LinearGradient):
         assert fill_out.get() == (tvg.Result.SUCCESS, 0, 0, 100, 100)
@@ -473,16 +914,20 @@ def _test_gradient(gradient_type: str):
         raise RuntimeError(f"Invalid fill_out type {type(fill_out)}")
 
     color_stops_result, color_stops_out = fill_out.get_color_stops()
-    assert color_stops_result == tvg.Result.SUCCESS
+    assert color_stops_result is tvg.Result.SUCCESS
     color_stops_out_list: List[Tuple[float, float, float, float, float]] = []
     for j in color_stops_out:
         color_stops_out_list.append((j.offset, j.r, j.g, j.b, j.a))
     assert color_stops_list == color_stops_out_list
+    if NUMPY_LOADED:
+        color_stops_result, color_stops_np = fill_out.get_color_stops_numpy()
+        assert color_stops_result is tvg.Result.SUCCESS
+        assert color_stops_np.tolist() == color_stops_list
 
     assert fill_out.get_spread() == (tvg.Result.SUCCESS, tvg.StrokeFill.REPEAT)
 
     transform_result, matrix_out = fill_out.get_transform()
-    assert transform_result == tvg.Result.SUCCESS
+    assert transform_result is tvg.Result.SUCCESS
     matrix_out_list = [
         matrix_out.e11,
         matrix_out.e12,
@@ -496,225 +941,390 @@ def _test_gradient(gradient_type: str):
     ]
     assert matrix_list == matrix_out_list
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
-def test_gradient_linear():
-    _test_gradient("linear")
+def test_shape_gradient_replace():
+    engine = tvg.Engine()
+    shape = tvg.Shape(engine)
 
+    # Replacing a gradient frees the old one, whose address ThorVG may reuse
+    grad_types = [tvg.LinearGradient, tvg.RadialGradient, tvg.LinearGradient]
+    for grad_type in grad_types:
+        assert shape.set_gradient(grad_type(engine)) is tvg.Result.SUCCESS
+        assert type(shape.get_gradient()[1]) is grad_type
+        assert shape.set_stroke_gradient(grad_type(engine)) is tvg.Result.SUCCESS
+        assert type(shape.get_stroke_gradient()[1]) is grad_type
 
-def test_gradient_radial():
-    _test_gradient("radial")
+    assert engine.term() is tvg.Result.SUCCESS
 
 
-def _test_picture_load(test_file: str, ref: str):
+def test_gradient_color_stops_buffer():
+    engine = tvg.Engine()
+    fill = tvg.LinearGradient(engine)
+
+    color_stops_list = [(0.0, 255, 0, 0, 100), (1.0, 255, 255, 0, 255)]
+    color_stops = (tvg.ColorStop * 2)(*color_stops_list)
+    assert fill.set_color_stops(color_stops) is tvg.Result.SUCCESS
+    _, color_stops_out = fill.get_color_stops()
+    assert [(j.offset, j.r, j.g, j.b, j.a) for j in color_stops_out] == color_stops_list
+
+    if NUMPY_LOADED:
+        color_stops_np = np.array(
+            color_stops_list[::-1],
+            dtype=[
+                ("offset", "<f4"),
+                ("r", "u1"),
+                ("g", "u1"),
+                ("b", "u1"),
+                ("a", "u1"),
+            ],
+        )
+        assert fill.set_color_stops(color_stops_np[::-1]) is tvg.Result.SUCCESS
+        assert fill.get_color_stops_numpy()[1].tolist() == color_stops_list
+        color_stops_np.flags.writeable = False
+        assert fill.set_color_stops(color_stops_np) is tvg.Result.SUCCESS
+        assert fill.get_color_stops_numpy()[1].tolist() == color_stops_list[::-1]
+
+    with pytest.raises(ValueError):
+        fill.set_color_stops(bytes(8))
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.parametrize(
+    "test_file,ref",
+    [
+        pytest.param("test.svg", "test_picture_svg_ref.png", id="svg"),
+        pytest.param("test.png", "test_picture_png_ref.png", id="png"),
+        pytest.param("test.webp", "test_picture_webp_ref.png", id="webp"),
+        pytest.param("test.jpg", "test_picture_jpg_ref.png", id="jpg"),
+        pytest.param("test.json", "test_picture_lottie_ref.png", id="lottie"),
+    ],
+)
+def test_picture_load(test_file: str, ref: str):
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(256, 256)
 
     picture = tvg.Picture(engine)
-    assert picture.load(os.path.join(file_dir, test_file)) == tvg.Result.SUCCESS
-    assert picture.set_size(256, 256) == tvg.Result.SUCCESS
-    assert picture.translate(0, 0) == tvg.Result.SUCCESS
-    assert canvas.add(picture) == tvg.Result.SUCCESS
+    assert picture.load(os.path.join(file_dir, test_file)) is tvg.Result.SUCCESS
+    assert picture.set_size(256, 256) is tvg.Result.SUCCESS
+    assert picture.translate(0, 0) is tvg.Result.SUCCESS
+    assert canvas.add(picture) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, ref) is True
+        assert check_im_same(canvas, ref) is True
 
     assert picture.get_size() == (tvg.Result.SUCCESS, 256, 256)
     assert isinstance(picture.get_paint(0), tvg.Paint)
+    assert picture.get_paint(0) is picture.get_paint(0)
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
-
-
-def test_picture_load_svg():
-    _test_picture_load("test.svg", "test_picture_svg_ref.png")
-
-
-def test_picture_load_png():
-    _test_picture_load("test.png", "test_picture_png_ref.png")
-
-
-def test_picture_load_webp():
-    _test_picture_load("test.webp", "test_picture_webp_ref.png")
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
-def test_picture_load_jpg():
-    _test_picture_load("test.jpg", "test_picture_jpg_ref.png")
+@functools.lru_cache(maxsize=None)
+def _load_raw(test_file: str) -> Tuple[bytes, int, int]:
+    # Decoded once per session; the bytes are immutable, so borrowing them
+    # with copy=False is safe for as long as the cache holds them
+    with Image.open(os.path.join(file_dir, test_file)) as src_im:
+        return src_im.tobytes(), src_im.width, src_im.height
 
 
-def test_picture_load_lottie():
-    _test_picture_load("test.json", "test_picture_lottie_ref.png")
-
-
-def _test_picture_load_raw(test_file: str, ref: str, copy: bool):
-    from PIL import Image
+@pytest.mark.skipif(PILLOW_LOADED is False, reason="Pillow not installed")
+@pytest.mark.parametrize(
+    "copy,as_bytearray",
+    [
+        pytest.param(True, False, id="copy_true"),
+        pytest.param(
+            False,
+            False,
+            id="copy_false",
+            marks=pytest.mark.skipif(
+                platform.system() == "Windows", reason="Known failure if on Windows"
+            ),
+        ),
+        pytest.param(False, True, id="bytearray"),
+    ],
+)
+def test_picture_load_raw(copy: bool, as_bytearray: bool):
+    test_file = "test.png"
+    ref = "test_picture_png_ref.png"
 
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(512, 256)
 
-    with Image.open(os.path.join(file_dir, test_file)) as im:
-        im_h = im.height
-        im_w = im.width
-        im_bytes = im.tobytes()  # type: ignore
+    im_bytes: Union[bytes, bytearray]
+    im_bytes, im_w, im_h = _load_raw(test_file)
+    if as_bytearray:
+        im_bytes = bytearray(im_bytes)
 
     picture = tvg.Picture(engine)
     assert (
         picture.load_raw(im_bytes, im_w, im_h, tvg.Colorspace.ABGR8888, copy)
-        == tvg.Result.SUCCESS
+        is tvg.Result.SUCCESS
     )
-    assert picture.set_size(256, 256) == tvg.Result.SUCCESS
-    assert picture.translate(0, 0) == tvg.Result.SUCCESS
-    assert canvas.add(picture) == tvg.Result.SUCCESS
+    assert picture.set_size(256, 256) is tvg.Result.SUCCESS
+    assert picture.translate(0, 0) is tvg.Result.SUCCESS
+    assert canvas.add(picture) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, ref) is True
+        assert check_im_same(canvas, ref) is True
 
     assert picture.get_size() == (tvg.Result.SUCCESS, 256, 256)
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
-
-
-@pytest.mark.skipif(PILLOW_LOADED is False, reason="Pillow not installed")
-def test_picture_load_raw_copy_true():
-    _test_picture_load_raw("test.png", "test_picture_png_ref.png", True)
-
-
-@pytest.mark.skipif(PILLOW_LOADED is False, reason="Pillow not installed")
-@pytest.mark.skipif(
-    platform.system() == "Windows", reason="Known failure if on Windows"
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.parametrize(
+    "test_file,ref,mimetype,copy,rpath",
+    [
+        pytest.param(
+            "test.svg", "test_picture_svg_ref.png", "svg", True, None, id="svg"
+        ),
+        pytest.param(
+            "test.png", "test_picture_png_ref.png", "png", True, None, id="png"
+        ),
+        pytest.param(
+            "test.webp", "test_picture_webp_ref.png", "webp", True, None, id="webp"
+        ),
+        pytest.param(
+            "test.jpg", "test_picture_jpg_ref.png", "jpg", True, None, id="jpg"
+        ),
+        pytest.param(
+            "test.jpg", "test_picture_jpg_ref.png", "jpeg", True, None, id="jpeg"
+        ),
+        pytest.param(
+            "test.svg",
+            "test_picture_svg_ref.png",
+            "svg",
+            True,
+            file_dir,
+            id="svg_rpath",
+        ),
+        pytest.param(
+            "test.svg", "test_picture_svg_ref.png", "", True, None, id="svg_no_mimetype"
+        ),
+        pytest.param(
+            "test.png", "test_picture_png_ref.png", "", True, None, id="png_no_mimetype"
+        ),
+        pytest.param(
+            "test.webp",
+            "test_picture_webp_ref.png",
+            "",
+            True,
+            None,
+            id="webp_no_mimetype",
+        ),
+        pytest.param(
+            "test.jpg", "test_picture_jpg_ref.png", "", True, None, id="jpg_no_mimetype"
+        ),
+        pytest.param(
+            "test.svg",
+            "test_picture_svg_ref.png",
+            "invalid_mimetype",
+            True,
+            None,
+            id="svg_invalid_mimetype",
+        ),
+        pytest.param(
+            "test.png",
+            "test_picture_png_ref.png",
+            "invalid_mimetype",
+            True,
+            None,
+            id="png_invalid_mimetype",
+        ),
+        pytest.param(
+            "test.webp",
+            "test_picture_webp_ref.png",
+            "invalid_mimetype",
+            True,
+            None,
+            id="webp_invalid_mimetype",
+        ),
+        pytest.param(
+            "test.jpg",
+            "test_picture_jpg_ref.png",
+            "invalid_mimetype",
+            True,
+            None,
+            id="jpg_invalid_mimetype",
+        ),
+        pytest.param(
+            "test.png", "test_picture_png_ref.png", "png", False, None, id="copy_false"
+        ),
+    ],
 )
-def test_picture_load_raw_copy_false():
-    _test_picture_load_raw("test.png", "test_picture_png_ref.png", False)
-
-
-def _test_picture_load_data(test_file: str, ref: str, mimetype: str, copy: bool):
+def test_picture_load_data(
+    test_file: str, ref: str, mimetype: str, copy: bool, rpath: Optional[str]
+):
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(512, 256)
 
     with open(os.path.join(file_dir, test_file), "rb") as f:
-        data = f.read()
+        # A private writable mapping lets load_data() share the file pages
+        # instead of copying a read-only buffer
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
 
     picture = tvg.Picture(engine)
-    assert picture.load_data(data, mimetype, None, copy) == tvg.Result.SUCCESS
-    if copy is False:
-        del data
-    assert picture.set_size(256, 256) == tvg.Result.SUCCESS
-    assert picture.translate(0, 0) == tvg.Result.SUCCESS
-    assert canvas.add(picture) == tvg.Result.SUCCESS
+    assert (
+        picture.load_data(memoryview(data), mimetype, rpath, copy) is tvg.Result.SUCCESS
+    )
+    if copy is True:
+        data.close()
+    assert picture.set_size(256, 256) is tvg.Result.SUCCESS
+    assert picture.translate(0, 0) is tvg.Result.SUCCESS
+    assert canvas.add(picture) is tvg.Result.SUCCESS
 
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, ref) is True
+        assert check_im_same(canvas, ref) is True
 
     assert picture.get_size() == (tvg.Result.SUCCESS, 256, 256)
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
-
-
-def test_picture_load_data_svg():
-    _test_picture_load_data("test.svg", "test_picture_svg_ref.png", "svg", True)
-
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    # Without copy the picture borrows the mapping until it is gone
+    del picture
+    data.close()
+    assert engine.term() is tvg.Result.SUCCESS
 
-def test_picture_load_data_png():
-    _test_picture_load_data("test.png", "test_picture_png_ref.png", "png", True)
-
-
-def test_picture_load_data_webp():
-    _test_picture_load_data("test.webp", "test_picture_webp_ref.png", "webp", True)
-
-
-def test_picture_load_data_jpg():
-    _test_picture_load_data("test.jpg", "test_picture_jpg_ref.png", "jpg", True)
 
+def test_picture_load_async():
+    engine = tvg.Engine()
 
-def test_picture_load_data_jpeg():
-    _test_picture_load_data("test.jpg", "test_picture_jpg_ref.png", "jpeg", True)
+    pictures = [tvg.Picture(engine) for _ in range(4)]
+    futures = [
+        picture.load_async(os.path.join(file_dir, "test.svg")) for picture in pictures
+    ]
+    for picture, future in zip(pictures, futures):
+        assert future.result() is tvg.Result.SUCCESS
+        assert picture.set_size(256, 256) is tvg.Result.SUCCESS
+        assert picture.get_size() == (tvg.Result.SUCCESS, 256, 256)
 
+    assert engine.term() is tvg.Result.SUCCESS
 
-def test_picture_load_data_svg_no_mimetype():
-    _test_picture_load_data("test.svg", "test_picture_svg_ref.png", "", True)
 
+def test_picture_origin():
+    engine = tvg.Engine()
 
-def test_picture_load_data_png_no_mimetype():
-    _test_picture_load_data("test.png", "test_picture_png_ref.png", "", True)
+    picture = tvg.Picture(engine)
+    assert picture.set_origin(0.5, 0.25) is tvg.Result.SUCCESS
+    assert picture.get_origin() == (tvg.Result.SUCCESS, 0.5, 0.25)
 
+    assert engine.term() is tvg.Result.SUCCESS
 
-def test_picture_load_data_webp_no_mimetype():
-    _test_picture_load_data("test.webp", "test_picture_webp_ref.png", "", True)
 
+def test_picture_set_asset_resolver(tmp_path: Path):
+    engine = tvg.Engine()
+    canvas = tvg.SwCanvas(engine)
+    assert canvas.set_target(16, 16, 16, tvg.Colorspace.ARGB8888) is tvg.Result.SUCCESS
+
+    # A Lottie image layer whose asset is resolved when the picture is drawn
+    lottie_path = tmp_path / "asset.json"
+    lottie_path.write_text(
+        '{"v":"5.7.0","fr":30,"ip":0,"op":30,"w":16,"h":16,'
+        '"assets":[{"id":"img","w":16,"h":16,"u":"","p":"missing.png","e":0}],'
+        '"layers":[{"ty":2,"refId":"img","ind":1,"ip":0,"op":30,"st":0,"ks":{}}]}'
+    )
 
-def test_picture_load_data_jpg_no_mimetype():
-    _test_picture_load_data("test.jpg", "test_picture_jpg_ref.png", "", True)
+    calls: List[Tuple[bytes, bytes]] = []
 
+    def resolver(
+        paint: tvg.base.PaintPointer, src: ctypes.c_char_p, data: ctypes.c_void_p
+    ) -> bool:
+        # ctypes passes the path as bytes and the data as an address
+        calls.append((ctypes.string_at(src), ctypes.string_at(data, 4)))
+        return False
 
-def test_picture_load_data_svg_invalid_mimetype():
-    _test_picture_load_data(
-        "test.svg", "test_picture_svg_ref.png", "invalid_mimetype", True
+    picture1 = tvg.Picture(engine)
+    picture2 = tvg.Picture(engine)
+    assert picture1.set_asset_resolver(resolver, b"data") is tvg.Result.SUCCESS
+    assert (
+        picture2.set_asset_resolver(resolver, bytearray(b"data")) is tvg.Result.SUCCESS
     )
+    # The pictures keep the callback alive for ThorVG
+    del resolver
+    gc.collect()
 
+    for picture in (picture1, picture2):
+        assert picture.load(str(lottie_path)) is tvg.Result.SUCCESS
+        assert canvas.add(picture) is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
+    assert len(calls) == 2
+    for src, data in calls:
+        assert src.endswith(b"missing.png")
+        assert data == b"data"
 
-def test_picture_load_data_png_invalid_mimetype():
-    _test_picture_load_data(
-        "test.png", "test_picture_png_ref.png", "invalid_mimetype", True
-    )
+    assert tvg.Picture(engine).set_asset_resolver(None, b"") is tvg.Result.SUCCESS
 
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
-def test_picture_load_data_webp_invalid_mimetype():
-    _test_picture_load_data(
-        "test.webp", "test_picture_webp_ref.png", "invalid_mimetype", True
-    )
 
+def test_scene():
+    engine = tvg.Engine()
+    canvas = tvg.SwCanvas(engine)
+    canvas.set_target(512, 256, 512)
 
-def test_picture_load_data_jpg_invalid_mimetype():
-    _test_picture_load_data(
-        "test.jpg", "test_picture_jpg_ref.png", "invalid_mimetype", True
-    )
+    scene = tvg.Scene(engine)
+    rect = tvg.Shape(engine)
+    assert rect.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert scene.add(rect) is tvg.Result.SUCCESS
 
+    assert canvas.add(scene) is tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
-def test_picture_load_data_copy_false():
-    _test_picture_load_data("test.png", "test_picture_png_ref.png", "png", False)
+    if PILLOW_LOADED:
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
 
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
-def test_scene():
+
+def test_scene_add_many():
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(512, 256, 512)
 
     scene = tvg.Scene(engine)
-    rect = tvg.Shape(engine)
-    assert rect.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert scene.add(rect) == tvg.Result.SUCCESS
+    rect1 = tvg.Shape(engine)
+    assert rect1.append_rect(0, 0, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect1.set_fill_color(128, 32, 64, 0) is tvg.Result.SUCCESS
+    rect2 = tvg.Shape(engine)
+    assert rect2.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect2.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert scene.add_many([rect1, rect2]) is tvg.Result.SUCCESS
+    assert scene.add_many([]) is tvg.Result.SUCCESS
+    assert scene.remove(rect1) is tvg.Result.SUCCESS
 
-    assert canvas.add(scene) == tvg.Result.SUCCESS
-    assert canvas.update() == tvg.Result.SUCCESS
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.add(scene) is tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_canvas_ref.png") is True
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_scene_clear():
@@ -722,89 +1332,186 @@ def test_scene_clear():
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(512, 256, 512)
     scene = tvg.Scene(engine)
-    assert canvas.add(scene) == tvg.Result.SUCCESS
+    assert canvas.add(scene) is tvg.Result.SUCCESS
 
     rect1 = tvg.Shape(engine)
-    assert rect1.append_rect(0, 0, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect1.set_fill_color(128, 32, 64, 50) == tvg.Result.SUCCESS
-    assert scene.add(rect1) == tvg.Result.SUCCESS
-    assert scene.remove(None) == tvg.Result.SUCCESS
+    assert rect1.append_rect(0, 0, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect1.set_fill_color(128, 32, 64, 50) is tvg.Result.SUCCESS
+    assert scene.add(rect1) is tvg.Result.SUCCESS
+    assert scene.clear() is tvg.Result.SUCCESS
 
     rect2 = tvg.Shape(engine)
-    assert rect2.append_rect(10, 10, 64, 64, 10, 10, True) == tvg.Result.SUCCESS
-    assert rect2.set_fill_color(32, 64, 128, 100) == tvg.Result.SUCCESS
-    assert scene.add(rect2) == tvg.Result.SUCCESS
+    assert rect2.append_rect(10, 10, 64, 64, 10, 10, True) is tvg.Result.SUCCESS
+    assert rect2.set_fill_color(32, 64, 128, 100) is tvg.Result.SUCCESS
+    assert scene.add(rect2) is tvg.Result.SUCCESS
 
-    assert canvas.update() == tvg.Result.SUCCESS
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, "test_canvas_ref.png") is True
+        assert check_im_same(canvas, "test_canvas_ref.png") is True
+
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
 
+def test_scene_add_effects():
+    engine = tvg.Engine()
+    scene = tvg.Scene(engine)
+
+    assert (
+        scene.add_effects(
+            [
+                (tvg.SceneEffect.GAUSSIAN_BLUR, (1.5, 0, 0, 75)),
+                (tvg.SceneEffect.DROP_SHADOW, (0, 0, 0, 128, 45, 5, 2, 75)),
+                (tvg.SceneEffect.FILL, (255, 0, 0, 255)),
+                (tvg.SceneEffect.TINT, (0, 0, 0, 255, 255, 255, 50)),
+                (tvg.SceneEffect.TRITONE, (0, 0, 0, 128, 128, 128, 255, 255, 255, 0)),
+            ]
+        )
+        is tvg.Result.SUCCESS
+    )
+    assert scene.add_effects([]) is tvg.Result.SUCCESS
+    assert scene.clear_effects() is tvg.Result.SUCCESS
 
-def _test_text(font: str, unicode: bool):
+    # A bad entry is rejected before any effect is added
+    canvas = tvg.SwCanvas(engine)
+    assert canvas.set_target(16, 16, 16) is tvg.Result.SUCCESS
+    rect = tvg.Shape(engine)
+    assert rect.append_rect(0, 0, 16, 16, 0, 0, True) is tvg.Result.SUCCESS
+    assert rect.set_fill_color(0, 0, 255, 255) is tvg.Result.SUCCESS
+    assert scene.add(rect) is tvg.Result.SUCCESS
+    assert canvas.add(scene) is tvg.Result.SUCCESS
+    red_fill = (tvg.SceneEffect.FILL, (255, 0, 0, 255))
+    with pytest.raises(TypeError):
+        scene.add_effects([red_fill, (tvg.SceneEffect.TINT, (1, 2))])
+    with pytest.raises(ValueError):
+        scene.add_effects([red_fill, (99, ())])
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
+    blue = canvas.buffer_arr[0]
+
+    assert scene.add_effects([red_fill]) is tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
+    assert canvas.buffer_arr[0] != blue
+
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+@pytest.mark.parametrize(
+    "font,unicode",
+    [
+        pytest.param("Arial.ttf", False, id="arial"),
+        pytest.param("NotoSansJP.ttf", True, id="notosans"),
+    ],
+)
+def test_text(font: str, unicode: bool):
     font_name = font.split(".")[0]
     engine = tvg.Engine()
     canvas = tvg.SwCanvas(engine)
     canvas.set_target(512, 256, 512)
 
     text1 = tvg.Text(engine)
-    assert text1.font_load(os.path.join("tests", font)) == tvg.Result.SUCCESS
-    assert text1.set_font(font_name) == tvg.Result.SUCCESS
-    assert text1.set_size(32) == tvg.Result.SUCCESS
+    assert text1.font_load(os.path.join("tests", font)) is tvg.Result.SUCCESS
+    assert text1.set_font(None) is tvg.Result.SUCCESS
+    assert text1.set_font("NoSuchFont") == tvg.Result.INSUFFICIENT_CONDITION
+    assert text1.set_font(font_name) is tvg.Result.SUCCESS
+    assert text1.set_size(32) is tvg.Result.SUCCESS
     assert (
         text1.set_text(f"Solid Text {'テスト' if unicode is True else ''}")
-        == tvg.Result.SUCCESS
+        is tvg.Result.SUCCESS
     )
-    assert text1.set_color(0, 0, 0) == tvg.Result.SUCCESS
-    assert text1.wrap_mode(tvg.TextWrap.ELLIPSIS) == tvg.Result.SUCCESS
-    assert text1.translate(10, 10) == tvg.Result.SUCCESS
-    assert canvas.add(text1) == tvg.Result.SUCCESS
+    assert text1.set_color(0, 0, 0) is tvg.Result.SUCCESS
+    assert text1.wrap_mode(tvg.TextWrap.ELLIPSIS) is tvg.Result.SUCCESS
+    assert text1.translate(10, 10) is tvg.Result.SUCCESS
+    assert canvas.add(text1) is tvg.Result.SUCCESS
 
     text2 = tvg.Text(engine)
-    assert text2.set_font(font_name) == tvg.Result.SUCCESS
-    assert text2.set_size(32) == tvg.Result.SUCCESS
+    assert text2.set_font(font_name) is tvg.Result.SUCCESS
+    assert text2.set_size(32) is tvg.Result.SUCCESS
     assert (
         text2.set_text(f"Gradient Text {'テスト' if unicode is True else ''}")
-        == tvg.Result.SUCCESS
+        is tvg.Result.SUCCESS
     )
-    assert text2.translate(10, 100) == tvg.Result.SUCCESS
+    assert text2.translate(10, 100) is tvg.Result.SUCCESS
 
     fill = tvg.LinearGradient(engine)
-    assert fill.set(0, 0, 512, 256) == tvg.Result.SUCCESS
+    assert fill.set(0, 0, 512, 256) is tvg.Result.SUCCESS
     colorstops = [
         tvg.ColorStop(0.0, 255, 0, 0, 100),
         tvg.ColorStop(1.0, 255, 255, 0, 255),
     ]
-    assert fill.set_color_stops(colorstops) == tvg.Result.SUCCESS
+    assert fill.set_color_stops(colorstops) is tvg.Result.SUCCESS
 
-    assert text2.set_gradient(fill) == tvg.Result.SUCCESS
-    assert canvas.add(text2) == tvg.Result.SUCCESS
+    assert text2.set_gradient(fill) is tvg.Result.SUCCESS
+    assert canvas.add(text2) is tvg.Result.SUCCESS
 
-    assert canvas.update() == tvg.Result.SUCCESS
-    assert canvas.draw(True) == tvg.Result.SUCCESS
-    assert canvas.sync() == tvg.Result.SUCCESS
+    assert canvas.update() is tvg.Result.SUCCESS
+    assert canvas.draw(True) is tvg.Result.SUCCESS
+    assert canvas.sync() is tvg.Result.SUCCESS
 
     if PILLOW_LOADED:
-        im = canvas.get_pillow()
-        assert check_im_same(im, f"test_text_{font_name}_ref.png") is True
+        assert check_im_same(canvas, f"test_text_{font_name}_ref.png") is True
+
+    assert text1.get_text() == f"Solid Text {'テスト' if unicode is True else ''}"
+    assert text1.line_count() == 1
+    assert text1.get_text_metrics()[0] is tvg.Result.SUCCESS
+    result, glyph = text1.get_glyph_metrics("S")
+    assert result is tvg.Result.SUCCESS
+    assert glyph.advance > 0
 
-    assert text1.font_unload(os.path.join("tests", font)) == tvg.Result.SUCCESS
-    assert canvas.destroy() == tvg.Result.SUCCESS
-    assert engine.term() == tvg.Result.SUCCESS
+    for label in ("1", "1", "テスト", "1"):
+        assert text1.set_text(label) is tvg.Result.SUCCESS
+        assert text1.get_text() == label
 
+    assert text1.font_unload(os.path.join("tests", font)) is tvg.Result.SUCCESS
+    assert canvas.destroy() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
 
-def test_text_arial():
-    _test_text("Arial.ttf", False)
 
+def test_text_font_load_data():
+    engine = tvg.Engine()
+
+    with open(os.path.join(file_dir, "Arial.ttf"), "rb") as f:
+        data = f.read()
+
+    text = tvg.Text(engine)
+    assert text.font_load_data("ArialData", data, "ttf", True) is tvg.Result.SUCCESS
+    assert text.set_font("ArialData") is tvg.Result.SUCCESS
+    assert text.font_load_data("ArialData", None, None, False) is tvg.Result.SUCCESS
 
-def test_text_notosans():
-    _test_text("NotoSansJP.ttf", True)
+    for buf in (bytearray(data), memoryview(data)):
+        assert text.font_load_data("ArialBuf", buf, "ttf", False) is tvg.Result.SUCCESS
+        assert text.set_font("ArialBuf") is tvg.Result.SUCCESS
+        assert text.set_text("Hello") is tvg.Result.SUCCESS
+        assert text.font_load_data("ArialBuf", None, None, False) is tvg.Result.SUCCESS
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_text_font_load_async():
+    engine = tvg.Engine()
+
+    text = tvg.Text(engine)
+    futures = [
+        text.font_load_async(os.path.join(file_dir, font))
+        for font in ("Arial.ttf", "NotoSansJP.ttf")
+    ]
+    for future in futures:
+        assert future.result() is tvg.Result.SUCCESS
+    assert text.set_font("Arial") is tvg.Result.SUCCESS
+
+    # Loading again after an unload must reach ThorVG, not a cache
+    path = os.path.join(file_dir, "NotoSansJP.ttf")
+    assert text.font_unload(path) is tvg.Result.SUCCESS
+    assert text.font_load(path) is tvg.Result.SUCCESS
+    assert text.font_unload(path) is tvg.Result.SUCCESS
+
+    assert engine.term() is tvg.Result.SUCCESS
 
 
 def test_animation():
@@ -813,18 +1520,145 @@ def test_animation():
     animation = tvg.LottieAnimation(engine)
     picture = animation.get_picture()
     assert isinstance(picture, tvg.Picture)
-    assert picture.load(os.path.join(file_dir, "test.json")) == tvg.Result.SUCCESS
+    assert picture.load(os.path.join(file_dir, "test.json")) is tvg.Result.SUCCESS
     assert animation.get_total_frame() == (tvg.Result.SUCCESS, 50)
-    assert picture.set_size(512, 512) == tvg.Result.SUCCESS
+    assert picture.set_size(512, 512) is tvg.Result.SUCCESS
 
-    assert animation.set_frame(5) == tvg.Result.SUCCESS
-    assert animation.set_segment(0, 25) == tvg.Result.SUCCESS
+    assert animation.set_frame(5) is tvg.Result.SUCCESS
+    assert animation.set_segment(0, 25) is tvg.Result.SUCCESS
 
     result, duration = animation.get_duration()
-    assert result == tvg.Result.SUCCESS
+    assert result is tvg.Result.SUCCESS
     assert duration == 1
     assert animation.get_frame() == (tvg.Result.SUCCESS, 5)
     assert animation.get_segment() == (tvg.Result.SUCCESS, 0, 25)
     assert animation.get_total_frame() == (tvg.Result.SUCCESS, 25)
     assert animation.get_markers_cnt() == (tvg.Result.SUCCESS, 0)
-    assert engine.term() == tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_accessor():
+    engine = tvg.Engine()
+    scene = tvg.Scene(engine)
+    assert scene.add(tvg.Shape(engine)) is tvg.Result.SUCCESS
+    assert scene.add(tvg.Shape(engine)) is tvg.Result.SUCCESS
+
+    visited: List[int] = []
+
+    def func(paint: ctypes.c_void_p, data: int) -> bool:
+        visited.append(data)
+        return True
+
+    accessor = tvg.Accessor(engine, None)
+    assert accessor.set(scene, func, b"data") is tvg.Result.SUCCESS  # type: ignore
+    assert len(visited) == 3
+    assert len(set(visited)) == 1
+    assert accessor.accessor_generate_id("a") == accessor.accessor_generate_id("a")
+    assert accessor.accessor_generate_id("a") != accessor.accessor_generate_id("b")
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_saver_save_animation(tmp_path: Path):
+    engine = tvg.Engine()
+    saver = tvg.Saver(engine)
+
+    path = str(tmp_path / "test.gif")
+
+    def save_gif(save_path: Union[str, bytes, Path]) -> None:
+        # The saver takes over the animation, so each save needs a new one
+        animation = tvg.LottieAnimation(engine)
+        picture = animation.get_picture()
+        assert picture is not None
+        assert picture.load(os.path.join(file_dir, "test.json")) is tvg.Result.SUCCESS
+        assert picture.set_size(32, 32) is tvg.Result.SUCCESS
+        assert saver.save_animation(animation, save_path, 100, 0) is tvg.Result.SUCCESS
+        assert saver.sync() is tvg.Result.SUCCESS
+        assert os.path.getsize(path) > 0
+        os.remove(path)
+
+    # Repeated saves to the same path
+    for save_path in (path, Path(path), path):
+        save_gif(save_path)
+
+    # Saving an animation must leave the save_paint signature alone
+    lib = engine.thorvg_lib
+    assert lib.tvg_saver_save_paint.argtypes[1] is tvg.base.PaintPointer
+    assert lib.tvg_saver_save_animation.argtypes[1] is tvg.base.AnimationPointer
+    shape = tvg.Shape(engine)
+    assert shape.append_rect(0, 0, 16, 16, 0, 0, True) is tvg.Result.SUCCESS
+    assert saver.save_paint(shape, path, 100) == tvg.Result.UNKNOWN
+
+    # More paths than the saver caches, then the evicted path again and as bytes
+    for i in range(tvg.Saver.PATH_CACHE_SIZE + 1):
+        # The saver takes over the paint even when saving fails
+        other_path = str(tmp_path / f"{i}.unknown")
+        result = saver.save_paint(tvg.Shape(engine), other_path, 100)
+        assert result == tvg.Result.NOT_SUPPORTED
+    save_gif(path)
+    save_gif(os.fsencode(path))
+
+    assert saver._del() is tvg.Result.SUCCESS
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_saver_save_paints(tmp_path: Path):
+    engine = tvg.Engine()
+    saver = tvg.Saver(engine)
+
+    shapes = [tvg.Shape(engine) for _ in range(3)]
+    for shape in shapes:
+        assert shape.append_rect(0, 0, 16, 16, 0, 0, True) is tvg.Result.SUCCESS
+    items = [(shape, str(tmp_path / f"{i}.unknown")) for i, shape in enumerate(shapes)]
+    assert saver.save_paints(items, 100) == [tvg.Result.NOT_SUPPORTED] * 3
+
+    futures = [
+        saver.save_paint_async(shape, str(tmp_path / f"{i}.async.unknown"), 100)
+        for i, shape in enumerate(tvg.Shape(engine) for _ in range(3))
+    ]
+    assert [future.result() for future in futures] == [tvg.Result.NOT_SUPPORTED] * 3
+
+    assert saver._del() is tvg.Result.SUCCESS
+    assert saver._del() == tvg.Result.INVALID_ARGUMENT
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_saver_context_manager():
+    engine = tvg.Engine()
+
+    with tvg.Saver(engine) as saver:
+        # Nothing to sync yet, but the saver exists
+        assert saver.sync() == tvg.Result.INSUFFICIENT_CONDITION
+    assert saver.sync() == tvg.Result.INVALID_ARGUMENT
+
+    # Dropping the last reference deletes the saver as well
+    saver = tvg.Saver(engine)
+    del saver
+    gc.collect()
+
+    assert engine.term() is tvg.Result.SUCCESS
+
+
+def test_saver_pool(tmp_path: Path):
+    engine = tvg.Engine()
+    pool = tvg.SaverPool(engine, max_size=1)
+
+    with pool.borrow() as saver:
+        shape = tvg.Shape(engine)
+        assert shape.append_rect(0, 0, 16, 16, 0, 0, True) is tvg.Result.SUCCESS
+        path = tmp_path / "test.unknown"
+        assert saver.save_paint(shape, path, 100) == tvg.Result.NOT_SUPPORTED
+    assert pool.acquire() is saver
+
+    other = pool.acquire()
+    assert other is not saver
+    pool.release(saver)
+    pool.release(other)
+    # Savers beyond max_size are deleted
+    assert other.sync() == tvg.Result.INVALID_ARGUMENT
+    assert pool.acquire() is saver
+    pool.release(saver)
+
+    pool.clear()
+    assert saver.sync() == tvg.Result.INVALID_ARGUMENT
+    assert pool.acquire() is not saver
+    assert engine.term() is tvg.Result.SUCCESS